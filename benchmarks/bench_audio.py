@@ -0,0 +1,58 @@
+import statistics
+import subprocess
+import sys
+from time import perf_counter
+
+from python_pomodoro.audio import SHORT_ALERT, AlertPlayer
+from python_pomodoro.helpers import get_sound_from_resources
+
+"""
+Benchmarks for alert sounds: the latency from an alert being requested to playback
+starting through the preloaded AlertPlayer worker, and the time the Tk thread spends
+queueing each alert, against a cold playsound call in a fresh interpreter, which is
+what the first alert of a session used to cost.
+Needs an audio backend (GStreamer, ffplay, ...).
+Run from the repository root: python -m benchmarks.bench_audio
+"""
+
+COLD_ALERT_SCRIPT = """
+import sys, time
+start = time.perf_counter()
+from playsound3 import playsound
+playsound(sys.argv[1], block=False).stop()
+print((time.perf_counter() - start) * 1000)
+"""
+
+
+def bench_cold_alert() -> dict[str, float]:
+    path = get_sound_from_resources(SHORT_ALERT)
+    result = subprocess.run([sys.executable, "-c", COLD_ALERT_SCRIPT, path], capture_output=True, text=True, check=True)
+    return {"cold_alert_ms": float(result.stdout.split()[-1])}
+
+
+def bench_alert_player(alerts: int = 20) -> dict[str, float]:
+    player = AlertPlayer()
+    player.start()
+    player.ready.wait()
+    if player.errors:
+        raise RuntimeError(f"no audio backend: {player.errors[-1]}")
+
+    queue_times = []
+    for _ in range(alerts):
+        start = perf_counter()
+        player.play(SHORT_ALERT, requested_at=start)
+        queue_times.append(perf_counter() - start)
+    player.close()
+
+    latencies = list(player.latencies)
+    return {
+        "queue_alert_ms": statistics.median(queue_times) * 1000,
+        "alert_latency_median_ms": statistics.median(latencies) * 1000,
+        "alert_latency_max_ms": max(latencies) * 1000,
+    }
+
+
+if __name__ == "__main__":
+    for bench in (bench_cold_alert, bench_alert_player):
+        for name, value in bench().items():
+            print(f"bench_audio: {name} = {value:.2f}")
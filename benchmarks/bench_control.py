@@ -0,0 +1,61 @@
+import os
+import statistics
+import tempfile
+import threading
+import time
+
+from python_pomodoro.app import App
+from python_pomodoro.control import AppControl, ControlServer, send_command
+
+"""
+Round-trip latency of the control socket of a running App: a client thread sends
+start, pause and state commands one at a time and times each from sending it until
+the answer arrives, which is after the command ran on the Tk thread and the window
+was redrawn. Needs a display.
+Run from the repository root: python -m benchmarks.bench_control
+"""
+
+COMMANDS = 300
+LATENCY_BUDGET_MS = 5.0
+
+
+def bench_control(commands: int = COMMANDS) -> dict[str, float]:
+    app = App()
+    latencies: list[float] = []
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "control.sock")
+        server = ControlServer(app, AppControl(app).handle, path)
+        server.start()
+
+        def client() -> None:
+            for n in range(commands):
+                started = time.perf_counter()
+                send_command({"op": ("start", "pause", "state")[n % 3]}, path)
+                latencies.append(time.perf_counter() - started)
+
+        thread = threading.Thread(target=client)
+
+        def wait_for_client() -> None:
+            if thread.is_alive():
+                app.after(50, wait_for_client)
+            else:
+                app.quit()
+
+        thread.start()
+        app.after(50, wait_for_client)
+        app.mainloop()
+        server.close()
+    app.close()
+    percentiles = statistics.quantiles(latencies, n=100)
+    return {
+        "p50_ms": percentiles[49] * 1000,
+        "p99_ms": percentiles[98] * 1000,
+        "handle_ms": statistics.mean(server.handle_times) * 1000,
+    }
+
+
+if __name__ == "__main__":
+    results = bench_control()
+    for name, value in results.items():
+        print(f"bench_control: {name} = {value:.2f}")
+    assert results["p50_ms"] < LATENCY_BUDGET_MS, f"control round trip exceeded {LATENCY_BUDGET_MS} ms"
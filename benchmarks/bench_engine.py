@@ -0,0 +1,36 @@
+import timeit
+
+from python_pomodoro.engine import PomodoroEngine
+from python_pomodoro.scheduler import VirtualLoop
+
+"""
+Benchmarks for the headless PomodoroEngine, driven by a simulated clock so whole
+sessions complete instantly.
+Run from the repository root: python -m benchmarks.bench_engine
+"""
+
+
+def bench_transitions(number: int = 1_000_000) -> dict[str, float]:
+    engine = PomodoroEngine(clock=VirtualLoop().clock)
+    seconds = timeit.timeit(engine.advance, number=number)
+    return {"transitions_per_second": number / seconds}
+
+
+def bench_simulated_sessions(number: int = 200_000) -> dict[str, float]:
+    loop = VirtualLoop()  # only its clock, moved by hand
+    engine = PomodoroEngine(clock=loop.clock)
+
+    def run_session() -> None:
+        engine.start()
+        loop.now += (engine.current_time + 1) * engine.tick
+        engine.update(-1)
+        engine.advance()
+
+    seconds = timeit.timeit(run_session, number=number)
+    return {"sessions_per_second": number / seconds}
+
+
+if __name__ == "__main__":
+    for bench in (bench_transitions, bench_simulated_sessions):
+        for name, value in bench().items():
+            print(f"{bench.__name__}: {name} = {value:,.0f}")
@@ -0,0 +1,43 @@
+import os
+import tempfile
+from pathlib import Path
+from time import perf_counter
+
+from python_pomodoro.history import HISTORY_FILE, HISTORY_HEADER, RECORD, SessionHistory
+
+"""
+Benchmarks for the session history log with 25 years of a heavy user's sessions
+(20 sessions a day): file size, full decode, and an in-place scan of the mapped log.
+Run from the repository root: python -m benchmarks.bench_history
+"""
+
+SESSIONS = 20 * 365 * 25
+
+
+def bench_history(count: int = SESSIONS) -> dict[str, float]:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        history = SessionHistory(Path(tmp_dir) / HISTORY_FILE)
+        with open(history.path, "wb") as file:
+            file.write(HISTORY_HEADER)
+            # completed sessions rotating through focus, short break and long break
+            file.write(b"".join(RECORD.pack(1_600_000_000 + i * 1800, 1500, 1500, i % 3, 1) for i in range(count)))
+
+        start = perf_counter()
+        records = history.records()
+        decode_ms = (perf_counter() - start) * 1000
+        assert len(records) == count
+
+        start = perf_counter()
+        with history.buffer() as view:
+            focus_seconds = sum(actual for _, _, actual, flags, _ in RECORD.iter_unpack(view) if flags & 0x0F == 0)
+        scan_ms = (perf_counter() - start) * 1000
+        assert focus_seconds > 0
+
+        size = os.path.getsize(history.path)
+
+    return {"records": count, "file_kib": size / 1024, "decode_ms": decode_ms, "scan_ms": scan_ms}
+
+
+if __name__ == "__main__":
+    for name, value in bench_history().items():
+        print(f"bench_history: {name} = {value:,.2f}")
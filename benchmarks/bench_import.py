@@ -0,0 +1,53 @@
+import tempfile
+from pathlib import Path
+from time import perf_counter
+
+import customtkinter as ctk
+from python_pomodoro.tasklist import ImportReport, TaskList
+
+"""
+Benchmark for bulk task import: throughput of a 20,000 line import and the worst
+main-loop stall seen meanwhile by a 1 ms heartbeat callback. Needs a display.
+Run from the repository root: python -m benchmarks.bench_import
+"""
+
+IMPORT_LINES = 20_000
+
+
+def bench_import(lines: int = IMPORT_LINES) -> dict[str, float]:
+    root = ctk.CTk()
+    tasks = TaskList(root, root)
+    tasks.pack()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = Path(tmp_dir) / "tasks.txt"
+        path.write_text("\n".join(f"Imported task {i}" for i in range(lines)), encoding="utf-8")
+
+        reports: list[ImportReport] = []
+        gaps = [0.0]
+        last_beat = perf_counter()
+
+        def heartbeat() -> None:
+            nonlocal last_beat
+            now = perf_counter()
+            gaps.append(now - last_beat)
+            last_beat = now
+            root.after(1, heartbeat)
+
+        root.after(1, heartbeat)
+        tasks.import_tasks(path, on_done=reports.append)
+        while not reports:
+            root.update()
+
+    root.destroy()
+    report = reports[0]
+    return {
+        "tasks_per_second": report.tasks_per_second,
+        "worst_chunk_ms": report.worst_chunk_ms,
+        "worst_main_loop_stall_ms": max(gaps) * 1000,
+    }
+
+
+if __name__ == "__main__":
+    for name, value in bench_import().items():
+        print(f"bench_import: {name} = {value:,.2f}")
@@ -0,0 +1,36 @@
+import timeit
+
+from python_pomodoro.instrument import Instruments
+
+"""
+Micro-benchmark of the cost of instrumentation on a callback: the time per call of a
+trivial method unwrapped, as it runs when POMODORO_INSTRUMENT is not set, and wrapped
+with the timing wrapper recording into a histogram.
+Run from the repository root: python -m benchmarks.bench_instrument
+"""
+
+
+class Callback:
+    def run(self) -> None:
+        pass
+
+
+def bench_instrument(number: int = 1_000_000) -> dict[str, float]:
+    callback = Callback()
+    unwrapped = timeit.timeit(callback.run, number=number) / number
+    instruments = Instruments()
+    instruments.wrap(Callback, "run")
+    try:
+        wrapped = timeit.timeit(callback.run, number=number) / number
+    finally:
+        instruments.unwrap_all()
+    return {
+        "unwrapped_ns": unwrapped * 1e9,
+        "wrapped_ns": wrapped * 1e9,
+        "overhead_ns": (wrapped - unwrapped) * 1e9,
+    }
+
+
+if __name__ == "__main__":
+    for name, value in bench_instrument().items():
+        print(f"bench_instrument: {name} = {value:.1f}")
@@ -0,0 +1,71 @@
+from python_pomodoro.render import Renderer
+
+"""
+Benchmark of the Tk calls made by the timer view over a 25 minute focus session,
+with one pause and resume every 5 minutes: pushing every value on every tick and
+state change, as the view used to, against the diff-based Renderer.
+Run from the repository root: python -m benchmarks.bench_render
+"""
+
+SESSION_TICKS = 25 * 60
+PAUSE_EVERY = 5 * 60
+
+
+class IdleScheduler:
+    def __init__(self) -> None:
+        self.idle: list = []
+
+    def after_idle(self, func) -> str:
+        self.idle.append(func)
+        return "idle"
+
+    def run_idle(self) -> None:
+        idle, self.idle = self.idle, []
+        for func in idle:
+            func()
+
+
+def view_updates(count: int, paused: bool) -> list[tuple[str, object]]:
+    mins, secs = divmod(count, 60)
+    title = "Focus Time - Paused" if paused else f"Pomodoro - Focus Time - {mins:02}:{secs:02}"
+    foreground = "#ec9291" if paused else "#ffc9c9"
+    return [
+        ("minutes", f"{mins:02}"),
+        ("seconds", f"{secs:02}"),
+        ("title", title),
+        ("background_image", (paused, foreground)),
+        ("timer_text_style", "FOCUS_PAUSED.TimerText.TLabel" if paused else "FOCUS.TimerText.TLabel"),
+    ]
+
+
+def bench_render(ticks: int = SESSION_TICKS) -> dict[str, float]:
+    scheduler = IdleScheduler()
+    render = Renderer(scheduler)
+    eager_calls = 0
+
+    def tick(count: int, paused: bool, state_change: bool) -> None:
+        nonlocal eager_calls
+        updates = view_updates(count, paused)
+        # ticks used to set the labels and title, state changes the image and both styles
+        eager_calls += 3 if not state_change else 4
+        for target, value in updates if state_change else updates[:3]:
+            render.set(target, value, lambda value: None)
+        render.flush_idle()
+        scheduler.run_idle()
+
+    for count in range(ticks, -1, -1):
+        tick(count, False, count == ticks)
+        if count and count % PAUSE_EVERY == 0:
+            tick(count, True, True)
+            tick(count, False, True)
+
+    return {
+        "eager_calls_per_tick": eager_calls / ticks,
+        "diff_calls_per_tick": render.tk_calls / ticks,
+        "saved_calls_pct": 100 * render.saved_calls / render.requested,
+    }
+
+
+if __name__ == "__main__":
+    for name, value in bench_render().items():
+        print(f"bench_render: {name} = {value:.2f}")
@@ -0,0 +1,80 @@
+import time
+
+from python_pomodoro.engine import PomodoroEngine, SessionStatus
+from python_pomodoro.scheduler import TickScheduler, VirtualLoop
+
+"""
+Benchmark of running many timers in one window: 1, 10 and 100 engines counting down
+a session on a simulated event loop, each keeping its own chain of `after` calls
+against all of them sharing one TickScheduler. Reports the `after` calls issued,
+the event loop wakeups and the CPU time per simulated second.
+Run from the repository root: python -m benchmarks.bench_scheduler
+"""
+
+SESSION_MINUTES = 5
+TIMER_COUNTS = (1, 10, 100)
+
+
+class CountingLoop(VirtualLoop):
+    def __init__(self) -> None:
+        super().__init__()
+        self.wakeups = 0
+
+    def wakeup_time(self, due: float, n: int) -> float:
+        self.wakeups += 1
+        return due
+
+
+def start_engines(loop: VirtualLoop, timers: int) -> list[PomodoroEngine]:
+    durations = {status: SESSION_MINUTES * 60 for status in SessionStatus}
+    engines = []
+    for n in range(timers):
+        loop.now = n / timers  # started at different moments
+        engine = PomodoroEngine(durations=durations, clock=loop.clock)
+        engine.start()
+        engines.append(engine)
+    return engines
+
+
+def run_chained(loop: VirtualLoop, timers: int) -> None:
+    # every timer keeps its own chain of after calls, as a lone TomatoTimer did
+    def countdown(engine: PomodoroEngine, count: int) -> None:
+        count = engine.update(count)
+        if count > -1:
+            loop.after(int(engine.delay_until(count - 1) * 1000), countdown, engine, count - 1)
+
+    for engine in start_engines(loop, timers):
+        countdown(engine, engine.current_time)
+
+
+def run_shared(loop: VirtualLoop, timers: int) -> None:
+    scheduler = TickScheduler(loop, clock=loop.clock)
+
+    def countdown(engine: PomodoroEngine, count: int) -> None:
+        count = engine.update(count)
+        if count > -1:
+            due = loop.clock() + engine.delay_until(count - 1)
+            scheduler.schedule(engine, due, lambda: countdown(engine, count - 1))
+
+    for engine in start_engines(loop, timers):
+        countdown(engine, engine.current_time)
+
+
+def bench_scheduler() -> dict[str, float]:
+    results: dict[str, float] = {}
+    for timers in TIMER_COUNTS:
+        for name, run in (("chained", run_chained), ("shared", run_shared)):
+            loop = CountingLoop()
+            start = time.process_time()
+            run(loop, timers)
+            loop.run()
+            cpu = time.process_time() - start
+            results[f"{name}_{timers}_after_calls"] = loop.calls
+            results[f"{name}_{timers}_wakeups"] = loop.wakeups
+            results[f"{name}_{timers}_cpu_us_per_second"] = cpu / loop.now * 1e6
+    return results
+
+
+if __name__ == "__main__":
+    for name, value in bench_scheduler().items():
+        print(f"bench_scheduler: {name} = {value:,.1f}")
@@ -0,0 +1,82 @@
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+"""
+Load test of the headless pomodoro service: starts the service in its own process with
+short ticks, connects local clients that each create and subscribe to their sessions,
+and measures the latency of the transition notifications, from the monotonic clock
+time each session was due to end until its event was read by the client.
+Every session is created with the shortest settings and auto-continue, so sessions
+end continuously for the length of the run.
+Run from the repository root: python -m benchmarks.bench_service
+"""
+
+CLIENTS = 50
+SESSIONS_PER_CLIENT = 40
+TICK = 0.001  # 5 minute focus sessions last 0.3 s
+DURATION = 5.0  # seconds of notifications measured
+SETTINGS = {"focus": 5, "short_break": 1, "long_break": 5, "cycles": 4}
+
+
+async def run_client(path: str, client: int, sessions: int, end: float, latencies: list[float]) -> None:
+    reader, writer = await asyncio.open_unix_connection(path)
+    for n in range(sessions):
+        name = f"client{client}-{n}"
+        for op in ("create", "subscribe", "start"):
+            request = {"op": op, "session": name, "settings": SETTINGS, "auto_continue": True}
+            writer.write(json.dumps(request).encode() + b"\n")
+    await writer.drain()
+    while (remaining := end - time.monotonic()) > 0:
+        try:
+            line = await asyncio.wait_for(reader.readline(), remaining)
+        except TimeoutError:
+            break
+        message = json.loads(line)
+        if message.get("event") == "transition":
+            latencies.append(time.monotonic() - message["due"])
+    writer.close()
+
+
+async def load_test(path: str, clients: int, sessions: int, duration: float) -> list[float]:
+    latencies: list[float] = []
+    end = time.monotonic() + duration
+    await asyncio.gather(*(run_client(path, client, sessions, end, latencies) for client in range(clients)))
+    return latencies
+
+
+def bench_service(
+    clients: int = CLIENTS, sessions: int = SESSIONS_PER_CLIENT, duration: float = DURATION
+) -> dict[str, float]:
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "service.sock")
+        server = subprocess.Popen(
+            [sys.executable, "-m", "python_pomodoro.service", "--socket", path, "--tick", str(TICK)],
+            stdout=subprocess.PIPE,
+            text=True,
+        )
+        try:
+            assert server.stdout is not None
+            server.stdout.readline()  # listening
+            latencies = asyncio.run(load_test(path, clients, sessions, duration))
+        finally:
+            server.terminate()
+            server.wait()
+    percentiles = statistics.quantiles(latencies, n=100)
+    return {
+        "sessions": clients * sessions,
+        "notifications": len(latencies),
+        "p50_ms": percentiles[49] * 1000,
+        "p99_ms": percentiles[98] * 1000,
+        "max_ms": max(latencies) * 1000,
+    }
+
+
+if __name__ == "__main__":
+    for name, value in bench_service().items():
+        print(f"bench_service: {name} = {value:,.2f}")
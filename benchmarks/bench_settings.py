@@ -0,0 +1,54 @@
+from time import perf_counter
+
+from python_pomodoro.app import App
+
+"""
+Benchmarks for the settings panel of the App: the first open, which builds the panel,
+later opens of the built panel, closing it without saving and saving the settings,
+each timed until the window has been redrawn. Needs a display.
+Run from the repository root: python -m benchmarks.bench_settings
+"""
+
+OPENS = 100
+
+
+def bench_settings(opens: int = OPENS) -> dict[str, float]:
+    app = App()
+    app.update()
+
+    def open_settings() -> float:
+        start = perf_counter()
+        app.show_settings()
+        app.update_idletasks()
+        return perf_counter() - start
+
+    first_open = open_settings()
+    app.settings.close_settings()
+    app.update_idletasks()
+
+    opened = closed = 0.0
+    for _ in range(opens):
+        opened += open_settings()
+        start = perf_counter()
+        app.settings.close_settings()
+        app.update_idletasks()
+        closed += perf_counter() - start
+
+    open_settings()
+    start = perf_counter()
+    app.settings.update_settings()
+    app.update_idletasks()
+    saved = perf_counter() - start
+
+    app.close()
+    return {
+        "first_open_ms": first_open * 1000,
+        "open_ms": opened / opens * 1000,
+        "close_ms": closed / opens * 1000,
+        "save_ms": saved * 1000,
+    }
+
+
+if __name__ == "__main__":
+    for name, value in bench_settings().items():
+        print(f"bench_settings: {name} = {value:.2f}")
@@ -0,0 +1,65 @@
+import subprocess
+import sys
+
+"""
+Startup benchmarks, each measured in a fresh interpreter: the import time of
+python_pomodoro.app reported by -X importtime, and the time from starting the import
+to the first idle callback of the main loop, when the first frame has been drawn.
+Also lists which of the modules that should load on first use were imported at startup.
+Run from the repository root: python -m benchmarks.bench_startup
+"""
+
+IMPORT_BUDGET_MS = 400
+FIRST_IDLE_BUDGET_MS = 1500
+DEFERRED_MODULES = ("numpy", "playsound3", "python_pomodoro.stats", "python_pomodoro.stats_window")
+
+FIRST_IDLE_SCRIPT = """
+import time
+start = time.perf_counter()
+from python_pomodoro.app import App
+app = App()
+def first_idle():
+    print((time.perf_counter() - start) * 1000)
+    app.close()
+app.after_idle(first_idle)
+app.mainloop()
+"""
+
+
+def run_python(*args: str) -> subprocess.CompletedProcess:
+    return subprocess.run([sys.executable, *args], capture_output=True, text=True, check=True)
+
+
+def import_times(module: str = "python_pomodoro.app") -> dict[str, float]:
+    # cumulative import time in ms of every module imported by `module`
+    stderr = run_python("-X", "importtime", "-c", f"import {module}").stderr
+    times = {}
+    for line in stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            _, cumulative, module = line.split("|")
+            if cumulative.strip().isdigit():
+                times[module.strip()] = int(cumulative) / 1000
+    return times
+
+
+def bench_import() -> dict[str, float]:
+    times = import_times()
+    results = {"import_ms": times["python_pomodoro.app"]}
+    for module in DEFERRED_MODULES:
+        results[f"{module}_imported"] = float(module in times)
+    return results
+
+
+def bench_first_idle() -> dict[str, float]:
+    # needs a display, like the app itself
+    return {"first_idle_ms": float(run_python("-c", FIRST_IDLE_SCRIPT).stdout.split()[-1])}
+
+
+if __name__ == "__main__":
+    results = bench_import()
+    for name, value in results.items():
+        print(f"bench_startup: {name} = {value:.2f}")
+    assert results["import_ms"] < IMPORT_BUDGET_MS, f"importing the app exceeded {IMPORT_BUDGET_MS} ms"
+    results = bench_first_idle()
+    print(f"bench_startup: first_idle_ms = {results['first_idle_ms']:.2f}")
+    assert results["first_idle_ms"] < FIRST_IDLE_BUDGET_MS, f"first frame exceeded {FIRST_IDLE_BUDGET_MS} ms"
@@ -0,0 +1,63 @@
+import tempfile
+from pathlib import Path
+from time import perf_counter
+
+import numpy as np
+from python_pomodoro.engine import Outcome, SessionRecord, SessionStatus
+from python_pomodoro.history import HISTORY_FILE, HISTORY_HEADER, SessionHistory
+from python_pomodoro.stats import HISTORY_DTYPE, SessionStats
+
+"""
+Benchmarks for the statistics view over a synthetic history of 1,000,000 sessions:
+loading the log into columnar arrays, each aggregation, and an incremental append.
+Run from the repository root: python -m benchmarks.bench_stats
+"""
+
+SESSIONS = 1_000_000
+
+
+def synthetic_history(count: int) -> np.ndarray:
+    rng = np.random.default_rng(42)
+    records = np.empty(count, dtype=HISTORY_DTYPE)
+    records["start"] = 1_500_000_000 + np.arange(count, dtype=np.uint32) * 1800
+    records["planned"] = 1500
+    aborted = rng.random(count) < 0.1
+    records["actual"] = np.where(aborted, rng.integers(0, 1500, count), 1500)
+    records["flags"] = aborted.astype(np.uint8) << 4 | rng.integers(0, 3, count).astype(np.uint8)
+    records["cycle"] = rng.integers(1, 5, count)
+    return records
+
+
+def timed(function, repeat: int = 5) -> float:
+    start = perf_counter()
+    for _ in range(repeat):
+        function()
+    return (perf_counter() - start) * 1000 / repeat
+
+
+def bench_stats(count: int = SESSIONS) -> dict[str, float]:
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        history = SessionHistory(Path(tmp_dir) / HISTORY_FILE)
+        with open(history.path, "wb") as file:
+            file.write(HISTORY_HEADER)
+            file.write(synthetic_history(count).tobytes())
+
+        results["load_ms"] = timed(lambda: SessionStats.from_history(history, utc_offset=0))
+        stats = SessionStats.from_history(history, utc_offset=0)
+
+    today = stats.today()
+    results["per_day_ms"] = timed(stats.focus_minutes_per_day)
+    results["per_week_ms"] = timed(stats.focus_minutes_per_week)
+    results["completion_rate_ms"] = timed(stats.completion_rate_by_cycle)
+    results["streaks_ms"] = timed(lambda: stats.streaks(today))
+    results["interruptions_ms"] = timed(stats.interruption_histogram)
+
+    record = SessionRecord(1_800_000_000, 1500, 1500, Outcome.COMPLETED, SessionStatus.FOCUS, 1)
+    results["append_us"] = timed(lambda: stats.append(record), repeat=10_000) * 1000
+    return results
+
+
+if __name__ == "__main__":
+    for name, value in bench_stats().items():
+        print(f"bench_stats: {name} = {value:.2f}")
@@ -0,0 +1,66 @@
+import timeit
+
+import customtkinter as ctk
+from python_pomodoro.engine import SessionStatus
+from python_pomodoro.tomato_timer import TomatoTimer
+
+"""
+Micro-benchmark of status switching in the timer view: the latency of
+change_session_status and pause_timer, including the idle redraw, with the
+precompiled per-status styles against the old approach of reconfiguring the
+shared TimerText.TLabel style on every change.
+Needs a display.
+Run from the repository root: python -m benchmarks.bench_styles
+"""
+
+
+class SharedStyleTimer(TomatoTimer):
+    # the old behaviour: every label keeps TimerText.TLabel, whose colours are rewritten
+    def apply_timer_text_style(self, style: str) -> None:
+        self.timer_minutes.configure(style="TimerText.TLabel")
+        self.timer_seconds.configure(style="TimerText.TLabel")
+        self.styles.configure(
+            "TimerText.TLabel",
+            background=self.styles.lookup(style, "background"),
+            foreground=self.styles.lookup(style, "foreground"),
+        )
+
+
+def bench_timer(timer: TomatoTimer, number: int) -> dict[str, float]:
+    statuses = [status.value.title for status in SessionStatus]
+
+    def change_status() -> None:
+        for title in statuses:
+            timer.change_session_status(title)
+            timer.update_idletasks()
+
+    def pause_and_resume() -> None:
+        timer.pause_timer()
+        timer.update_idletasks()
+        timer.is_paused = False
+        timer.update_styles()
+        timer.render.flush()
+        timer.update_idletasks()
+
+    return {
+        "change_session_status_us": timeit.timeit(change_status, number=number) / (number * len(statuses)) * 1e6,
+        "pause_timer_us": timeit.timeit(pause_and_resume, number=number) / number * 1e6,
+    }
+
+
+def bench_styles(number: int = 500) -> dict[str, float]:
+    results = {}
+    for name, timer_class in (("shared_style", SharedStyleTimer), ("precompiled", TomatoTimer)):
+        root = ctk.CTk()
+        timer = timer_class(root, root)
+        timer.pack()
+        root.update()
+        for key, value in bench_timer(timer, number).items():
+            results[f"{name}_{key}"] = value
+        root.destroy()
+    return results
+
+
+if __name__ == "__main__":
+    for name, value in bench_styles().items():
+        print(f"bench_styles: {name} = {value:.1f}")
@@ -0,0 +1,100 @@
+import random
+import statistics
+from time import perf_counter
+from uuid import UUID, uuid4
+
+from python_pomodoro.tasklist import Task, TaskSearchIndex, TaskTitleIndex
+
+"""
+Benchmarks for the task filter at 50,000 tasks: the median and worst latency of the
+keystrokes typing a filter text, looked up in the gram index against a scan of every
+title, the time to build the index of every task, and the keystroke latency of the
+TaskList itself, from filter_tasks to the redrawn rows (that one needs a display).
+Run from the repository root: python -m benchmarks.bench_task_filter
+"""
+
+TASKS = 50_000
+TYPED = "review budget 12"
+WORDS = "write report review email call plan fix bug deploy meeting design test read paper update docs budget".split()
+
+
+def make_tasks(count: int) -> dict[UUID, Task]:
+    words = random.Random(1234)
+    tasks = {}
+    for i in range(count):
+        task = Task(id=uuid4(), title=f"{' '.join(words.choice(WORDS) for _ in range(3))} {i}")
+        tasks[task.id] = task
+    return tasks
+
+
+def bench_search_index(count: int = TASKS, typed: str = TYPED) -> dict[str, float]:
+    tasks = make_tasks(count)
+    start = perf_counter()
+    index = TaskSearchIndex()
+    index.rebuild(tasks)
+    build_ms = (perf_counter() - start) * 1000
+
+    def scan(text: str) -> list[UUID]:
+        # the same matches and order from a scan of every title
+        text = TaskTitleIndex.normalize(text)
+        matches = [(id, title) for id, task in tasks.items() if text in (title := task.title.casefold())]
+        prefixed = [id for id, title in matches if title.startswith(text)]
+        return prefixed + [id for id, title in matches if not title.startswith(text)]
+
+    indexed, scanned = [], []
+    for end in range(1, len(typed) + 1):
+        text = typed[:end]
+        start = perf_counter()
+        found = index.search(text)
+        indexed.append(perf_counter() - start)
+        start = perf_counter()
+        scanned_found = scan(text)
+        scanned.append(perf_counter() - start)
+        assert scanned_found == found
+    return {
+        "build_ms": build_ms,
+        "index_keystroke_ms": statistics.median(indexed) * 1000,
+        "index_keystroke_max_ms": max(indexed) * 1000,
+        "scan_keystroke_ms": statistics.median(scanned) * 1000,
+        "scan_keystroke_max_ms": max(scanned) * 1000,
+    }
+
+
+def bench_filter_keystrokes(count: int = TASKS, typed: str = TYPED) -> dict[str, float]:
+    import customtkinter as ctk
+    from python_pomodoro.tasklist import TaskList
+
+    root = ctk.CTk()
+    tasks = TaskList(root, root)
+    tasks.pack()
+    for task in make_tasks(count).values():
+        tasks.add_task(task)
+    tasks.render_tasks()
+    root.update()
+    rows = len(tasks.rows)
+
+    start = perf_counter()
+    tasks.filter_tasks(typed[0])
+    root.update_idletasks()
+    first_ms = (perf_counter() - start) * 1000
+
+    latencies = []
+    for end in range(2, len(typed) + 1):
+        start = perf_counter()
+        tasks.filter_tasks(typed[:end])
+        root.update_idletasks()
+        latencies.append(perf_counter() - start)
+    assert len(tasks.rows) == rows, "filtering created rows"
+    root.destroy()
+    return {
+        "first_keystroke_ms": first_ms,
+        "keystroke_ms": sum(latencies) / len(latencies) * 1000,
+        "keystroke_max_ms": max(latencies) * 1000,
+    }
+
+
+if __name__ == "__main__":
+    for name, value in bench_search_index().items():
+        print(f"bench_search_index: {name} = {value:.2f}")
+    for name, value in bench_filter_keystrokes().items():
+        print(f"bench_filter_keystrokes: {name} = {value:.2f}")
@@ -0,0 +1,47 @@
+import tempfile
+from pathlib import Path
+from time import perf_counter
+from uuid import uuid4
+
+from python_pomodoro.task_store import TASKS_DB_FILE, TaskStore
+
+"""
+Benchmarks for the SQLite task store: loading 50,000 saved tasks at startup,
+checked against a startup budget, and the cost of one committed toggle.
+Run from the repository root: python -m benchmarks.bench_task_store
+"""
+
+STORED_TASKS = 50_000
+STARTUP_BUDGET_MS = 250
+
+
+def bench_task_store(count: int = STORED_TASKS, toggles: int = 200) -> dict[str, float]:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = Path(tmp_dir) / TASKS_DB_FILE
+        store = TaskStore(path)
+        ids = [uuid4() for _ in range(count)]
+        for i, id in enumerate(ids):
+            store.add(id, f"Task {i}")
+        store.close()
+
+        start = perf_counter()
+        store = TaskStore(path)
+        tasks = {id: (title, is_complete) for id, title, is_complete in store.load()}
+        load_ms = (perf_counter() - start) * 1000
+        assert len(tasks) == count
+
+        start = perf_counter()
+        for id in ids[:toggles]:
+            store.set_complete(id, True)
+            store.commit()
+        toggle_ms = (perf_counter() - start) * 1000 / toggles
+        store.close()
+
+    return {"load_ms": load_ms, "toggle_commit_ms": toggle_ms}
+
+
+if __name__ == "__main__":
+    results = bench_task_store()
+    for name, value in results.items():
+        print(f"bench_task_store: {name} = {value:.2f}")
+    assert results["load_ms"] < STARTUP_BUDGET_MS, f"loading {STORED_TASKS} tasks exceeded {STARTUP_BUDGET_MS} ms"
@@ -0,0 +1,97 @@
+from time import perf_counter
+from uuid import uuid4
+
+import customtkinter as ctk
+from python_pomodoro.tasklist import Task, TaskList
+
+"""
+Benchmarks for the virtualized TaskList: time to render a freshly loaded list and
+the latency of a single scroll step, from 100 to 50,000 tasks, the time to save a new
+task typed in the entry with 10 to 100,000 tasks in the list, and the time to clear
+the completed half of a long list. Needs a display.
+Run from the repository root: python -m benchmarks.bench_tasklist
+"""
+
+TASK_COUNTS = (100, 1_000, 10_000, 50_000)
+SCROLL_STEPS = 200
+SAVE_COUNTS = (10, 1_000, 100_000)
+SAVES = 100
+CLEAR_COUNTS = (1_000, 10_000, 100_000)
+
+
+def bench_open_and_scroll(counts: tuple[int, ...] = TASK_COUNTS) -> dict[str, float]:
+    root = ctk.CTk()
+    results = {}
+    for count in counts:
+        tasks = TaskList(root, root)
+        tasks.pack()
+        for i in range(count):
+            tasks.add_task(Task(id=uuid4(), title=f"Task {i}"))
+
+        start = perf_counter()
+        tasks.render_tasks()
+        root.update_idletasks()
+        results[f"open_ms_{count}"] = (perf_counter() - start) * 1000
+
+        start = perf_counter()
+        for _ in range(SCROLL_STEPS):
+            tasks.scroll_tasks("scroll", 1, "units")
+            root.update_idletasks()
+        results[f"scroll_ms_{count}"] = (perf_counter() - start) * 1000 / SCROLL_STEPS
+
+        tasks.destroy()
+    root.destroy()
+    return results
+
+
+def fill_tasks(tasks: TaskList, count: int, completed: bool = False) -> None:
+    for i in range(count):
+        tasks.add_task(Task(id=uuid4(), title=f"Task {i}", is_complete=completed and i % 2 == 0))
+    tasks.render_tasks()
+
+
+def bench_save_new_task(counts: tuple[int, ...] = SAVE_COUNTS, saves: int = SAVES) -> dict[str, float]:
+    root = ctk.CTk()
+    results = {}
+    for count in counts:
+        tasks = TaskList(root, root)
+        tasks.pack()
+        fill_tasks(tasks, count)
+        root.update_idletasks()
+
+        start = perf_counter()
+        for i in range(saves):
+            tasks.show_task_entry_input()
+            tasks.entry_task_input.insert(0, f"New task {i}")
+            tasks.save_new_task()
+            root.update_idletasks()
+        results[f"save_ms_{count}"] = (perf_counter() - start) * 1000 / saves
+
+        tasks.destroy()
+    root.destroy()
+    return results
+
+
+def bench_clear_completed(counts: tuple[int, ...] = CLEAR_COUNTS) -> dict[str, float]:
+    root = ctk.CTk()
+    results = {}
+    for count in counts:
+        tasks = TaskList(root, root)
+        tasks.pack()
+        fill_tasks(tasks, count, completed=True)
+        root.update_idletasks()
+
+        start = perf_counter()
+        tasks.clear_completed_tasks()
+        root.update_idletasks()
+        results[f"clear_ms_{count}"] = (perf_counter() - start) * 1000
+
+        tasks.destroy()
+    root.destroy()
+    return results
+
+
+if __name__ == "__main__":
+    for bench in (bench_open_and_scroll, bench_save_new_task, bench_clear_completed):
+        for name, value in bench().items():
+            print(f"{bench.__name__}: {name} = {value:.2f}")
@@ -0,0 +1,51 @@
+from time import perf_counter
+
+import customtkinter as ctk
+from python_pomodoro.scheduler import VirtualLoop
+from python_pomodoro.tomato_timer import TomatoTimer
+
+"""
+Benchmarks for the timer view: the cost of one countdown tick, from _countdown to the
+redrawn labels, and of a session transition, from answering the end-of-session banner
+to the redrawn view of the next session. A simulated clock moves one second per tick,
+so the countdown never waits. Needs a display.
+Run from the repository root: python -m benchmarks.bench_timer
+"""
+
+TICKS = 1_000
+TRANSITIONS = 200
+
+
+def bench_timer(ticks: int = TICKS, transitions: int = TRANSITIONS) -> dict[str, float]:
+    root = ctk.CTk()
+    timer = TomatoTimer(root, root)
+    timer.pack()
+    loop = VirtualLoop()  # only its clock, moved by hand
+    timer.clock = loop.clock
+    root.update()
+
+    timer.set_session_minutes(timer.status, ticks // 60 + 2)
+    timer.set_session_time()
+    timer.start_timer()
+    root.update_idletasks()
+    start = perf_counter()
+    for _ in range(ticks):
+        loop.now += 1
+        timer._countdown(timer.current_time - 1)
+        root.update_idletasks()
+    tick_us = (perf_counter() - start) / ticks * 1e6
+    timer.reset_timer()
+
+    start = perf_counter()
+    for _ in range(transitions):
+        timer.start_next_session(start=False)
+        root.update_idletasks()
+    transition_ms = (perf_counter() - start) / transitions * 1000
+
+    root.destroy()
+    return {"tick_us": tick_us, "transition_ms": transition_ms}
+
+
+if __name__ == "__main__":
+    for name, value in bench_timer().items():
+        print(f"bench_timer: {name} = {value:.2f}")
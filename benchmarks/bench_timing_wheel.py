@@ -0,0 +1,69 @@
+import random
+import time
+
+from python_pomodoro.engine import PomodoroEngine, SessionStatus
+from python_pomodoro.scheduler import VirtualLoop
+from python_pomodoro.timing_wheel import SessionTimers, TimingWheel
+
+"""
+Benchmark of the timing wheel with 100k concurrent sessions on a simulated clock:
+the cost of starting (inserting) and cancelling a session, and of firing the
+deadlines as the clock advances one tick at a time, with how late each deadline
+fired in clock seconds.
+Run from the repository root: python -m benchmarks.bench_timing_wheel
+"""
+
+SESSIONS = 100_000
+CANCELLED = 0.2  # fraction of the sessions cancelled before they end
+
+
+def bench_timing_wheel(sessions: int = SESSIONS) -> dict[str, float]:
+    rng = random.Random(1234)
+    loop = VirtualLoop()  # only its clock, moved by hand
+    clock = loop.clock
+    timers = SessionTimers(TimingWheel(clock=clock))
+    lateness: list[float] = []
+    engines = []
+    for _ in range(sessions):
+        minutes = rng.randint(5, 60)
+        engine = PomodoroEngine(clock=clock, durations={status: minutes * 60 for status in SessionStatus})
+        engine.current_time += rng.randint(0, 59)  # spread the deadlines over the seconds
+        engines.append(engine)
+
+    def ended(engine: PomodoroEngine) -> None:
+        lateness.append(loop.now - due[engine])
+
+    start = time.perf_counter()
+    for engine in engines:
+        timers.start(engine, on_end=ended)
+    insert = time.perf_counter() - start
+    # when each session should end, one tick after it reads 00:00
+    due = {engine: engine.deadline + engine.tick for engine in engines if engine.deadline is not None}
+
+    cancelled = rng.sample(engines, int(sessions * CANCELLED))
+    start = time.perf_counter()
+    for engine in cancelled:
+        timers.cancel(engine)
+    cancel = time.perf_counter() - start
+
+    ticks = 0
+    start = time.perf_counter()
+    while len(timers.wheel):
+        loop.now += 1.0
+        timers.wheel.advance()
+        ticks += 1
+    fire = time.perf_counter() - start
+
+    return {
+        "insert_us": insert / sessions * 1e6,
+        "cancel_us": cancel / len(cancelled) * 1e6,
+        "fire_us": fire / timers.wheel.fired * 1e6,
+        "advance_us_per_tick": fire / ticks * 1e6,
+        "max_lateness_s": max(lateness),
+        "fired": timers.wheel.fired,
+    }
+
+
+if __name__ == "__main__":
+    for name, value in bench_timing_wheel().items():
+        print(f"bench_timing_wheel: {name} = {value:,.2f}")
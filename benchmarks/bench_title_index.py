@@ -0,0 +1,41 @@
+import timeit
+from uuid import uuid4
+
+from python_pomodoro.tasklist import Task, TaskTitleIndex, validate_task_title
+
+"""
+Benchmarks for the duplicate check done by TaskList.save_new_task, comparing the
+casefold title index against a linear scan of every task title.
+Run from the repository root: python -m benchmarks.bench_title_index
+"""
+
+TASK_COUNTS = (10, 1_000, 100_000)
+
+
+def bench_duplicate_check(counts: tuple[int, ...] = TASK_COUNTS, number: int = 200) -> dict[str, float]:
+    results = {}
+    title = "A brand new task"
+    for count in counts:
+        tasks = {}
+        for i in range(count):
+            task = Task(id=uuid4(), title=f"Task number {i}")
+            tasks[task.id] = task
+        index = TaskTitleIndex()
+        index.rebuild(tasks)
+
+        def indexed() -> bool:
+            return validate_task_title(title) is None and title in index
+
+        def scan() -> bool:
+            return validate_task_title(title) is None and any(
+                task.title for task in tasks.values() if title.lower() == task.title.lower()
+            )
+
+        results[f"index_us_{count}"] = timeit.timeit(indexed, number=number) / number * 1e6
+        results[f"scan_us_{count}"] = timeit.timeit(scan, number=number) / number * 1e6
+    return results
+
+
+if __name__ == "__main__":
+    for name, value in bench_duplicate_check().items():
+        print(f"bench_duplicate_check: {name} = {value:.2f}")
@@ -0,0 +1,67 @@
+import time
+
+from benchmarks.bench_startup import import_times, run_python
+from python_pomodoro.scheduler import VirtualLoop
+from python_pomodoro.tui import TerminalScreen, TerminalTimer
+
+"""
+Startup and redraw benchmarks for the terminal front-end: the import time of
+python_pomodoro.tui and the time to its first frame, each in a fresh interpreter
+(with the saved tasks loaded from an empty store), the GUI modules it must never
+import, and the cells rewritten per tick once the first frame is drawn.
+Run from the repository root: python -m benchmarks.bench_tui
+"""
+
+IMPORT_BUDGET_MS = 150
+FIRST_FRAME_BUDGET_MS = 250
+GUI_MODULES = ("tkinter", "customtkinter", "python_pomodoro.tomato_timer", "python_pomodoro.tasklist")
+
+FIRST_FRAME_SCRIPT = """
+import time
+start = time.perf_counter()
+import os, tempfile
+from python_pomodoro.task_store import TaskStore
+from python_pomodoro.tui import TerminalScreen, TerminalTimer
+with tempfile.TemporaryDirectory() as directory:
+    store = TaskStore(os.path.join(directory, "tasks.db"))
+    timer = TerminalTimer(store=store)
+    TerminalScreen(lambda row, column, text: None).draw(timer.lines(80))
+    print((time.perf_counter() - start) * 1000)
+    store.close()
+"""
+
+
+def bench_import() -> dict[str, float]:
+    times = import_times("python_pomodoro.tui")
+    results = {"import_ms": times["python_pomodoro.tui"]}
+    for module in GUI_MODULES:
+        results[f"{module}_imported"] = float(module in times)
+    return results
+
+
+def bench_first_frame() -> dict[str, float]:
+    return {"first_frame_ms": float(run_python("-c", FIRST_FRAME_SCRIPT).stdout.split()[-1])}
+
+
+def bench_ticks(ticks: int = 600) -> dict[str, float]:
+    loop = VirtualLoop()  # only its clock, moved by hand
+    timer = TerminalTimer(clock=loop.clock)
+    screen = TerminalScreen(lambda row, column, text: None)
+    timer.start_pause()
+    screen.draw(timer.lines(80))
+    cells = screen.cells_written
+    start = time.perf_counter()
+    for _ in range(ticks):
+        loop.now += 1.0
+        timer.tick()
+        screen.draw(timer.lines(80))
+    seconds = time.perf_counter() - start
+    return {"cells_per_tick": (screen.cells_written - cells) / ticks, "frame_us": seconds / ticks * 1e6}
+
+
+if __name__ == "__main__":
+    results = {**bench_import(), **bench_first_frame(), **bench_ticks()}
+    for name, value in results.items():
+        print(f"bench_tui: {name} = {value:.2f}")
+    assert results["import_ms"] < IMPORT_BUDGET_MS, f"importing the TUI exceeded {IMPORT_BUDGET_MS} ms"
+    assert results["first_frame_ms"] < FIRST_FRAME_BUDGET_MS, f"first frame exceeded {FIRST_FRAME_BUDGET_MS} ms"
@@ -0,0 +1,207 @@
+import argparse
+import importlib
+import json
+import os
+import platform
+import re
+import sys
+import tempfile
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Collection, Optional
+
+"""
+Benchmark suite: runs the benchmarks of the startup, timer, task list and settings
+paths (and the other bench_* modules) in one go, and saves their results as a JSON
+baseline or compares them with one, flagging every timing that got slower, or
+throughput that dropped, by more than the threshold, and every result of the baseline
+that is missing.
+Benchmarks that need a display are skipped without one, and any benchmark that fails
+is reported, and counted as a regression when comparing. Saved tasks and settings go to a temporary data directory.
+Run from the repository root:
+python -m benchmarks.suite --save       # write benchmarks/baseline.json
+python -m benchmarks.suite --compare    # exit status 1 when a result regressed
+"""
+
+BASELINE_FILE = Path(__file__).parent / "baseline.json"
+THRESHOLD = 0.25  # relative change counted as a regression
+# timings in ms/us/ns get better as they drop, *_imported flags of deferred modules too
+LOWER_IS_BETTER = re.compile(r"(^|_)(ms|us|ns)(_|$)|_imported$")
+HIGHER_IS_BETTER = re.compile(r"per_second")
+RENAMED = {"stats_import": "task_import"}  # old benchmark names in saved baselines -> current names
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    name: str
+    module: str
+    function: str
+    display: bool = False
+
+    def run(self) -> dict[str, float]:
+        return getattr(importlib.import_module(self.module), self.function)()
+
+
+BENCHMARKS = (
+    Benchmark("startup_import", "benchmarks.bench_startup", "bench_import"),
+    Benchmark("startup_first_idle", "benchmarks.bench_startup", "bench_first_idle", display=True),
+    Benchmark("timer", "benchmarks.bench_timer", "bench_timer", display=True),
+    Benchmark("timer_styles", "benchmarks.bench_styles", "bench_styles", display=True),
+    Benchmark("engine_transitions", "benchmarks.bench_engine", "bench_transitions"),
+    Benchmark("engine_sessions", "benchmarks.bench_engine", "bench_simulated_sessions"),
+    Benchmark("render", "benchmarks.bench_render", "bench_render"),
+    Benchmark("scheduler", "benchmarks.bench_scheduler", "bench_scheduler"),
+    Benchmark("timing_wheel", "benchmarks.bench_timing_wheel", "bench_timing_wheel"),
+    Benchmark("tasklist_open_and_scroll", "benchmarks.bench_tasklist", "bench_open_and_scroll", display=True),
+    Benchmark("tasklist_save_new_task", "benchmarks.bench_tasklist", "bench_save_new_task", display=True),
+    Benchmark("tasklist_clear_completed", "benchmarks.bench_tasklist", "bench_clear_completed", display=True),
+    Benchmark("duplicate_check", "benchmarks.bench_title_index", "bench_duplicate_check"),
+    Benchmark("task_search_index", "benchmarks.bench_task_filter", "bench_search_index"),
+    Benchmark("tasklist_filter", "benchmarks.bench_task_filter", "bench_filter_keystrokes", display=True),
+    Benchmark("task_store", "benchmarks.bench_task_store", "bench_task_store"),
+    Benchmark("settings", "benchmarks.bench_settings", "bench_settings", display=True),
+    Benchmark("history", "benchmarks.bench_history", "bench_history"),
+    Benchmark("stats", "benchmarks.bench_stats", "bench_stats"),
+    Benchmark("task_import", "benchmarks.bench_import", "bench_import", display=True),
+    Benchmark("tui_import", "benchmarks.bench_tui", "bench_import"),
+    Benchmark("tui_ticks", "benchmarks.bench_tui", "bench_ticks"),
+    Benchmark("control", "benchmarks.bench_control", "bench_control", display=True),
+    Benchmark("service", "benchmarks.bench_service", "bench_service"),
+    Benchmark("instrument", "benchmarks.bench_instrument", "bench_instrument"),
+)
+
+
+def has_display() -> bool:
+    import tkinter
+
+    try:
+        tkinter.Tk().destroy()
+    except tkinter.TclError:
+        return False
+    return True
+
+
+def run_benchmarks(
+    benchmarks: tuple[Benchmark, ...] = BENCHMARKS, display: Optional[bool] = None
+) -> dict[str, dict[str, float]]:
+    display = has_display() if display is None else display
+    results = {}
+    for benchmark in benchmarks:
+        if benchmark.display and not display:
+            print(f"suite: {benchmark.name} skipped: needs a display")
+            continue
+        try:
+            results[benchmark.name] = benchmark.run()
+        except Exception as error:
+            print(f"suite: {benchmark.name} skipped: {type(error).__name__}: {error}")
+            continue
+        for metric, value in results[benchmark.name].items():
+            print(f"suite: {benchmark.name}.{metric} = {value:,.2f}")
+    return results
+
+
+def change(metric: str, baseline: float, current: float) -> Optional[float]:
+    # relative change where positive is worse, None for results that are not compared
+    if LOWER_IS_BETTER.search(metric):
+        worse = current - baseline
+    elif HIGHER_IS_BETTER.search(metric):
+        worse = baseline - current
+    else:
+        return None
+    if baseline == 0:
+        return float("inf") if worse > 0 else 0.0
+    return worse / abs(baseline)
+
+
+def compare(
+    baseline: dict[str, dict[str, float]],
+    results: dict[str, dict[str, float]],
+    threshold: float = THRESHOLD,
+    skipped: Collection[str] = (),
+) -> list[str]:
+    # returns the regressed results as "benchmark.metric", including baseline results that are
+    # missing, e.g. because the benchmark failed, unless the benchmark was skipped on purpose
+    regressions = []
+    for name, metrics in results.items():
+        for metric, current in metrics.items():
+            if metric not in baseline.get(name, {}):
+                continue
+            relative = change(metric, baseline[name][metric], current)
+            if relative is None:
+                continue
+            regressed = relative > threshold
+            if regressed:
+                regressions.append(f"{name}.{metric}")
+            previous = baseline[name][metric]
+            difference = f"{(current - previous) / previous:+.0%}" if previous else f"{current - previous:+,.2f}"
+            print(
+                f"suite: {name}.{metric} = {current:,.2f} (baseline {previous:,.2f}, {difference})"
+                f"{' REGRESSION' if regressed else ''}"
+            )
+    for name, metrics in baseline.items():
+        if name in skipped:
+            continue
+        for metric, previous in metrics.items():
+            if metric not in results.get(name, {}):
+                regressions.append(f"{name}.{metric}")
+                print(f"suite: {name}.{metric} missing (baseline {previous:,.2f}) REGRESSION")
+    return regressions
+
+
+def save_baseline(results: dict[str, dict[str, float]], path: str | os.PathLike = BASELINE_FILE) -> None:
+    baseline = {
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(baseline, file, indent=2)
+
+
+def load_baseline(path: str | os.PathLike = BASELINE_FILE) -> dict[str, Any]:
+    with open(path, encoding="utf-8") as file:
+        baseline = json.load(file)
+    baseline["results"] = {RENAMED.get(name, name): metrics for name, metrics in baseline["results"].items()}
+    return baseline
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.suite", description="Run the benchmarks, save or compare with a baseline."
+    )
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--save", action="store_true", help="save the results as the baseline")
+    mode.add_argument("--compare", action="store_true", help="compare the results with the baseline")
+    parser.add_argument("--baseline", default=str(BASELINE_FILE), help="baseline JSON file")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD, help="relative slowdown flagged as regression")
+    parser.add_argument("--only", nargs="+", metavar="NAME", help="benchmarks to run, all by default")
+    args = parser.parse_args(argv)
+
+    benchmarks = tuple(b for b in BENCHMARKS if args.only is None or b.name in args.only)
+    unknown = set(args.only or ()) - {b.name for b in BENCHMARKS}
+    if unknown:
+        parser.error(f"unknown benchmarks: {', '.join(sorted(unknown))}")
+    baseline = load_baseline(args.baseline)["results"] if args.compare else None
+
+    display = has_display()
+    # not run, so their baseline results are not expected
+    skipped = [b.name for b in BENCHMARKS if b not in benchmarks or (b.display and not display)]
+
+    with tempfile.TemporaryDirectory() as data_home:
+        # keep the tasks, settings and history written by the benchmarks out of the user's data directory
+        os.environ["XDG_DATA_HOME"] = data_home
+        results = run_benchmarks(benchmarks, display)
+
+    if args.save:
+        save_baseline(results, args.baseline)
+        print(f"suite: baseline saved to {args.baseline}")
+    elif baseline is not None:
+        regressions = compare(baseline, results, args.threshold, skipped)
+        if regressions:
+            sys.exit(f"suite: regressed by more than {args.threshold:.0%} or missing: {', '.join(regressions)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,55 +1,142 @@
+from typing import TYPE_CHECKING, Optional
+
 import customtkinter as ctk
 
-from .settings import Settings
+from .config import SettingsStore
+from .control import AppControl, ControlServer, get_control_path
+from .history import SessionHistory
+from .instrument import Instruments, instrumentation_enabled
+from .settings import WINDOW_SIZE, Settings
+from .task_store import TaskStore
 from .tasklist import TaskList
 from .tomato_timer import TomatoTimer
 
+if TYPE_CHECKING:
+    from .stats import SessionStats
+    from .stats_window import StatsWindow
+
 """
 Main entry point application.
 It will initialize the Tkinter window, setup the app layout, and call the
 necessary modules (e.g., GUI, timer, tasks)
+Only the timer and task list are built before the first frame. The settings panel is
+built the first time it is shown, and the stats modules (and NumPy) are imported the
+first time the stats window is opened.
 """
 
+# hot Tk callbacks timed when instrumentation is enabled
+INSTRUMENTED_METHODS = {
+    TomatoTimer: ("_countdown", "update_styles"),
+    TaskList: ("save_new_task", "clear_completed_tasks"),
+    Settings: ("update_settings",),
+}
+
 
 class App(ctk.CTk):
-    def __init__(self) -> None:
+    def __init__(self, instruments: Optional[Instruments] = None) -> None:
         super().__init__()
         self.title("Pomodoro")
 
+        # wrapped before any widget binds the callbacks
+        self.instruments = instruments
+        if instruments is not None:
+            instruments.wrap_all(INSTRUMENTED_METHODS)
+            instruments.dump_on_signal(self)
+
         ctk.set_default_color_theme("green")
 
         # Content frame
         top_container = ctk.CTkFrame(self, fg_color="transparent")
         top_container.pack(side="top", fill="both", expand=True, padx=5, pady=15)
 
-        self.timer = TomatoTimer(top_container, self)
+        # saved settings are read before the widgets are built
+        self.settings_store = SettingsStore()
+        self.timer = TomatoTimer(top_container, self, settings=self.settings_store.load())
         self.timer.pack(side="left", fill="y", padx=7)
 
-        tasks = TaskList(top_container, self)
-        tasks.pack(side="left", fill="both", expand=True, padx=7)
+        # Record finished and aborted sessions
+        self.history = SessionHistory()
+        self.timer.engine.on_session_end.append(self.history.append)
+
+        self.tasks = TaskList(top_container, self, store=TaskStore())
+        self.tasks.pack(side="left", fill="both", expand=True, padx=7)
 
         # Settings frame
         bottom_container = ctk.CTkFrame(self, corner_radius=0)
         bottom_container.pack(side="top", fill="both")
 
+        self.button_bar = ctk.CTkFrame(bottom_container, fg_color="transparent")
+        self.button_bar.pack(side="bottom", fill="x", padx=10, pady=10)
+
         self.settings_button = ctk.CTkButton(
-            bottom_container, text="Settings", command=self.show_settings, height=42, fg_color=("gray60", "gray")
+            self.button_bar, text="Settings", command=self.show_settings, height=42, fg_color=("gray60", "gray")
         )
-        self.settings_button.pack(side="bottom", fill="x", padx=10, pady=10)
+        self.settings_button.pack(side="left", fill="x", expand=True)
 
-        self.settings = Settings(bottom_container, self, self.timer, self.settings_button)
-        self.settings.resize_window()  # defines initial window dimensions
+        self.stats_button = ctk.CTkButton(
+            self.button_bar, text="Stats", command=self.show_stats, width=90, height=42, fg_color=("gray60", "gray")
+        )
+        self.stats_button.pack(side="left", padx=(10, 0))
+        self.stats: Optional["SessionStats"] = None
+        self.stats_window: Optional["StatsWindow"] = None
+
+        self.bottom_container = bottom_container
+        self._settings: Optional[Settings] = None
+        # defines initial window dimensions
+        self.minsize(*WINDOW_SIZE)
+        self.maxsize(*WINDOW_SIZE)
+
+        self.protocol("WM_DELETE_WINDOW", self.close)
+
+        # scripts and hotkeys drive the timer through a local socket, opened once the window is up
+        self.control = ControlServer(self, AppControl(self).handle, get_control_path())
+        self.after_idle(self.control.start)
+
+    @property
+    def settings(self) -> Settings:
+        # hidden until the Settings button is pressed, so built on first use
+        if self._settings is None:
+            self._settings = Settings(
+                self.bottom_container, self, self.timer, self.button_bar, store=self.settings_store
+            )
+        return self._settings
 
     def show_settings(self) -> None:
         # expand window to show settings
-        self.settings_button.pack_forget()
-        self.minsize(600, 700)
-        self.maxsize(600, 700)
+        self.button_bar.pack_forget()
+        self.minsize(600, 780)
+        self.maxsize(600, 780)
         self.settings.pack(side="top", fill="both", padx=10, pady=10)
 
+    def show_stats(self) -> None:
+        from .stats import SessionStats
+        from .stats_window import StatsWindow
+
+        if self.stats is None:
+            # built on first use, then kept up to date as sessions end
+            self.stats = SessionStats.from_history(self.history)
+            self.timer.engine.on_session_end.append(self.stats.append)
+
+        if self.stats_window is None or not self.stats_window.winfo_exists():
+            self.stats_window = StatsWindow(self, self.stats)
+        else:
+            self.stats_window.refresh()
+            self.stats_window.deiconify()
+        self.stats_window.lift()
+
+    def close(self) -> None:
+        # a session still running when the window is closed is recorded as aborted
+        self.timer.engine.stop()
+        self.control.close()
+        if self.instruments is not None:
+            self.instruments.restore_signal()
+        if self.tasks.store is not None:
+            self.tasks.store.close()
+        self.destroy()
+
 
 def main() -> None:
-    app = App()
+    app = App(instruments=Instruments() if instrumentation_enabled() else None)
     app.mainloop()
 
 
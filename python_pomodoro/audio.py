@@ -0,0 +1,93 @@
+import functools
+import queue
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Optional
+
+from .helpers import get_sound_from_resources
+
+"""
+Plays alert sounds from one long-lived background worker fed through a queue, so an
+alert never blocks the Tk event loop. When the worker starts it loads the audio
+package, which probes the system for an audio backend, and resolves the sound files
+(extracting them once if the package is zipped); each alert after that only starts
+playback.
+The time from an alert being requested to playback starting is recorded in latencies.
+"""
+
+SHORT_ALERT = "short_alert.mp3"
+ALARM = "alarm.mp3"
+ALERT_SOUNDS = (SHORT_ALERT, ALARM)
+
+Player = Callable[[str], Any]  # starts playing a sound file without waiting for it to finish
+
+
+def load_player() -> Player:
+    # imported in the worker, as it runs the backend checks as subprocesses
+    from playsound3 import playsound
+
+    return functools.partial(playsound, block=False)
+
+
+class AlertPlayer:
+    def __init__(self, sounds: tuple[str, ...] = ALERT_SOUNDS, load: Callable[[], Player] = load_player) -> None:
+        self.sounds = sounds
+        self.load = load
+        self.paths: dict[str, str] = {}
+        self.latencies: deque[float] = deque(maxlen=100)  # seconds from request to playback start
+        self.errors: deque[Exception] = deque(maxlen=10)
+        self.ready = threading.Event()
+        self._queue: queue.SimpleQueue[Optional[tuple[str, float]]] = queue.SimpleQueue()
+        self._worker: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        with self._lock:
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run, name="alert-player", daemon=True)
+                self._worker.start()
+
+    def play(self, sound: str = SHORT_ALERT, requested_at: Optional[float] = None) -> None:
+        # requested_at is a time.perf_counter() value, for measuring latency from the end of a session
+        self.start()
+        self._queue.put((sound, time.perf_counter() if requested_at is None else requested_at))
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        # the player is shared by the whole process, so a later alert starts a new worker
+        with self._lock:
+            worker, self._worker = self._worker, None
+        if worker is not None:
+            self._queue.put(None)
+            worker.join(timeout)
+
+    def _preload(self) -> Optional[Player]:
+        for sound in self.sounds:
+            self.paths[sound] = get_sound_from_resources(sound)
+        try:
+            return self.load()
+        except Exception as error:
+            # no audio backend: alerts stay silent but the banner still shows
+            self.errors.append(error)
+            return None
+        finally:
+            self.ready.set()
+
+    def _run(self) -> None:
+        player = self._preload()
+        while (request := self._queue.get()) is not None:
+            sound, requested_at = request
+            if player is None:
+                continue
+            try:
+                player(self.paths.get(sound) or get_sound_from_resources(sound))
+            except Exception as error:
+                self.errors.append(error)
+                continue
+            self.latencies.append(time.perf_counter() - requested_at)
+
+
+@functools.cache
+def get_alert_player() -> AlertPlayer:
+    # one worker for the whole process, shared by every timer
+    return AlertPlayer()
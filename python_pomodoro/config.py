@@ -0,0 +1,88 @@
+import json
+import os
+import tempfile
+from dataclasses import asdict, dataclass, fields
+from typing import Any
+
+from .engine import DEFAULT_CYCLES, SessionStatus
+from .helpers import get_data_dir
+
+"""
+Persists the timer settings (session lengths in minutes, the number of cycles and the
+seconds before the next session starts by itself) in a small JSON file.
+The file is read in one go at startup, before any widgets are built, and written
+atomically: to a temporary file in the same directory which then replaces the old
+one, so a crash while saving never leaves a half-written file. A missing, corrupt or
+out of range value falls back to its default.
+"""
+
+SETTINGS_FILE = "settings.json"
+
+# slider limits in the settings panel, also used to validate values read from the file
+SETTING_LIMITS = {
+    "focus": (5, 60),
+    "short_break": (1, 10),
+    "long_break": (5, 45),
+    "cycles": (1, 10),
+    "auto_continue": (0, 60),
+}
+
+
+@dataclass
+class TimerSettings:
+    focus: int = SessionStatus.FOCUS.value.default_time.minutes
+    short_break: int = SessionStatus.SHORT_BREAK.value.default_time.minutes
+    long_break: int = SessionStatus.LONG_BREAK.value.default_time.minutes
+    cycles: int = DEFAULT_CYCLES
+    auto_continue: int = 0  # seconds before the banner starts the next session by itself, 0 to wait
+
+    @classmethod
+    def from_dict(cls, values: Any) -> "TimerSettings":
+        settings = cls()
+        if not isinstance(values, dict):
+            return settings
+        for field in fields(cls):
+            value = values.get(field.name)
+            low, high = SETTING_LIMITS[field.name]
+            # bool is an int, but never a valid setting
+            if isinstance(value, int) and not isinstance(value, bool) and low <= value <= high:
+                setattr(settings, field.name, value)
+        return settings
+
+    def session_minutes(self) -> dict[SessionStatus, int]:
+        return {
+            SessionStatus.FOCUS: self.focus,
+            SessionStatus.SHORT_BREAK: self.short_break,
+            SessionStatus.LONG_BREAK: self.long_break,
+        }
+
+    def durations(self) -> dict[SessionStatus, int]:
+        # session lengths in ticks (seconds), as used by PomodoroEngine
+        return {status: minutes * 60 for status, minutes in self.session_minutes().items()}
+
+
+class SettingsStore:
+    def __init__(self, path: str | os.PathLike | None = None) -> None:
+        self.path = path if path is not None else get_data_dir() / SETTINGS_FILE
+
+    def load(self) -> TimerSettings:
+        try:
+            with open(self.path, "rb") as file:
+                values = json.loads(file.read())
+        except (OSError, ValueError):
+            # no settings saved yet, or an unreadable file
+            return TimerSettings()
+        return TimerSettings.from_dict(values)
+
+    def save(self, settings: TimerSettings) -> None:
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, temp_path = tempfile.mkstemp(prefix=".settings-", suffix=".tmp", dir=directory)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as file:
+                json.dump(asdict(settings), file, indent=2)
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(temp_path, self.path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
@@ -0,0 +1,217 @@
+import contextlib
+import json
+import os
+import socket
+import sys
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Any, Callable, Optional
+
+from .engine import SessionStatus
+from .helpers import get_data_dir
+
+if TYPE_CHECKING:
+    from tkinter import Misc
+
+    from .app import App
+
+"""
+Local control socket for a running App, so scripts and hotkeys can drive the timer:
+python -m python_pomodoro.control start|pause|reset|state|instrumentation|session TITLE|add_task TITLE
+The App listens on a Unix socket in the data directory. The listening socket and each
+connection are watched by the Tk event loop itself (a Tcl file handler), so there is
+no thread and no polling: a command is read, run and answered on the Tk thread when
+its bytes arrive, and answered once the window has been redrawn.
+Requests and responses are one JSON object per line, like the headless service.
+"""
+
+CONTROL_SOCKET_FILE = "control.sock"
+READABLE = 2  # tkinter.READABLE, without importing tkinter here
+TIMEOUT = 5.0  # seconds send_command waits for the app to answer
+USAGE = "start|pause|reset|state|instrumentation|session TITLE|add_task TITLE"
+
+
+class ControlServer:
+    def __init__(self, root: "Misc", handle: Callable[[dict[str, Any]], dict[str, Any]], path: str) -> None:
+        self.root = root
+        self.handle = handle
+        self.path = path
+        self.listener: Optional[socket.socket] = None
+        self.buffers: dict[socket.socket, bytes] = {}
+        # instrumentation
+        self.commands = 0
+        self.handle_times: deque[float] = deque(maxlen=1000)  # seconds spent running each command
+
+    def start(self) -> bool:
+        # returns False when the socket cannot be used, e.g. another instance is listening
+        if not hasattr(socket, "AF_UNIX") or not hasattr(self.root.tk, "createfilehandler"):
+            return False
+        if os.path.exists(self.path):
+            try:
+                with socket.socket(socket.AF_UNIX) as probe:
+                    probe.connect(self.path)
+                return False  # in use by a running instance
+            except OSError:
+                os.unlink(self.path)  # left behind by an instance that did not close
+        listener = socket.socket(socket.AF_UNIX)
+        try:
+            listener.bind(self.path)
+            os.chmod(self.path, 0o600)
+            listener.listen()
+        except OSError:
+            listener.close()
+            return False
+        listener.setblocking(False)
+        self.listener = listener
+        self.root.tk.createfilehandler(listener, READABLE, self.on_accept)
+        return True
+
+    def close(self) -> None:
+        for connection in list(self.buffers):
+            self.drop(connection)
+        if self.listener is not None:
+            self.root.tk.deletefilehandler(self.listener)
+            self.listener.close()
+            self.listener = None
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(self.path)
+
+    def on_accept(self, listener: socket.socket, mask: int) -> None:
+        try:
+            connection, _ = listener.accept()
+        except BlockingIOError:
+            return
+        self.buffers[connection] = b""
+        self.root.tk.createfilehandler(connection, READABLE, self.on_readable)
+
+    def on_readable(self, connection: socket.socket, mask: int) -> None:
+        try:
+            data = connection.recv(65536)
+        except OSError:
+            data = b""
+        if not data:
+            self.drop(connection)
+            return
+        *lines, self.buffers[connection] = (self.buffers[connection] + data).split(b"\n")
+        if not lines:
+            return
+        responses = [json.dumps(self.run(line)).encode() + b"\n" for line in lines]
+        # answer once the widgets have been redrawn
+        self.root.update_idletasks()
+        try:
+            connection.sendall(b"".join(responses))
+        except OSError:
+            self.drop(connection)
+
+    def run(self, line: bytes) -> dict[str, Any]:
+        started = time.perf_counter()
+        request: Any = None
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ValueError("request must be a JSON object")
+            response = {"ok": True, **self.handle(request)}
+        except ValueError as error:
+            response = {"ok": False, "error": str(error)}
+        except Exception as error:
+            # e.g. a TclError from a widget, still answered so the client is not left waiting
+            response = {"ok": False, "error": f"{type(error).__name__}: {error}"}
+        if isinstance(request, dict) and "id" in request:
+            response["id"] = request["id"]
+        self.commands += 1
+        self.handle_times.append(time.perf_counter() - started)
+        return response
+
+    def drop(self, connection: socket.socket) -> None:
+        self.buffers.pop(connection, None)
+        self.root.tk.deletefilehandler(connection)
+        connection.close()
+
+
+class AppControl:
+    def __init__(self, app: "App") -> None:
+        self.app = app
+        self.commands: dict[str, Callable[[dict[str, Any]], Optional[dict[str, Any]]]] = {
+            "start": lambda request: app.timer.start_timer(),
+            "pause": lambda request: app.timer.pause_timer(),
+            "reset": lambda request: app.timer.reset_timer(),
+            "session": self.change_session,
+            "add_task": self.add_task,
+            "state": lambda request: None,
+            "instrumentation": self.instrumentation,
+        }
+
+    def handle(self, request: dict[str, Any]) -> dict[str, Any]:
+        op = request.get("op")
+        command = self.commands.get(op) if isinstance(op, str) else None
+        if command is None:
+            raise ValueError(f"unknown op: {op!r}")
+        return {**self.state(), **(command(request) or {})}
+
+    def change_session(self, request: dict[str, Any]) -> None:
+        # by title ("Short Break") or by name ("SHORT_BREAK")
+        for status in SessionStatus:
+            if request.get("status") in (status.value.title, status.name):
+                self.app.timer.change_session_status(status.value.title)
+                return
+        raise ValueError(f"unknown session: {request.get('status')!r}")
+
+    def add_task(self, request: dict[str, Any]) -> None:
+        title = request.get("title")
+        if not isinstance(title, str):
+            raise ValueError("title must be a string")
+        error = self.app.tasks.title_error(title)
+        if error is not None:
+            raise ValueError(error)
+        self.app.tasks.create_task(title)
+
+    def instrumentation(self, request: dict[str, Any]) -> dict[str, Any]:
+        # call time histograms of the hot callbacks, None unless started with POMODORO_INSTRUMENT=1
+        instruments = self.app.instruments
+        return {"instrumentation": instruments.to_dict() if instruments is not None else None}
+
+    def state(self) -> dict[str, Any]:
+        timer = self.app.timer
+        return {
+            "status": timer.status.name,
+            "time_left": max(0, timer.engine.ticks_left()),
+            "running": timer.engine.deadline is not None,
+            "cycle": timer.current_cycle,
+            "cycles": timer.cycles,
+            "tasks": len(self.app.tasks.tasks_by_id),
+        }
+
+
+def get_control_path() -> str:
+    return str(get_data_dir() / CONTROL_SOCKET_FILE)
+
+
+def send_command(request: dict[str, Any], path: Optional[str] = None, timeout: float = TIMEOUT) -> dict[str, Any]:
+    with socket.socket(socket.AF_UNIX) as client:
+        client.settimeout(timeout)
+        client.connect(path if path is not None else get_control_path())
+        client.sendall(json.dumps(request).encode() + b"\n")
+        with client.makefile("rb") as reader:
+            return json.loads(reader.readline())
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    args = sys.argv[1:] if argv is None else argv
+    if not args:
+        sys.exit(f"usage: python -m python_pomodoro.control {USAGE}")
+    request: dict[str, Any] = {"op": args[0]}
+    if args[0] == "session":
+        request["status"] = " ".join(args[1:])
+    elif args[0] == "add_task":
+        request["title"] = " ".join(args[1:])
+    try:
+        response = send_command(request)
+    except OSError as error:
+        sys.exit(f"no running app to control: {error}")
+    print(json.dumps(response))
+    if not response["ok"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
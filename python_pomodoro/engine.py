@@ -0,0 +1,223 @@
+import math
+import time
+from dataclasses import dataclass
+from enum import Enum, IntEnum
+from typing import Callable, Mapping, NamedTuple, Optional
+
+"""
+Headless pomodoro state machine, free of any Tk or customtkinter imports.
+Keeps track of the current session, the cycle count and the FOCUS -> SHORT_BREAK ->
+LONG_BREAK rotation, and runs the countdown against an absolute deadline read from
+an injectable clock, so it can be driven by a GUI, a server or a simulated clock.
+Every session that was started and then completes or is aborted is reported to the
+on_session_end listeners as a SessionRecord.
+Text colours and default session lengths are stored in the SessionStatus enum as
+frozen Session dataclasses.
+Each engine keeps its own session lengths, the defaults from the enum when none are
+given (usually they come from TimerSettings), so several engines can run side by side
+with different settings.
+"""
+
+DEFAULT_CYCLES = 4
+
+Clock = Callable[[], float]
+
+
+@dataclass(frozen=True)
+class Time:
+    minutes: int
+    seconds: int
+
+
+@dataclass(frozen=True)
+class Session:
+    title: str
+    default_time: Time
+    image: str
+    image_paused: str
+    foreground: str
+    background: str
+    foreground_paused: str
+    background_paused: str
+
+
+class SessionStatus(Enum):
+    FOCUS = Session(
+        title="Focus Time",
+        default_time=Time(25, 0),
+        image="tomato_red_bg.png",
+        image_paused="tomato_red_dark_bg.png",
+        foreground="#ffc9c9",
+        background="#f55453",
+        foreground_paused="#ec9291",
+        background_paused="#d24847",
+    )
+    SHORT_BREAK = Session(
+        title="Short Break",
+        default_time=Time(5, 0),
+        image="tomato_yellow_bg.png",
+        image_paused="tomato_yellow_dark_bg.png",
+        foreground="#ffecc5",
+        background="#f5c944",
+        foreground_paused="#dcbf70",
+        background_paused="#c5a237",
+    )
+    LONG_BREAK = Session(
+        title="Long Break",
+        default_time=Time(15, 0),
+        image="tomato_green_bg.png",
+        image_paused="tomato_green_dark_bg.png",
+        foreground="#c2f8c2",
+        background="#76c776",
+        foreground_paused="#87c387",
+        background_paused="#5fa05f",
+    )
+
+
+class Outcome(IntEnum):
+    COMPLETED = 0
+    ABORTED = 1
+
+
+class SessionRecord(NamedTuple):
+    start: int  # wall clock time the session was first started, in whole seconds
+    planned: int  # session length in ticks (seconds)
+    actual: int  # ticks actually counted down before the session ended
+    outcome: Outcome
+    status: SessionStatus
+    cycle: int
+
+
+def session_durations() -> dict[SessionStatus, int]:
+    # default session lengths in ticks (seconds) from the enum
+    return {
+        status: status.value.default_time.minutes * 60 + status.value.default_time.seconds for status in SessionStatus
+    }
+
+
+class PomodoroEngine:
+    __slots__ = (
+        "status",
+        "durations",
+        "cycles",
+        "current_cycle",
+        "is_paused",
+        "current_time",
+        "deadline",
+        "clock",
+        "tick",
+        "wall_clock",
+        "planned_time",
+        "session_start",
+        "on_session_end",
+    )
+
+    def __init__(
+        self,
+        cycles: int = DEFAULT_CYCLES,
+        clock: Clock = time.monotonic,
+        tick: float = 1.0,
+        wall_clock: Clock = time.time,
+        durations: Optional[Mapping[SessionStatus, int]] = None,
+    ) -> None:
+        self.status = SessionStatus.FOCUS
+        self.durations = dict(durations) if durations is not None else session_durations()
+        self.cycles = cycles
+        self.current_cycle = 1
+        self.is_paused = False
+        self.current_time = 0  # whole ticks left, as displayed
+        self.deadline: Optional[float] = None  # clock time at which the timer reads 00:00
+        self.clock = clock
+        self.tick = tick  # length of one tick in clock seconds
+        self.wall_clock = wall_clock
+        self.planned_time = 0
+        self.session_start: Optional[float] = None  # wall clock time, None until the session is started
+        self.on_session_end: list[Callable[[SessionRecord], None]] = []
+        self.load_session()
+
+    def load_session(self) -> None:
+        self.current_time = self.planned_time = self.durations[self.status]
+
+    def set_duration(self, status: SessionStatus, ticks: int) -> None:
+        # takes effect the next time the session is loaded
+        self.durations[status] = ticks
+
+    def set_status(self, status: SessionStatus) -> None:
+        if status is not self.status:
+            self.end_session(Outcome.ABORTED)
+        self.status = status
+
+    def start(self) -> None:
+        if self.session_start is None:
+            self.session_start = self.wall_clock()
+        self.is_paused = False
+        self.deadline = self.clock() + self.current_time * self.tick
+
+    def ticks_left(self) -> int:
+        # the display shows the remaining time rounded up to the whole tick
+        if self.deadline is None:
+            return self.current_time
+        return math.ceil((self.deadline - self.clock()) / self.tick)
+
+    def update(self, count: int) -> int:
+        # Recompute from the deadline rather than decrementing, so a late callback skips ahead
+        if self.deadline is not None and self.is_paused is not True:
+            count = max(-1, min(count, self.ticks_left()))
+        self.current_time = count
+
+        if count < 0:
+            self.end_session(Outcome.COMPLETED)
+        if count < 0 or self.is_paused:
+            self.is_paused = True
+            self.deadline = None
+        return count
+
+    def delay_until(self, count: int) -> float:
+        # clock seconds until the tick showing `count` falls due
+        if self.deadline is None:
+            return 0.0
+        return max(0.0, self.deadline - count * self.tick - self.clock())
+
+    def pause(self) -> None:
+        if self.deadline is not None:
+            # keep the time remaining at the moment of pausing
+            self.current_time = max(0, min(self.current_time, self.ticks_left()))
+        self.is_paused = True
+        self.deadline = None
+
+    def stop(self) -> None:
+        # abandons the current session, if it was started
+        self.pause()
+        self.end_session(Outcome.ABORTED)
+
+    def end_session(self, outcome: Outcome) -> None:
+        if self.session_start is None or not self.on_session_end:
+            self.session_start = None
+            return
+        actual = self.planned_time if outcome is Outcome.COMPLETED else self.planned_time - self.current_time
+        record = SessionRecord(
+            int(self.session_start), self.planned_time, max(0, actual), outcome, self.status, self.current_cycle
+        )
+        self.session_start = None
+        for listener in self.on_session_end:
+            listener(record)
+
+    def reset(self) -> None:
+        self.stop()
+        self.load_session()
+
+    def next_status(self) -> SessionStatus:
+        if self.status is not SessionStatus.FOCUS:
+            return SessionStatus.FOCUS
+        elif self.current_cycle == self.cycles:
+            return SessionStatus.LONG_BREAK
+        return SessionStatus.SHORT_BREAK
+
+    def advance(self) -> SessionStatus:
+        next_session = self.next_status()
+        if self.status is not SessionStatus.FOCUS:
+            # Increment cycle
+            self.current_cycle = self.current_cycle + 1 if self.current_cycle < self.cycles else 1
+        self.status = next_session
+        self.load_session()
+        return next_session
@@ -1,12 +1,63 @@
+import atexit
+import base64
+import functools
 import os
 import pathlib
+from contextlib import ExitStack
+from importlib.resources import as_file, files
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from tkinter import Misc, PhotoImage
 
 """
 Additional helper functions used by class function and methods.
+Resources are found with importlib.resources relative to the package, so they also
+load from a wheel or a zipapp. Resolved paths, file contents and decoded images are
+cached for the whole process.
+tkinter is only imported to build an image, so headless modules can use the helpers.
 """
 
+RESOURCES = files(__package__) / "resources"
+
+# Keeps resources extracted from a zip archive on disk until the process exits
+_resource_files = ExitStack()
+atexit.register(_resource_files.close)
+
+
+@functools.cache
+def get_resource_path(*parts: str) -> pathlib.Path:
+    return _resource_files.enter_context(as_file(RESOURCES.joinpath(*parts)))
+
 
 def get_image_from_resources(img_file_name: str) -> str:
-    images_dir = pathlib.Path("resources/images/").resolve()
-    img_path = os.path.join(images_dir, img_file_name)
-    return img_path
+    return str(get_resource_path("images", img_file_name))
+
+
+def get_sound_from_resources(sound_file_name: str) -> str:
+    return str(get_resource_path("sounds", sound_file_name))
+
+
+@functools.cache
+def get_image_data(img_file_name: str) -> str:
+    # base64, as accepted by PhotoImage(data=...)
+    return base64.b64encode(RESOURCES.joinpath("images", img_file_name).read_bytes()).decode("ascii")
+
+
+def get_photo_image(img_file_name: str, master: "Misc") -> "PhotoImage":
+    from tkinter import PhotoImage
+
+    # Images belong to a Tk interpreter, so they are cached on its root window and shared by its widgets
+    root = master.nametowidget(".")
+    images: dict[str, PhotoImage] = root.__dict__.setdefault("_pomodoro_images", {})
+    if img_file_name not in images:
+        images[img_file_name] = PhotoImage(data=get_image_data(img_file_name), master=root)
+    return images[img_file_name]
+
+
+def get_data_dir() -> pathlib.Path:
+    # Per-user directory for saved tasks and history, following the XDG base directory spec
+    data_home = os.environ.get("XDG_DATA_HOME") or pathlib.Path.home() / ".local" / "share"
+    data_dir = pathlib.Path(data_home) / "python_pomodoro"
+    data_dir.mkdir(parents=True, exist_ok=True)
+    return data_dir
@@ -0,0 +1,76 @@
+import mmap
+import os
+import struct
+from contextlib import contextmanager
+from typing import Iterator
+
+from .engine import Outcome, SessionRecord, SessionStatus
+from .helpers import get_data_dir
+
+"""
+Append-only log of finished and aborted sessions.
+The file is a short header followed by fixed-width 10 byte little-endian records:
+start (uint32 unix seconds), planned and actual length (uint16 seconds each),
+outcome and session status packed into one byte, and the cycle number (uint8).
+Records can be memory-mapped and scanned in place without parsing the file.
+"""
+
+HISTORY_FILE = "history.bin"
+HISTORY_HEADER = b"POMOHIS1"
+HEADER_SIZE = len(HISTORY_HEADER)
+RECORD = struct.Struct("<IHHBB")
+
+STATUS_CODES = {status: code for code, status in enumerate(SessionStatus)}
+STATUSES = tuple(SessionStatus)
+OUTCOMES = tuple(Outcome)
+
+
+def pack_record(record: SessionRecord) -> bytes:
+    flags = record.outcome << 4 | STATUS_CODES[record.status]
+    return RECORD.pack(record.start, min(record.planned, 0xFFFF), min(record.actual, 0xFFFF), flags, record.cycle)
+
+
+def unpack_record(start: int, planned: int, actual: int, flags: int, cycle: int) -> SessionRecord:
+    return SessionRecord(start, planned, actual, OUTCOMES[flags >> 4], STATUSES[flags & 0x0F], cycle)
+
+
+class SessionHistory:
+    def __init__(self, path: str | os.PathLike | None = None) -> None:
+        self.path = path if path is not None else get_data_dir() / HISTORY_FILE
+
+    def append(self, record: SessionRecord) -> None:
+        with open(self.path, "ab") as file:
+            size = file.tell()
+            if size < HEADER_SIZE:
+                # new, or the header was left half-written by a crash
+                file.truncate(0)
+                file.write(HISTORY_HEADER)
+            elif (size - HEADER_SIZE) % RECORD.size:
+                # drop a record left half-written by a crash, so later records stay aligned
+                file.truncate(size - (size - HEADER_SIZE) % RECORD.size)
+            file.write(pack_record(record))
+
+    def __len__(self) -> int:
+        try:
+            size = os.path.getsize(self.path)
+        except FileNotFoundError:
+            return 0
+        return max(0, size - HEADER_SIZE) // RECORD.size
+
+    @contextmanager
+    def buffer(self) -> Iterator[memoryview]:
+        # Memory-maps the log and yields a view of the whole records, valid inside the with block
+        count = len(self)
+        if count == 0:
+            yield memoryview(b"")
+            return
+        with open(self.path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            if mapped[:HEADER_SIZE] != HISTORY_HEADER:
+                raise ValueError(f"{self.path} is not a session history file")
+            end = HEADER_SIZE + count * RECORD.size
+            with memoryview(mapped) as whole, whole[HEADER_SIZE:end] as view:
+                yield view
+
+    def records(self) -> list[SessionRecord]:
+        with self.buffer() as view:
+            return [unpack_record(*fields) for fields in RECORD.iter_unpack(view)]
@@ -0,0 +1,151 @@
+import functools
+import json
+import os
+import signal
+import time
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Mapping, Optional
+
+from .helpers import get_data_dir
+
+if TYPE_CHECKING:
+    from tkinter import Misc
+
+"""
+Opt-in instrumentation of the hot Tk callbacks, for diagnosing UI stutter.
+Set POMODORO_INSTRUMENT=1 before starting the app: the listed methods are then wrapped
+at class level, before any widget binds them, and the duration of every call is
+recorded in a fixed-size histogram with power of two microsecond buckets. When it is
+not set nothing is wrapped, so the callbacks run exactly as without instrumentation.
+The histograms are dumped as JSON to instrumentation.json in the data directory on
+SIGUSR1 (kill -USR1 <pid>), or returned by the "instrumentation" control command;
+restore_signal puts back the signal handler that was replaced, when the app closes.
+"""
+
+ENV_VAR = "POMODORO_INSTRUMENT"
+INSTRUMENTATION_FILE = "instrumentation.json"
+BUCKETS = 24  # bucket n counts calls under 2**n microseconds, the last one everything slower
+READABLE = 2  # tkinter.READABLE, without importing tkinter here
+
+
+def instrumentation_enabled() -> bool:
+    return os.environ.get(ENV_VAR, "") not in ("", "0")
+
+
+class Histogram:
+    __slots__ = ("counts", "count", "total", "max")
+
+    def __init__(self) -> None:
+        self.counts = [0] * (BUCKETS + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        self.counts[min(int(seconds * 1_000_000).bit_length(), BUCKETS)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, percent: float) -> float:
+        # upper bound in seconds of the bucket holding the percentile, the max for the last bucket
+        rank = percent / 100 * self.count
+        seen = 0
+        for bucket, count in enumerate(self.counts):
+            seen += count
+            if count and seen >= rank:
+                return self.max if bucket == BUCKETS else min(self.max, 2**bucket / 1_000_000)
+        return 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "mean_ms": self.total / self.count * 1000 if self.count else 0.0,
+            "p50_ms": self.percentile(50) * 1000,
+            "p99_ms": self.percentile(99) * 1000,
+            "max_ms": self.max * 1000,
+            # upper bound in microseconds -> calls, "inf" for the slowest bucket
+            "buckets_us": {
+                str(2**bucket) if bucket < BUCKETS else "inf": count
+                for bucket, count in enumerate(self.counts)
+                if count
+            },
+        }
+
+
+class Instruments:
+    def __init__(self) -> None:
+        self.histograms: dict[str, Histogram] = {}
+        self.originals: dict[tuple[type, str], Callable] = {}
+        # dump on signal: the root watching the wakeup pipe, its fds and what they replaced
+        self.signal_root: Optional["Misc"] = None
+        self.wakeup_fds: Optional[tuple[int, int]] = None
+        self.previous_handler: Any = None
+        self.previous_wakeup_fd = -1
+
+    def wrap(self, cls: type, name: str) -> None:
+        if (cls, name) in self.originals:
+            return
+        function = cls.__dict__[name]
+        histogram = self.histograms.setdefault(f"{cls.__name__}.{name}", Histogram())
+        perf_counter = time.perf_counter
+
+        @functools.wraps(function)
+        def timed(*args: Any, **kwargs: Any) -> Any:
+            started = perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                histogram.record(perf_counter() - started)
+
+        self.originals[(cls, name)] = function
+        setattr(cls, name, timed)
+
+    def wrap_all(self, methods: Mapping[type, Iterable[str]]) -> None:
+        for cls, names in methods.items():
+            for name in names:
+                self.wrap(cls, name)
+
+    def unwrap_all(self) -> None:
+        for (cls, name), function in self.originals.items():
+            setattr(cls, name, function)
+        self.originals.clear()
+
+    def to_dict(self) -> dict[str, Any]:
+        return {name: histogram.to_dict() for name, histogram in self.histograms.items()}
+
+    def dump(self, path: Optional[str | os.PathLike] = None) -> None:
+        path = path if path is not None else get_data_dir() / INSTRUMENTATION_FILE
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(self.to_dict(), file, indent=2)
+
+    def dump_on_signal(self, root: "Misc") -> bool:
+        # dumps on SIGUSR1; the signal also wakes the Tk event loop, which may be waiting for events
+        if not hasattr(signal, "SIGUSR1") or not hasattr(root.tk, "createfilehandler"):
+            return False
+        self.restore_signal()
+        read_fd, write_fd = os.pipe()
+        os.set_blocking(read_fd, False)
+        os.set_blocking(write_fd, False)
+        self.previous_wakeup_fd = signal.set_wakeup_fd(write_fd)
+        root.tk.createfilehandler(read_fd, READABLE, lambda fd, mask: os.read(read_fd, 512))
+        self.previous_handler = signal.signal(signal.SIGUSR1, lambda signum, frame: self.dump())
+        self.signal_root = root
+        self.wakeup_fds = (read_fd, write_fd)
+        return True
+
+    def restore_signal(self) -> None:
+        # undoes dump_on_signal: the previous handler and wakeup fd are put back and the pipe closed
+        if self.signal_root is None or self.wakeup_fds is None:
+            return
+        read_fd, write_fd = self.wakeup_fds
+        handler = self.previous_handler
+        signal.signal(signal.SIGUSR1, handler if handler is not None else signal.SIG_DFL)
+        signal.set_wakeup_fd(self.previous_wakeup_fd)
+        self.signal_root.tk.deletefilehandler(read_fd)
+        os.close(read_fd)
+        os.close(write_fd)
+        self.signal_root = None
+        self.wakeup_fds = None
+        self.previous_handler = None
+        self.previous_wakeup_fd = -1
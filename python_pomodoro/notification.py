@@ -0,0 +1,80 @@
+from typing import Callable, Optional
+
+import customtkinter as ctk
+
+"""
+Non-modal notification shown inside the main window when a session ends.
+The banner asks whether to start the next session and hands the answer to a callback,
+so the Tk event loop keeps running (other timers, task edits, redraws) while it waits.
+It can optionally answer Yes by itself after a number of seconds.
+"""
+
+
+class SessionBanner(ctk.CTkFrame):
+    def __init__(self, parent: ctk.CTkFrame) -> None:
+        ctk.CTkFrame.__init__(self, master=parent, border_width=2)
+        self.on_response: Optional[Callable[[bool], None]] = None
+        self.auto_continue_left: Optional[int] = None
+        self._after_id: Optional[str] = None
+
+        self.label_title = ctk.CTkLabel(self, text="", font=("", 16, "bold"))
+        self.label_title.pack(side="top", padx=15, pady=(10, 0))
+
+        self.label_message = ctk.CTkLabel(self, text="", justify="center", wraplength=260)
+        self.label_message.pack(side="top", padx=15, pady=5)
+
+        self.frame_buttons = ctk.CTkFrame(self, fg_color="transparent")
+        self.frame_buttons.pack(side="top", pady=(0, 10))
+        self.button_yes = ctk.CTkButton(self.frame_buttons, text="Yes", width=100, command=lambda: self.respond(True))
+        self.button_yes.pack(side="left", padx=5)
+        self.button_no = ctk.CTkButton(self.frame_buttons, text="No", width=100, command=lambda: self.respond(False))
+        self.button_no.pack(side="left", padx=5)
+
+    @property
+    def is_shown(self) -> bool:
+        return self.on_response is not None
+
+    def show(
+        self, title: str, message: str, on_response: Callable[[bool], None], auto_continue: Optional[int] = None
+    ) -> None:
+        self.dismiss()
+        self.on_response = on_response
+        self.label_title.configure(text=title)
+        self.label_message.configure(text=message)
+        self.auto_continue_left = auto_continue
+        self.update_yes_button()
+        # overlays the top of the timer, so nothing else moves
+        self.place(relx=0.5, rely=0.0, anchor="n", relwidth=1.0)
+        self.lift()
+        if auto_continue is not None:
+            self._after_id = self.after(1000, self._auto_continue_tick)
+
+    def update_yes_button(self) -> None:
+        left = self.auto_continue_left
+        self.button_yes.configure(text="Yes" if left is None else f"Yes ({left})")
+
+    def _auto_continue_tick(self) -> None:
+        self._after_id = None
+        if self.auto_continue_left is None:
+            return
+        self.auto_continue_left -= 1
+        if self.auto_continue_left <= 0:
+            self.respond(True)
+        else:
+            self.update_yes_button()
+            self._after_id = self.after(1000, self._auto_continue_tick)
+
+    def respond(self, start: bool) -> None:
+        on_response = self.on_response
+        self.dismiss()
+        if on_response is not None:
+            on_response(start)
+
+    def dismiss(self) -> None:
+        # hides the banner without answering it
+        if self._after_id is not None:
+            self.after_cancel(self._after_id)
+            self._after_id = None
+        self.on_response = None
+        self.auto_continue_left = None
+        self.place_forget()
@@ -0,0 +1,59 @@
+from collections import deque
+from typing import Any, Callable, Hashable, Optional, Protocol
+
+"""
+Render layer between a view and Tk.
+The view sets the value it wants for each named target (a StringVar, the window title,
+a style); values equal to the last one applied are dropped, and the remaining changes
+are pushed to Tk together in a single flush, either straight away after a user action
+or once per tick from an idle callback.
+Counts of the Tk calls made and saved are kept, as are the calls made by each flush.
+"""
+
+
+class Scheduler(Protocol):
+    def after_idle(self, func: Callable[[], object]) -> str: ...
+
+
+class Renderer:
+    def __init__(self, scheduler: Scheduler) -> None:
+        self.scheduler = scheduler
+        self.applied: dict[Hashable, Any] = {}
+        self.pending: dict[Hashable, tuple[Any, Callable[[Any], object]]] = {}
+        self._idle_id: Optional[str] = None
+        # instrumentation
+        self.requested = 0  # values set by the view
+        self.tk_calls = 0  # values pushed to Tk
+        self.flushes = 0
+        self.calls_per_flush: deque[int] = deque(maxlen=1000)
+
+    def set(self, target: Hashable, value: Any, apply: Callable[[Any], object]) -> None:
+        self.requested += 1
+        if target in self.applied and self.applied[target] == value:
+            # back to what Tk already shows, drop any change still waiting
+            self.pending.pop(target, None)
+        else:
+            self.pending[target] = (value, apply)
+
+    def flush_idle(self) -> None:
+        if self.pending and self._idle_id is None:
+            self._idle_id = self.scheduler.after_idle(self._flush_idle)
+
+    def _flush_idle(self) -> None:
+        self._idle_id = None
+        self.flush()
+
+    def flush(self) -> None:
+        if not self.pending:
+            return
+        pending, self.pending = self.pending, {}
+        for target, (value, apply) in pending.items():
+            apply(value)
+            self.applied[target] = value
+        self.tk_calls += len(pending)
+        self.flushes += 1
+        self.calls_per_flush.append(len(pending))
+
+    @property
+    def saved_calls(self) -> int:
+        return self.requested - self.tk_calls - len(self.pending)
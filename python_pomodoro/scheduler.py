@@ -0,0 +1,140 @@
+import heapq
+import math
+import time
+from typing import Callable, Hashable, Optional, Protocol
+
+from .engine import Clock
+
+"""
+One tick scheduler shared by every timer in a Tk interpreter.
+Timers ask to be called back at an absolute clock time; the scheduler keeps a single
+pending `after` call for all of them, set for the earliest due time rounded up to a
+grid of whole ticks, and runs every timer that is due when it wakes. Timers started
+at different moments therefore share one wakeup per tick (each is at most one tick
+late, and recomputes its display from its deadline) instead of each keeping its own
+chain of `after` calls. A lone timer is woken exactly when it is due.
+VirtualLoop stands in for the Tk event loop with a clock of its own, which only moves
+when the loop is run, so whole sessions can be counted down without waiting.
+"""
+
+
+class EventLoop(Protocol):
+    def after(self, ms: int, func: Callable[[], object]) -> str: ...
+
+    def after_cancel(self, id: str) -> None: ...
+
+
+class TickScheduler:
+    def __init__(self, loop: EventLoop, period: float = 1.0, clock: Clock = time.monotonic) -> None:
+        self.loop = loop
+        self.period = period  # grid spacing in clock seconds, the length of one tick
+        self.clock = clock
+        self.due: dict[Hashable, tuple[float, Callable[[], object]]] = {}
+        self.anchor = 0.0  # a point on the grid
+        self._after_id: Optional[str] = None
+        self._wakeup_at = math.inf
+        self._running = False
+        # instrumentation
+        self.wakeups = 0
+        self.callbacks = 0
+
+    def schedule(self, key: Hashable, at: float, callback: Callable[[], object]) -> None:
+        # replaces any callback already scheduled under the same key
+        if not self.due:
+            self.anchor = at
+        self.due[key] = (at, callback)
+        if not self._running:
+            self._reschedule()
+
+    def cancel(self, key: Hashable) -> None:
+        if self.due.pop(key, None) is not None and not self._running:
+            self._reschedule()
+
+    def is_scheduled(self, key: Hashable) -> bool:
+        return key in self.due
+
+    def next_wakeup(self) -> float:
+        # earliest due time, rounded up onto the grid when more than one timer is waiting
+        earliest = min(at for at, _ in self.due.values())
+        if len(self.due) == 1:
+            return earliest
+        ticks = math.ceil((earliest - self.anchor) / self.period - 1e-9)
+        return self.anchor + ticks * self.period
+
+    def _reschedule(self) -> None:
+        wakeup_at = self.next_wakeup() if self.due else math.inf
+        if wakeup_at == self._wakeup_at:
+            return
+        if self._after_id is not None:
+            self.loop.after_cancel(self._after_id)
+            self._after_id = None
+        self._wakeup_at = wakeup_at
+        if self.due:
+            ms = max(0, math.ceil((wakeup_at - self.clock()) * 1000))
+            self._after_id = self.loop.after(ms, self._run)
+
+    def _run(self) -> None:
+        self._after_id = None
+        self._wakeup_at = math.inf
+        self.wakeups += 1
+        # anything due up to the grid point this wakeup was set for
+        now = max(self.clock(), self.next_wakeup()) if self.due else self.clock()
+        ready = [(key, entry) for key, entry in self.due.items() if entry[0] <= now]
+        # callbacks schedule their next tick, so the wakeup is set once they have all run
+        self._running = True
+        try:
+            for key, entry in ready:
+                # skip anything cancelled or replaced by an earlier callback
+                if self.due.get(key) is entry:
+                    del self.due[key]
+                    self.callbacks += 1
+                    entry[1]()
+        finally:
+            self._running = False
+            self._reschedule()
+
+
+class VirtualLoop:
+    def __init__(self, now: float = 0.0) -> None:
+        self.now = now
+        self.queue: list[tuple[float, int, str, Callable[..., object], tuple]] = []
+        self.cancelled: set[str] = set()
+        self.calls = 0
+
+    def clock(self) -> float:
+        return self.now
+
+    def after(self, ms: int, func: Callable[..., object], *args: object) -> str:
+        self.calls += 1
+        after_id = f"after#{self.calls}"
+        heapq.heappush(self.queue, (self.now + ms / 1000, self.calls, after_id, func, args))
+        return after_id
+
+    def after_cancel(self, id: str) -> None:
+        self.cancelled.add(id)
+
+    def run(self, until: float = math.inf) -> None:
+        # runs the callbacks due up to `until` in order, moving the clock to each of them
+        while self.queue and self.queue[0][0] <= until:
+            due, n, after_id, func, args = heapq.heappop(self.queue)
+            if after_id in self.cancelled:
+                continue
+            self.now = self.wakeup_time(max(self.now, due), n)
+            func(*args)
+        if until != math.inf:
+            self.now = max(self.now, until)
+
+    def advance(self, seconds: float) -> None:
+        self.run(self.now + seconds)
+
+    def wakeup_time(self, due: float, n: int) -> float:
+        # when the n-th callback runs, on time here
+        return due
+
+
+def get_scheduler(root: EventLoop, period: float = 1.0) -> TickScheduler:
+    # one scheduler per Tk interpreter, kept on its root window
+    scheduler = vars(root).get("_pomodoro_scheduler")
+    if scheduler is None:
+        scheduler = vars(root)["_pomodoro_scheduler"] = TickScheduler(root, period)
+    return scheduler
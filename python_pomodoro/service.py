@@ -0,0 +1,274 @@
+import argparse
+import asyncio
+import json
+import math
+import time
+from typing import Any, Callable, Optional
+
+from .config import TimerSettings
+from .engine import Clock, PomodoroEngine
+from .helpers import get_data_dir
+from .timing_wheel import SessionTimers, TimingWheel
+
+"""
+Headless pomodoro service hosting many sessions, without importing Tk.
+Clients connect to a local Unix socket and send one JSON object per line, such as
+{"op": "create", "session": "alice", "settings": {"focus": 25}, "auto_continue": true},
+and get one JSON object per line back, echoing the request "id". Every session runs the
+FOCUS -> SHORT_BREAK -> LONG_BREAK rotation of a PomodoroEngine, and its deadline is
+kept on a timing wheel, so the service only wakes when a session actually ends.
+Clients that subscribed to a session (or to "*", every session) are pushed a
+"transition" event when it ends, carrying the monotonic clock time it was due at.
+Run with: python -m python_pomodoro.service [--socket PATH]
+"""
+
+SOCKET_FILE = "service.sock"
+
+
+class Client:
+    def __init__(self, writer: asyncio.StreamWriter) -> None:
+        self.writer = writer
+        self.subscriptions: set[str] = set()
+
+    def send(self, message: dict[str, Any]) -> None:
+        if not self.writer.is_closing():
+            self.writer.write(json.dumps(message).encode() + b"\n")
+
+
+class HostedSession:
+    def __init__(self, name: str, engine: PomodoroEngine, auto_continue: bool) -> None:
+        self.name = name
+        self.engine = engine
+        self.auto_continue = auto_continue
+        self.due: Optional[float] = None  # clock time the running session ends
+        self.subscribers: set[Client] = set()
+
+    def state(self) -> dict[str, Any]:
+        engine = self.engine
+        return {
+            "session": self.name,
+            "status": engine.status.name,
+            "cycle": engine.current_cycle,
+            "cycles": engine.cycles,
+            "time_left": max(0, engine.ticks_left()),
+            "running": self.due is not None,
+            "auto_continue": self.auto_continue,
+        }
+
+
+class PomodoroService:
+    def __init__(self, tick: float = 1.0, clock: Clock = time.monotonic) -> None:
+        self.tick = tick  # length of one tick in clock seconds, shorter for load tests
+        self.clock = clock
+        self.timers = SessionTimers(TimingWheel(resolution=tick, clock=clock))
+        self.sessions: dict[str, HostedSession] = {}
+        self.watchers: set[Client] = set()  # subscribed to every session
+        self.commands: dict[str, Callable[[dict[str, Any], Client], dict[str, Any]]] = {
+            "create": self.create,
+            "start": self.start,
+            "pause": self.pause,
+            "reset": self.reset,
+            "skip": self.skip,
+            "state": self.state,
+            "list": self.list_sessions,
+            "subscribe": self.subscribe,
+            "unsubscribe": self.unsubscribe,
+            "close": self.close,
+        }
+        self._wake: Optional[asyncio.Event] = None
+        self._wakeup_at = math.inf
+        # instrumentation
+        self.requests = 0
+        self.notifications = 0
+
+    def handle(self, request: Any, client: Client) -> dict[str, Any]:
+        self.requests += 1
+        if not isinstance(request, dict):
+            raise ValueError("request must be a JSON object")
+        op = request.get("op")
+        command = self.commands.get(op) if isinstance(op, str) else None
+        if command is None:
+            raise ValueError(f"unknown op: {op!r}")
+        return command(request, client)
+
+    def get_session(self, request: dict[str, Any]) -> HostedSession:
+        name = request.get("session")
+        session = self.sessions.get(name) if isinstance(name, str) else None
+        if session is None:
+            raise ValueError(f"unknown session: {name!r}")
+        return session
+
+    def create(self, request: dict[str, Any], client: Client) -> dict[str, Any]:
+        name = request.get("session")
+        if not isinstance(name, str) or not name or name == "*":
+            raise ValueError("session must be a non-empty name")
+        if name in self.sessions:
+            raise ValueError(f"session already exists: {name!r}")
+        settings = TimerSettings.from_dict(request.get("settings", {}))
+        engine = PomodoroEngine(
+            cycles=settings.cycles, durations=settings.durations(), clock=self.clock, tick=self.tick
+        )
+        session = self.sessions[name] = HostedSession(name, engine, bool(request.get("auto_continue", False)))
+        return session.state()
+
+    def start(self, request: dict[str, Any], client: Client) -> dict[str, Any]:
+        session = self.get_session(request)
+        if session.due is None:
+            self.start_session(session)
+        return session.state()
+
+    def pause(self, request: dict[str, Any], client: Client) -> dict[str, Any]:
+        session = self.get_session(request)
+        self.timers.pause(session.engine)
+        session.due = None
+        return session.state()
+
+    def reset(self, request: dict[str, Any], client: Client) -> dict[str, Any]:
+        session = self.get_session(request)
+        self.timers.cancel(session.engine)
+        session.engine.load_session()
+        session.due = None
+        return session.state()
+
+    def skip(self, request: dict[str, Any], client: Client) -> dict[str, Any]:
+        # abandon the current session and move on to the next one, like the end of a session
+        session = self.get_session(request)
+        self.timers.cancel(session.engine)
+        session.due = None
+        session.engine.advance()
+        return session.state()
+
+    def state(self, request: dict[str, Any], client: Client) -> dict[str, Any]:
+        return self.get_session(request).state()
+
+    def list_sessions(self, request: dict[str, Any], client: Client) -> dict[str, Any]:
+        return {"sessions": sorted(self.sessions)}
+
+    def subscribe(self, request: dict[str, Any], client: Client) -> dict[str, Any]:
+        if request.get("session") == "*":
+            self.watchers.add(client)
+        else:
+            self.get_session(request).subscribers.add(client)
+        client.subscriptions.add(request["session"])
+        return {"subscribed": sorted(client.subscriptions)}
+
+    def unsubscribe(self, request: dict[str, Any], client: Client) -> dict[str, Any]:
+        name = request.get("session")
+        if not isinstance(name, str):
+            raise ValueError(f"unknown session: {name!r}")
+        if name == "*":
+            self.watchers.discard(client)
+        elif name in self.sessions:
+            self.sessions[name].subscribers.discard(client)
+        client.subscriptions.discard(name)
+        return {"subscribed": sorted(client.subscriptions)}
+
+    def close(self, request: dict[str, Any], client: Client) -> dict[str, Any]:
+        session = self.get_session(request)
+        self.timers.cancel(session.engine)
+        del self.sessions[session.name]
+        for subscriber in session.subscribers:
+            subscriber.subscriptions.discard(session.name)
+        return {"closed": session.name}
+
+    def start_session(self, session: HostedSession) -> None:
+        self.timers.start(session.engine, on_end=lambda engine: self.session_ended(session))
+        session.due = self.clock() + session.engine.delay_until(-1)
+        if session.due < self._wakeup_at and self._wake is not None:
+            # the new deadline comes before the one being waited for
+            self._wake.set()
+
+    def session_ended(self, session: HostedSession) -> None:
+        engine = session.engine
+        ended, due = engine.status, session.due
+        session.due = None
+        engine.advance()
+        if session.auto_continue:
+            self.start_session(session)
+        self.notify(
+            session,
+            {
+                "event": "transition",
+                "session": session.name,
+                "ended": ended.name,
+                "status": engine.status.name,
+                "cycle": engine.current_cycle,
+                "started": session.auto_continue,
+                "due": due,
+            },
+        )
+
+    def notify(self, session: HostedSession, event: dict[str, Any]) -> None:
+        for client in session.subscribers | self.watchers:
+            client.send(event)
+            self.notifications += 1
+
+    async def run_deadlines(self) -> None:
+        # sleeps until the next deadline on the wheel, or until an earlier one is added
+        self._wake = asyncio.Event()
+        wheel = self.timers.wheel
+        while True:
+            expiry = wheel.next_expiry()
+            self._wakeup_at = math.inf if expiry is None else expiry
+            self._wake.clear()
+            try:
+                timeout = None if expiry is None else max(0.0, expiry - self.clock())
+                await asyncio.wait_for(self._wake.wait(), timeout)
+            except TimeoutError:
+                pass
+            wheel.advance()
+
+    async def handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        client = Client(writer)
+        try:
+            while line := await reader.readline():
+                request: Any = None
+                try:
+                    request = json.loads(line)
+                    response = {"ok": True, **self.handle(request, client)}
+                except ValueError as error:
+                    response = {"ok": False, "error": str(error)}
+                except Exception as error:
+                    # a bug in one request is answered, and the connection kept for the next
+                    response = {"ok": False, "error": f"{type(error).__name__}: {error}"}
+                if isinstance(request, dict) and "id" in request:
+                    response["id"] = request["id"]
+                client.send(response)
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self.watchers.discard(client)
+            for name in client.subscriptions:
+                if name in self.sessions:
+                    self.sessions[name].subscribers.discard(client)
+            writer.close()
+
+    async def serve(self, path: str, started: Optional[Callable[[], object]] = None) -> None:
+        server = await asyncio.start_unix_server(self.handle_client, path=path)
+        deadlines = asyncio.create_task(self.run_deadlines())
+        if started is not None:
+            started()
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            deadlines.cancel()
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m python_pomodoro.service", description="Headless pomodoro service hosting many sessions."
+    )
+    parser.add_argument("--socket", default=str(get_data_dir() / SOCKET_FILE), help="Unix socket to listen on")
+    parser.add_argument("--tick", type=float, default=1.0, help="length of one tick in seconds")
+    args = parser.parse_args(argv)
+    service = PomodoroService(tick=args.tick)
+    try:
+        asyncio.run(service.serve(args.socket, started=lambda: print(f"listening on {args.socket}", flush=True)))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
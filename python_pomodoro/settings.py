@@ -1,73 +1,106 @@
 from tkinter import IntVar, Tk, ttk
+from typing import Optional
 
 import customtkinter as ctk
 
-from .tomato_timer import DEFAULT_CYCLES, SessionStatus, TomatoTimer
+from .config import SETTING_LIMITS, SettingsStore, TimerSettings
+from .engine import DEFAULT_CYCLES, SessionStatus
+from .tomato_timer import TomatoTimer
 
 """
 Handles all the settings for the Pomodoro app by calling get and set methods on the
-Scale slider controls and passing the values to the SessionStatus enum.
+Scale slider controls and passing the session lengths to the timer.
 
-The timer methods for setting the status and resetting are called when the save button is pressed.
+The timer methods for setting the status and resetting are called when the save button is pressed,
+and the new values are saved to the settings store so they are used again on the next start.
 Lastly the Settings frame is hidden and the main window resized.
 """
 
+WINDOW_SIZE = (600, 538)  # main window size while the settings are hidden
+
 
 class Settings(ctk.CTkFrame):
-    def __init__(self, parent: ttk.Frame, main_window: Tk, timer: TomatoTimer, controller: ttk.Button) -> None:
+    def __init__(
+        self,
+        parent: ttk.Frame,
+        main_window: Tk,
+        timer: TomatoTimer,
+        controller: ttk.Button,
+        store: Optional[SettingsStore] = None,
+    ) -> None:
         ctk.CTkFrame.__init__(self, master=parent)
         self.configure(fg_color="transparent")
         self.main_window = main_window
         self.timer = timer
         self.button = controller
+        self.store = store
 
+        # sliders start at the current settings
         self.setting_focus_time = SettingSlider(
-            self, "Focus time", 5, 60, SessionStatus.FOCUS.value.default_time.minutes
+            self, "Focus time", *SETTING_LIMITS["focus"], timer.get_session_minutes(SessionStatus.FOCUS)
         )
         self.setting_focus_time.grid(row=0, column=0, padx=15)
 
-        self.setting_cycles = SettingSlider(self, "Cycles", 1, 10, DEFAULT_CYCLES)
+        self.setting_cycles = SettingSlider(self, "Cycles", *SETTING_LIMITS["cycles"], timer.get_cycles())
         self.setting_cycles.grid(row=0, column=1, padx=15)
 
         self.setting_short_break = SettingSlider(
-            self, "Short Break", 1, 10, SessionStatus.SHORT_BREAK.value.default_time.minutes
+            self, "Short Break", *SETTING_LIMITS["short_break"], timer.get_session_minutes(SessionStatus.SHORT_BREAK)
         )
         self.setting_short_break.grid(row=1, column=0, padx=15, pady=10)
 
         self.setting_long_break = SettingSlider(
-            self, "Long Break", 5, 45, SessionStatus.LONG_BREAK.value.default_time.minutes
+            self, "Long Break", *SETTING_LIMITS["long_break"], timer.get_session_minutes(SessionStatus.LONG_BREAK)
         )
         self.setting_long_break.grid(row=1, column=1, padx=15, pady=10)
 
+        # 0 waits for an answer to the banner at the end of a session
+        self.setting_auto_continue = SettingSlider(
+            self, "Auto-continue (s)", *SETTING_LIMITS["auto_continue"], timer.auto_continue or 0
+        )
+        self.setting_auto_continue.grid(row=2, column=0, padx=15)
+
         self.frame_buttons = ctk.CTkFrame(self, fg_color="transparent")
-        self.frame_buttons.grid(row=2, column=0, columnspan=2)
+        self.frame_buttons.grid(row=3, column=0, columnspan=2)
         self.button_reset = ctk.CTkButton(self.frame_buttons, text="Reset", command=self.reset_slider_defaults)
-        self.button_reset.grid(row=2, column=0, sticky="e", padx=5, pady=10)
+        self.button_reset.grid(row=3, column=0, sticky="e", padx=5, pady=10)
         self.button_save = ctk.CTkButton(self.frame_buttons, text="Save", command=self.update_settings)
-        self.button_save.grid(row=2, column=1, sticky="w", padx=5, pady=10)
+        self.button_save.grid(row=3, column=1, sticky="w", padx=5, pady=10)
         self.button_cancel = ctk.CTkButton(self.frame_buttons, text="Cancel", command=self.close_settings)
-        self.button_cancel.grid(row=2, column=2, sticky="w", padx=5, pady=10)
+        self.button_cancel.grid(row=3, column=2, sticky="w", padx=5, pady=10)
 
     def reset_slider_defaults(self) -> None:
         self.setting_focus_time.set_slider_value(SessionStatus.FOCUS.value.default_time.minutes)
         self.setting_short_break.set_slider_value(SessionStatus.SHORT_BREAK.value.default_time.minutes)
         self.setting_long_break.set_slider_value(SessionStatus.LONG_BREAK.value.default_time.minutes)
         self.setting_cycles.set_slider_value(DEFAULT_CYCLES)
+        self.setting_auto_continue.set_slider_value(TimerSettings().auto_continue)
 
     def update_settings(self) -> None:
+        # abandon the running session before its times and cycles change
+        self.timer.engine.stop()
+
         focus_minutes = self.setting_focus_time.get_slider_value()
-        SessionStatus.FOCUS.value.set_time(focus_minutes)
+        self.timer.set_session_minutes(SessionStatus.FOCUS, focus_minutes)
 
         short_break_minutes = self.setting_short_break.get_slider_value()
-        SessionStatus.SHORT_BREAK.value.set_time(short_break_minutes)
+        self.timer.set_session_minutes(SessionStatus.SHORT_BREAK, short_break_minutes)
 
         long_break_minutes = self.setting_long_break.get_slider_value()
-        SessionStatus.LONG_BREAK.value.set_time(long_break_minutes)
+        self.timer.set_session_minutes(SessionStatus.LONG_BREAK, long_break_minutes)
 
         cycles = self.setting_cycles.get_slider_value()
         self.timer.set_cycles(cycles)
         self.timer.current_cycle = 1  # reset cycles after updating settings
 
+        auto_continue = self.setting_auto_continue.get_slider_value()
+        self.timer.auto_continue = auto_continue or None
+
+        if self.store is not None:
+            self.store.save(
+                TimerSettings(focus_minutes, short_break_minutes, long_break_minutes, cycles, auto_continue)
+            )
+
         self.timer.set_status(SessionStatus.FOCUS)
         self.timer.reset_timer()
         self.close_settings()
@@ -81,6 +114,8 @@ class Settings(ctk.CTkFrame):
             self.setting_changes_cancelled(s, session)
         if self.setting_cycles.get_slider_value() != self.timer.get_cycles():
             self.setting_cycles.set_slider_value(self.timer.get_cycles())
+        if self.setting_auto_continue.get_slider_value() != (self.timer.auto_continue or 0):
+            self.setting_auto_continue.set_slider_value(self.timer.auto_continue or 0)
 
         self.pack_forget()
         self.button.pack(side="bottom", fill="x", padx=10, pady=10)
@@ -88,12 +123,13 @@ class Settings(ctk.CTkFrame):
 
     def setting_changes_cancelled(self, slider: str, session: SessionStatus) -> None:
         # User presses cancel without saving the changes to settings
-        if self.__getattribute__(slider).get_slider_value() != session.value.time.minutes:
-            self.__getattribute__(slider).set_slider_value(session.value.time.minutes)
+        minutes = self.timer.get_session_minutes(session)
+        if self.__getattribute__(slider).get_slider_value() != minutes:
+            self.__getattribute__(slider).set_slider_value(minutes)
 
     def resize_window(self) -> None:
-        self.main_window.minsize(600, 538)
-        self.main_window.maxsize(600, 538)
+        self.main_window.minsize(*WINDOW_SIZE)
+        self.main_window.maxsize(*WINDOW_SIZE)
 
 
 class SettingSlider(ctk.CTkFrame):
@@ -0,0 +1,122 @@
+import time
+from typing import Optional
+
+import numpy as np
+
+from .engine import Outcome, SessionRecord, SessionStatus
+from .history import RECORD, STATUS_CODES, SessionHistory, pack_record
+
+"""
+Statistics over the session history, computed with NumPy over columnar arrays.
+The history log is copied into a structured array with the same 10 byte layout,
+and each session that ends afterwards is appended in place, so the stats view never
+re-reads or loops over the log in Python.
+Days and weeks are counted in local time; weeks start on Monday.
+"""
+
+HISTORY_DTYPE = np.dtype([("start", "<u4"), ("planned", "<u2"), ("actual", "<u2"), ("flags", "u1"), ("cycle", "u1")])
+assert HISTORY_DTYPE.itemsize == RECORD.size
+
+SECONDS_PER_DAY = 86400
+FOCUS_CODE = STATUS_CODES[SessionStatus.FOCUS]
+COMPLETED_CODE = int(Outcome.COMPLETED)
+ABORTED_CODE = int(Outcome.ABORTED)
+
+
+class SessionStats:
+    def __init__(self, records: Optional[np.ndarray] = None, utc_offset: Optional[int] = None) -> None:
+        records = records if records is not None else np.empty(0, dtype=HISTORY_DTYPE)
+        count = self.count = len(records)
+        self.records = np.empty(max(1024, 2 * count), dtype=HISTORY_DTYPE)
+        self.records[:count] = records
+        # seconds east of UTC, so that days roll over at local midnight
+        self.utc_offset = utc_offset if utc_offset is not None else time.localtime().tm_gmtoff
+        self._focus_cache: tuple[int, np.ndarray] = (-1, self.records[:0])
+
+    @classmethod
+    def from_history(cls, history: SessionHistory, utc_offset: Optional[int] = None) -> "SessionStats":
+        with history.buffer() as view:
+            records = np.frombuffer(view, dtype=HISTORY_DTYPE).copy()
+        return cls(records, utc_offset)
+
+    def append(self, record: SessionRecord) -> None:
+        # Incremental update when a session ends, amortised O(1)
+        count = self.count
+        if count == len(self.records):
+            grown = np.empty(2 * count, dtype=HISTORY_DTYPE)
+            grown[:count] = self.records[:count]
+            self.records = grown
+        self.records[count] = np.frombuffer(pack_record(record), dtype=HISTORY_DTYPE)[0]
+        self.count = count + 1
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _focus(self) -> np.ndarray:
+        # focus sessions only, filtered once per new record rather than once per aggregate
+        count = self.count
+        if self._focus_cache[0] != count:
+            records = self.records[:count]
+            self._focus_cache = (count, records[(records["flags"] & 0x0F) == FOCUS_CODE])
+        return self._focus_cache[1]
+
+    def _days(self, records: np.ndarray) -> np.ndarray:
+        return (records["start"].astype(np.int64) + self.utc_offset) // SECONDS_PER_DAY
+
+    def today(self) -> int:
+        return (int(time.time()) + self.utc_offset) // SECONDS_PER_DAY
+
+    def focus_minutes_per_day(self) -> tuple[np.ndarray, np.ndarray]:
+        # Returns day numbers (days since 1970-01-01) and focus minutes for each day with focus time
+        focus = self._focus()
+        if len(focus) == 0:
+            return np.empty(0, dtype=np.int64), np.empty(0)
+        days = self._days(focus)
+        first_day = days.min()
+        minutes = np.bincount(days - first_day, weights=focus["actual"]) / 60
+        active = np.flatnonzero(minutes)
+        return active + first_day, minutes[active]
+
+    def focus_minutes_per_week(self) -> tuple[np.ndarray, np.ndarray]:
+        # Returns the day number of each week's Monday and the focus minutes in that week
+        days, minutes = self.focus_minutes_per_day()
+        if len(days) == 0:
+            return days, minutes
+        weeks = (days + 3) // 7  # 1970-01-01 was a Thursday
+        first_week = weeks.min()
+        totals = np.bincount(weeks - first_week, weights=minutes)
+        active = np.flatnonzero(totals)
+        return (active + first_week) * 7 - 3, totals[active]
+
+    def completion_rate_by_cycle(self) -> np.ndarray:
+        # Fraction of focus sessions completed, indexed by cycle position (index 0 unused)
+        focus = self._focus()
+        cycles = focus["cycle"]
+        completed = (focus["flags"] >> 4) == COMPLETED_CODE
+        totals = np.bincount(cycles)
+        done = np.bincount(cycles, weights=completed, minlength=len(totals))
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(totals > 0, done / np.maximum(totals, 1), np.nan)
+
+    def streaks(self, today: Optional[int] = None) -> tuple[int, int]:
+        # Current and longest run of consecutive days with a completed focus session
+        focus = self._focus()
+        days = np.unique(self._days(focus[(focus["flags"] >> 4) == COMPLETED_CODE]))
+        if len(days) == 0:
+            return 0, 0
+        breaks = np.flatnonzero(np.diff(days) != 1)
+        run_starts = np.concatenate(([0], breaks + 1))
+        run_lengths = np.diff(np.concatenate((run_starts, [len(days)])))
+        today = self.today() if today is None else today
+        # the current streak is still alive if the last active day was today or yesterday
+        current = int(run_lengths[-1]) if days[-1] >= today - 1 else 0
+        return current, int(run_lengths.max())
+
+    def interruption_histogram(self, bin_minutes: int = 5) -> tuple[np.ndarray, np.ndarray]:
+        # Histogram of how many minutes into a focus session it was aborted: bin edges and counts
+        focus = self._focus()
+        aborted_minutes = focus["actual"][(focus["flags"] >> 4) == ABORTED_CODE] / 60
+        longest = int(np.ceil(focus["planned"].max() / 60)) if len(focus) else 0
+        edges = np.arange(0, max(longest, bin_minutes) + bin_minutes, bin_minutes)
+        counts, edges = np.histogram(aborted_minutes, bins=edges)
+        return edges, counts
@@ -0,0 +1,87 @@
+import datetime
+from typing import Optional
+
+import customtkinter as ctk
+import numpy as np
+
+from .stats import SessionStats
+
+"""
+Window showing statistics over the session history: focus minutes today, this week
+and for each of the last 7 days, streaks, completion rate per cycle position and
+when focus sessions were interrupted. Aggregates come from SessionStats.
+"""
+
+CHART_WIDTH = 30  # characters in the longest bar
+
+
+def day_name(day: int) -> str:
+    return (datetime.date(1970, 1, 1) + datetime.timedelta(days=day)).strftime("%a %d %b")
+
+
+def summary_text(stats: SessionStats, today: int) -> str:
+    days, minutes = stats.focus_minutes_per_day()
+    weeks, week_minutes = stats.focus_minutes_per_week()
+    monday = today - (today + 3) % 7
+    today_minutes = minutes[days == today].sum()
+    this_week_minutes = week_minutes[weeks == monday].sum()
+    current, longest = stats.streaks(today)
+
+    rates = stats.completion_rate_by_cycle()
+    completion = "  ".join(f"{cycle}: {rate:.0%}" for cycle, rate in enumerate(rates) if not np.isnan(rate))
+
+    return (
+        f"Focus today: {today_minutes:.0f} min\n"
+        f"Focus this week: {this_week_minutes:.0f} min\n"
+        f"Streak: {current} days (longest {longest})\n"
+        f"Completed by cycle: {completion or '-'}"
+    )
+
+
+def last_days_chart(stats: SessionStats, today: int, count: int = 7) -> str:
+    days, minutes = stats.focus_minutes_per_day()
+    recent = np.arange(today - count + 1, today + 1)
+    recent_minutes = np.zeros(count)
+    found = np.isin(days, recent)
+    recent_minutes[days[found] - recent[0]] = minutes[found]
+
+    scale = CHART_WIDTH / max(recent_minutes.max(), 1)
+    return "\n".join(
+        f"{day_name(day)}  {'█' * int(round(value * scale)):<{CHART_WIDTH}} {value:.0f} min"
+        for day, value in zip(recent.tolist(), recent_minutes.tolist())
+    )
+
+
+def interruptions_text(stats: SessionStats) -> str:
+    edges, counts = stats.interruption_histogram()
+    if counts.sum() == 0:
+        return "No interrupted focus sessions."
+    return "\n".join(
+        f"{start:>2.0f}-{end:<2.0f} min: {count}" for start, end, count in zip(edges, edges[1:], counts) if count
+    )
+
+
+class StatsWindow(ctk.CTkToplevel):
+    def __init__(self, main_window: ctk.CTk, stats: SessionStats) -> None:
+        ctk.CTkToplevel.__init__(self, master=main_window)
+        self.title("Pomodoro - Stats")
+        self.stats = stats
+
+        self.label_summary = ctk.CTkLabel(self, justify="left", anchor="w", font=("", 15))
+        self.label_summary.pack(side="top", fill="x", padx=15, pady=10)
+
+        ctk.CTkLabel(self, text="Last 7 days", font=("", 17), anchor="w").pack(side="top", fill="x", padx=15)
+        self.label_chart = ctk.CTkLabel(self, justify="left", anchor="w", font=("Courier", 13))
+        self.label_chart.pack(side="top", fill="x", padx=15, pady=5)
+
+        ctk.CTkLabel(self, text="Interruptions", font=("", 17), anchor="w").pack(side="top", fill="x", padx=15)
+        self.label_interruptions = ctk.CTkLabel(self, justify="left", anchor="w", font=("Courier", 13))
+        self.label_interruptions.pack(side="top", fill="x", padx=15, pady=(5, 15))
+
+        self.refresh()
+
+    def refresh(self, today: Optional[int] = None) -> None:
+        today = self.stats.today() if today is None else today
+        self.label_summary.configure(text=summary_text(self.stats, today))
+        self.label_chart.configure(text=last_days_chart(self.stats, today))
+        self.label_interruptions.configure(text=interruptions_text(self.stats))
@@ -0,0 +1,64 @@
+import csv
+import json
+import os
+import pathlib
+from itertools import chain
+from typing import IO, Any, Iterable, Iterator
+
+"""
+Reads task titles from files for bulk import into the task list.
+Plain text files have one task per line, CSV files use the "title" column (or the
+first column if there is no header) and JSON files hold a list of titles or of
+objects with a "title" key. Text, CSV and JSON Lines files are streamed line by line.
+"""
+
+TASK_FILE_TYPES = [("Task lists", "*.txt *.csv *.json *.jsonl"), ("All files", "*")]
+
+
+def read_task_titles(path: str | os.PathLike) -> Iterator[str]:
+    suffix = pathlib.Path(path).suffix.lower()
+    with open(path, encoding="utf-8", newline="" if suffix == ".csv" else None) as file:
+        titles: Iterable[Any]
+        if suffix == ".csv":
+            titles = _read_csv_titles(file)
+        elif suffix == ".json":
+            titles = (_title_from_json(item) for item in _read_json_list(file))
+        elif suffix == ".jsonl":
+            titles = (_title_from_json(json.loads(line)) for line in file if line.strip())
+        else:
+            titles = file
+
+        for title in titles:
+            title = title.strip()
+            if title:
+                yield title
+
+
+def _read_csv_titles(file: Iterable[str]) -> Iterator[str]:
+    rows: Iterator[list[str]] = csv.reader(file)
+    header = next(rows, [])
+    columns = [cell.strip().casefold() for cell in header]
+    if "title" in columns:
+        column = columns.index("title")
+    else:
+        # no header, the first row is a task
+        column = 0
+        rows = chain([header], rows)
+    for row in rows:
+        if len(row) > column:
+            yield row[column]
+
+
+def _read_json_list(file: IO[str]) -> list[Any]:
+    items = json.load(file)
+    if not isinstance(items, list):
+        raise ValueError("JSON file must hold a list of tasks")
+    return items
+
+
+def _title_from_json(item: Any) -> str:
+    if isinstance(item, dict):
+        item = item.get("title", "")
+    if not isinstance(item, str):
+        raise ValueError(f"Invalid task in JSON file: {item!r}")
+    return item
@@ -0,0 +1,53 @@
+import os
+import sqlite3
+from typing import Iterable, Iterator
+from uuid import UUID
+
+from .helpers import get_data_dir
+
+"""
+Persists the task list in a SQLite database in WAL mode.
+Each add, toggle and clear is written as a small incremental change instead of
+rewriting the whole list, and the caller commits once per user action (or per chunk
+of imported tasks). Tasks are read back in the order they were added.
+"""
+
+TASKS_DB_FILE = "tasks.db"
+
+
+class TaskStore:
+    def __init__(self, path: str | os.PathLike | None = None) -> None:
+        self.path = path if path is not None else get_data_dir() / TASKS_DB_FILE
+        self.connection = sqlite3.connect(self.path)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        # WAL with synchronous=NORMAL is crash-safe, only the last commits may be lost on power failure
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS tasks ("
+            "id BLOB PRIMARY KEY, title TEXT NOT NULL, is_complete INTEGER NOT NULL DEFAULT 0)"
+        )
+        self.connection.commit()
+
+    def load(self) -> Iterator[tuple[UUID, str, bool]]:
+        for id, title, is_complete in self.connection.execute(
+            "SELECT id, title, is_complete FROM tasks ORDER BY rowid"
+        ):
+            yield UUID(bytes=id), title, bool(is_complete)
+
+    def add(self, id: UUID, title: str, is_complete: bool = False) -> None:
+        self.connection.execute(
+            "INSERT OR REPLACE INTO tasks (id, title, is_complete) VALUES (?, ?, ?)", (id.bytes, title, is_complete)
+        )
+
+    def set_complete(self, id: UUID, is_complete: bool) -> None:
+        self.connection.execute("UPDATE tasks SET is_complete = ? WHERE id = ?", (is_complete, id.bytes))
+
+    def remove(self, ids: Iterable[UUID]) -> None:
+        self.connection.executemany("DELETE FROM tasks WHERE id = ?", ((id.bytes,) for id in ids))
+
+    def commit(self) -> None:
+        self.connection.commit()
+
+    def close(self) -> None:
+        self.connection.commit()
+        self.connection.close()
@@ -0,0 +1,27 @@
+from string import punctuation
+from typing import Optional
+
+"""
+Rules for task titles, shared by the task list window and the terminal front-end.
+Free of any Tk imports.
+"""
+
+MAX_TITLE_LENGTH = 100
+PUNCTUATION = frozenset(punctuation)
+
+
+def validate_task_title(title: str) -> Optional[str]:
+    # Returns the error message for an invalid title, or None if it is valid
+    if not len(title) > 0:  # no text entered
+        return "Please enter a task..."
+    elif not len(title) < MAX_TITLE_LENGTH:  # text too long
+        return f"Task too long (max {MAX_TITLE_LENGTH} chars.)"
+
+    # single pass checking for only punctuation or only whitespaces
+    only_punctuation = only_spaces = True
+    for char in title:
+        only_punctuation = only_punctuation and char in PUNCTUATION
+        only_spaces = only_spaces and char.isspace()
+        if not (only_punctuation or only_spaces):
+            return None
+    return "Please enter a valid task name."
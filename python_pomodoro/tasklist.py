@@ -1,16 +1,51 @@
+import csv
+import os
+import time
+from collections import deque
 from dataclasses import dataclass
-from string import punctuation
-from tkinter import IntVar, Tk, ttk
-from typing import Optional
+from itertools import filterfalse
+from operator import add
+from tkinter import IntVar, Tk, filedialog, ttk
+from typing import Callable, Iterator, Optional, Sequence
 from uuid import UUID, uuid4
 
 import customtkinter as ctk
 
+from .task_import import TASK_FILE_TYPES, read_task_titles
+from .task_store import TaskStore
+from .task_titles import validate_task_title
+
 """
 Handles creation of tasks in tasklist.
-New tasks are created as checkboxes and when completed/checked are coloured grey.
+New tasks are shown as checkboxes and when completed/checked are coloured grey.
+The task list is virtualized: tasks_by_id is the source of truth, and only the
+rows currently scrolled into view have a checkbox, which is recycled on scroll.
+Duplicate titles are found through a casefold-normalized title index. Tasks are only
+added and removed through add_task and remove_tasks, which keep task_order and both
+indexes in step with tasks_by_id.
+The filter box narrows the rows to the tasks containing the typed text, those whose
+title starts with it first. Matches are looked up in an index of the 1 to 3 character
+grams of every title, updated as tasks are added and removed: a text of up to 3
+characters is a gram itself, so its matches are read straight from the index, and a
+longer one only checks the titles holding its rarest gram, or the matches of the
+previous keystroke when typing on, never every title. Saved tasks are indexed in small
+chunks from the Tk idle loop after loading, and until they all are the filter scans
+the titles instead. The recycled rows are rebound to the matching tasks, so no widget
+is created or destroyed while filtering.
+Tasks can be bulk imported from a file; they are validated like typed tasks and
+added in small chunks from the Tk idle loop, so the window and timer never freeze.
+With a TaskStore, every change is also written to disk and the saved tasks are
+loaded once the window is idle after startup.
 """
 
+VISIBLE_TASKS = 8
+COMPLETE_COLOR = "gray60"
+INCOMPLETE_COLOR = ("gray10", "#DCE4EE")
+IMPORT_CHUNK_MS = 8  # time budget for each chunk of imported tasks
+SEARCH_INDEX_CHUNK_MS = 8  # time budget for each chunk of loaded tasks indexed for search
+SEARCH_GRAM = 3  # length of the longest grams in the search index
+TITLE_START = "\x00"  # marks the grams indexing how titles start
+
 
 @dataclass
 class Task:
@@ -20,29 +55,223 @@ class Task:
     checkbox: Optional[ctk.CTkCheckBox] = None
 
 
+@dataclass
+class TaskRow:
+    checkbox: ctk.CTkCheckBox
+    is_complete: IntVar
+    task: Optional[Task] = None
+
+
+@dataclass
+class ImportReport:
+    imported: int = 0
+    skipped: int = 0
+    seconds: float = 0.0
+    worst_chunk_ms: float = 0.0
+    error: Optional[str] = None
+
+    @property
+    def tasks_per_second(self) -> float:
+        return (self.imported + self.skipped) / self.seconds if self.seconds else 0.0
+
+
+class TaskTitleIndex:
+    def __init__(self) -> None:
+        self.ids_by_title: dict[str, UUID] = {}
+
+    @staticmethod
+    def normalize(title: str) -> str:
+        return title.casefold()
+
+    def __len__(self) -> int:
+        return len(self.ids_by_title)
+
+    def __contains__(self, title: str) -> bool:
+        return self.normalize(title) in self.ids_by_title
+
+    def add(self, task: Task) -> None:
+        self.ids_by_title[self.normalize(task.title)] = task.id
+
+    def remove(self, task: Task) -> None:
+        key = self.normalize(task.title)
+        if self.ids_by_title.get(key) == task.id:
+            del self.ids_by_title[key]
+
+    def rebuild(self, tasks: dict[UUID, Task]) -> None:
+        self.ids_by_title = {self.normalize(task.title): id for id, task in tasks.items()}
+
+
+class TaskSearchIndex:
+    def __init__(self) -> None:
+        # tasks by position in the order added, the title is "" once removed
+        self.ids: list[UUID] = []
+        self.titles: list[str] = []
+        self.positions: dict[UUID, int] = {}  # of the tasks not removed, in the order added
+        # positions of the titles holding each gram, in increasing order
+        self.positions_by_gram: dict[str, list[int]] = {}
+        # the last search, narrowed further while the user keeps typing
+        self.last_text = ""
+        self.last_matches: list[int] = []
+
+    @staticmethod
+    def grams(text: str) -> set[str]:
+        # every substring of 1 to SEARCH_GRAM characters, each length joined from the one before
+        layer = list(text)
+        grams = set(layer)
+        for length in range(1, SEARCH_GRAM):
+            layer = list(map(add, layer, text[length:]))
+            grams.update(layer)
+        return grams
+
+    @staticmethod
+    def start_grams(title: str) -> set[str]:
+        return {TITLE_START + title[:length] for length in range(1, min(len(title), SEARCH_GRAM) + 1)}
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    def add(self, task: Task) -> None:
+        self._insert(task.id, TaskTitleIndex.normalize(task.title))
+
+    def _insert(self, id: UUID, title: str) -> None:
+        position = len(self.ids)
+        self.ids.append(id)
+        self.titles.append(title)
+        self.positions[id] = position
+        for gram in self.grams(title) | self.start_grams(title):
+            self.positions_by_gram.setdefault(gram, []).append(position)
+        self.last_text = ""
+
+    def remove(self, task: Task) -> None:
+        position = self.positions.pop(task.id, None)
+        if position is None:
+            return
+        # left in the gram lists, where an empty title never matches
+        self.titles[position] = ""
+        self.last_text = ""
+        if len(self.ids) > 2 * len(self.positions) + 64:
+            self.compact()
+
+    def compact(self) -> None:
+        # drops the removed tasks, once they outnumber the others
+        live = [(id, self.titles[position]) for id, position in self.positions.items()]
+        self.ids, self.titles, self.positions, self.positions_by_gram = [], [], {}, {}
+        for id, title in live:
+            self._insert(id, title)
+
+    def rebuild(self, tasks: dict[UUID, Task]) -> None:
+        self.ids, self.titles, self.positions, self.positions_by_gram = [], [], {}, {}
+        for task in tasks.values():
+            self.add(task)
+
+    def search(self, text: str) -> list[UUID]:
+        # ids of the tasks with the text in their title, those starting with it first, each in the order added
+        text = TaskTitleIndex.normalize(text)
+        if not text:
+            return list(self.positions)
+        grams = self.positions_by_gram
+        titles = self.titles
+        if len(text) <= SEARCH_GRAM:
+            # the text is a gram itself, so its titles are the matches
+            matches = self.live(grams.get(text, []))
+        else:
+            # every title containing the text holds each of its grams, so only those of the rarest are checked
+            candidates: Sequence[int] = min((grams.get(gram, []) for gram in self.grams(text)), key=len)
+            if self.last_text and text.startswith(self.last_text):
+                candidates = min(candidates, self.last_matches, key=len)  # typing on only narrows the last matches
+            matches = [position for position in candidates if text in titles[position]]
+        self.last_text, self.last_matches = text, matches
+
+        # those starting with the text are among the titles with the same start, or the matches if fewer
+        starting = grams.get(TITLE_START + text[:SEARCH_GRAM], [])
+        if len(text) <= SEARCH_GRAM:
+            prefixed = self.live(starting)
+        else:
+            prefixed = [position for position in min(starting, matches, key=len) if titles[position].startswith(text)]
+        if prefixed:
+            first = set(prefixed)
+            matches = prefixed + list(filterfalse(first.__contains__, matches))
+        return list(map(self.ids.__getitem__, matches))
+
+    def live(self, positions: Sequence[int]) -> list[int]:
+        # the positions of the tasks not removed
+        if len(self.positions) == len(self.titles):
+            return list(positions)
+        return list(filter(self.titles.__getitem__, positions))
+
+
 class TaskList(ctk.CTkFrame):
-    def __init__(self, parent: ttk.Frame, main_window: Tk) -> None:
+    def __init__(self, parent: ttk.Frame, main_window: Tk, store: Optional[TaskStore] = None) -> None:
         ctk.CTkFrame.__init__(self, master=parent)
         self.main_window = main_window
+        self.store = store
 
         # TASKLIST GUI COMPONENTS
         label1 = ctk.CTkLabel(self, text="Task List", font=("", 20))
         label1.pack(side="top", pady=10)
 
+        self.entry_filter = ctk.CTkEntry(self, placeholder_text="Filter tasks")
+        self.entry_filter.pack(side="top", fill="x", padx=10)
+        self.entry_filter.bind("<KeyRelease>", self.on_filter_key)
+        self.entry_filter.bind("<Escape>", self.clear_filter)
+
         self.task_list = ctk.CTkFrame(self, fg_color="transparent")
+        self.task_rows = ctk.CTkFrame(self.task_list, fg_color="transparent")
+        self.task_rows.pack(side="left", fill="both", expand=True)
+        self.task_scrollbar = ctk.CTkScrollbar(self.task_list, command=self.scroll_tasks)
+        self.bind_mouse_wheel(self.task_rows)
 
         self.tasks_by_id: dict[UUID, Task] = {}
+        self.title_index = TaskTitleIndex()
+        self.task_order: list[UUID] = []  # display order of tasks_by_id, indexed when scrolling
+        self.first_visible = 0
+        self.rows: list[TaskRow] = []
+        self.rows_shown = 0
+        self.search_index = TaskSearchIndex()
+        self.unindexed: deque[Task] = deque()  # tasks waiting for the search index, in the order added
+        self.filter_text = ""
+        self.filtered_order: Optional[list[UUID]] = None  # tasks matching filter_text, None until searched
 
         self.label_task_input = ctk.CTkLabel(self)
         self.entry_task_input = ttk.Entry(self, width=27)
 
         self.button_add_task = ctk.CTkButton(self, text="Add new task", command=self.show_task_entry_input)
         self.button_add_task.pack(side="bottom", pady=15)
+        self.button_import_tasks = ctk.CTkButton(self, text="Import tasks", command=self.show_import_dialog)
+        self.button_import_tasks.pack(side="bottom")
 
         self.button_save_task = ctk.CTkButton(self, text="Save task", command=self.save_new_task)
         self.button_clear_task = ctk.CTkButton(self, text="Clear completed", command=self.clear_completed_tasks)
         self.show_hide_clear_task_button()
 
+        if self.store is not None:
+            # load saved tasks after the first frame is drawn
+            self.after_idle(self.load_tasks)
+
+    def load_tasks(self) -> None:
+        if self.store is None:
+            return
+        for id, title, is_complete in self.store.load():
+            self.tasks_by_id[id] = Task(id=id, title=title, is_complete=is_complete)
+        self.task_order = list(self.tasks_by_id)
+        self.title_index.rebuild(self.tasks_by_id)
+        self.unindexed.extend(self.tasks_by_id.values())
+        self.after_idle(self._index_chunk)
+        self.render_tasks()
+        self.show_hide_clear_task_button()
+
+    def _index_chunk(self) -> None:
+        # adds the waiting tasks to the search index until the time budget runs out
+        deadline = time.perf_counter() + SEARCH_INDEX_CHUNK_MS / 1000
+        while self.unindexed:
+            task = self.unindexed.popleft()
+            if self.tasks_by_id.get(task.id) is task:  # not removed meanwhile
+                self.search_index.add(task)
+            if time.perf_counter() >= deadline:
+                break
+        if self.unindexed:
+            self.after_idle(self._index_chunk)
+
     def show_task_entry_input(self, event=None) -> None:
         self.button_add_task.pack_forget()
         self.label_task_input.pack_forget()
@@ -55,31 +284,9 @@ class TaskList(ctk.CTkFrame):
     def save_new_task(self, event=None) -> UUID | None:
         input_data = self.entry_task_input.get()
 
-        error = False
-
-        if not len(input_data) > 0:  # no text entered
-            self.label_task_input.configure(text="Please enter a task...", text_color="grey")
-            error = True
-        elif not len(input_data) < 100:  # text too long
-            self.label_task_input.configure(text="Task too long (max 100 chars.)", text_color="grey")
-            error = True
-        elif all(char in punctuation for char in input_data):  # only punctuation
-            self.label_task_input.configure(text="Please enter a valid task name.", text_color="grey")
-            error = True
-        elif all(char.isspace() for char in input_data):  # only whitespaces
-            self.label_task_input.configure(text="Please enter a valid task name.", text_color="grey")
-            error = True
-        elif any(task.title for task in self.tasks_by_id.values() if input_data.lower() == task.title.lower()):
-            # check for duplicates
-            self.label_task_input.configure(text="Duplicate task name.", text_color="grey")
-            error = True
-
-        if not error:
-            id = uuid4()
-            task = Task(id=id, title=input_data)
-            self.create_task_checkbutton(task)
-            self.tasks_by_id[id] = task
-            self.show_hide_clear_task_button()
+        error = self.title_error(input_data)
+        if error is None:
+            id = self.create_task(input_data)
 
             # Prevent new task creation with enter key and clear input
             self.main_window.unbind("<Return>")
@@ -93,24 +300,197 @@ class TaskList(ctk.CTkFrame):
             self.button_add_task.pack(side="bottom", pady=15)
             return id
 
+        self.label_task_input.configure(text=error, text_color="grey")
         self.label_task_input.pack(side="bottom")
         return None
 
+    def title_error(self, title: str) -> Optional[str]:
+        # Returns the error message for a title that cannot be added, or None
+        error = validate_task_title(title)
+        if error is None and self.is_duplicate_title(title):
+            error = "Duplicate task name."
+        return error
+
+    def create_task(self, title: str) -> UUID:
+        # adds a task with a valid title, saves it and scrolls to show it
+        task = Task(id=uuid4(), title=title)
+        self.add_task(task)
+        self.commit_tasks()
+        self.first_visible = len(self.visible_order()) - VISIBLE_TASKS
+        self.render_tasks()
+        self.show_hide_clear_task_button()
+        return task.id
+
+    def is_duplicate_title(self, title: str) -> bool:
+        return title in self.title_index
+
+    def add_task(self, task: Task) -> None:
+        self.tasks_by_id[task.id] = task
+        self.task_order.append(task.id)
+        self.title_index.add(task)
+        if self.unindexed:
+            self.unindexed.append(task)  # indexed after the tasks added before it
+        else:
+            self.search_index.add(task)
+        self.filtered_order = None
+        if self.store is not None:
+            self.store.add(task.id, task.title, task.is_complete)
+
+    def remove_task(self, id: UUID) -> Task:
+        return self.remove_tasks([id])[0]
+
+    def remove_tasks(self, ids: list[UUID]) -> list[Task]:
+        removed = [self.tasks_by_id.pop(id) for id in ids]
+        for task in removed:
+            self.title_index.remove(task)
+            self.search_index.remove(task)
+        # one pass over task_order, however many are removed
+        self.task_order = [id for id in self.task_order if id in self.tasks_by_id]
+        self.filtered_order = None
+        if self.store is not None:
+            self.store.remove(ids)
+        return removed
+
+    def commit_tasks(self) -> None:
+        if self.store is not None:
+            self.store.commit()
+
+    def show_import_dialog(self) -> None:
+        path = filedialog.askopenfilename(parent=self.main_window, title="Import tasks", filetypes=TASK_FILE_TYPES)
+        if path:
+            self.import_tasks(path)
+
+    def import_tasks(self, path: str | os.PathLike, on_done: Optional[Callable[[ImportReport], None]] = None) -> None:
+        # Titles are streamed from the file and added in chunks between Tk events
+        report = ImportReport()
+        self.after_idle(self._import_chunk, read_task_titles(path), report, time.perf_counter(), on_done)
+
+    def _import_chunk(
+        self,
+        titles: Iterator[str],
+        report: ImportReport,
+        started: float,
+        on_done: Optional[Callable[[ImportReport], None]],
+    ) -> None:
+        chunk_started = time.perf_counter()
+        chunk_deadline = chunk_started + IMPORT_CHUNK_MS / 1000
+        finished = True
+        try:
+            for title in titles:
+                if validate_task_title(title) is None and not self.is_duplicate_title(title):
+                    self.add_task(Task(id=uuid4(), title=title))
+                    report.imported += 1
+                else:
+                    report.skipped += 1
+                if time.perf_counter() >= chunk_deadline:
+                    finished = False
+                    break
+        except (OSError, ValueError, csv.Error) as e:
+            report.error = str(e)
+
+        self.commit_tasks()
+        self.render_tasks()
+        self.show_hide_clear_task_button()
+        report.worst_chunk_ms = max(report.worst_chunk_ms, (time.perf_counter() - chunk_started) * 1000)
+
+        if not finished:
+            self.after_idle(self._import_chunk, titles, report, started, on_done)
+            return
+
+        report.seconds = time.perf_counter() - started
+        if report.error:
+            message = "Could not import tasks from file."
+        else:
+            message = f"Imported {report.imported} tasks ({report.skipped} skipped)."
+        self.label_task_input.configure(text=message, text_color="grey")
+        self.label_task_input.pack(side="bottom")
+        if on_done:
+            on_done(report)
+
     def show_hide_clear_task_button(self) -> None:
         if len(self.tasks_by_id) > 0:
             self.button_clear_task.pack()
         else:
             self.button_clear_task.pack_forget()
 
-    def create_task_checkbutton(self, task: Task) -> None:
+    def on_filter_key(self, event=None) -> None:
+        self.filter_tasks(self.entry_filter.get())
+
+    def clear_filter(self, event=None) -> None:
+        self.entry_filter.delete(0, "end")
+        self.filter_tasks("")
+
+    def filter_tasks(self, text: str) -> None:
+        # shows only the tasks with the text in their title, all of them when it is empty
+        text = text.strip()
+        if text == self.filter_text:
+            return
+        self.filter_text = text
+        self.filtered_order = None
+        self.first_visible = 0
+        self.render_tasks()
+
+    def visible_order(self) -> list[UUID]:
+        # task_order, or the tasks matching the filter
+        if not self.filter_text:
+            return self.task_order
+        if self.filtered_order is None:
+            if self.unindexed:
+                self.filtered_order = self.scan_titles(self.filter_text)
+            else:
+                self.filtered_order = self.search_index.search(self.filter_text)
+        return self.filtered_order
+
+    def scan_titles(self, text: str) -> list[UUID]:
+        # the matches of the search index from every title, while it is still being built
+        text = TaskTitleIndex.normalize(text)
+        starting, containing = [], []
+        for id in self.task_order:
+            title = TaskTitleIndex.normalize(self.tasks_by_id[id].title)
+            if title.startswith(text):
+                starting.append(id)
+            elif text in title:
+                containing.append(id)
+        return starting + containing
+
+    def render_tasks(self) -> None:
+        # Only the visible window of tasks is bound to rows, so cost does not grow with the task count
+        order = self.visible_order()
+        total = len(order)
+        self.first_visible = max(0, min(self.first_visible, total - VISIBLE_TASKS))
+        first, last = self.first_visible, self.first_visible + VISIBLE_TASKS
+        visible_ids = order[first:last]
+        shown, pooled, visible = self.rows_shown, len(self.rows), len(visible_ids)
+
+        for row, id in zip(self.rows, visible_ids):
+            self.bind_task_row(row, self.tasks_by_id[id])
+        for id in visible_ids[pooled:]:
+            self.create_task_checkbutton(self.tasks_by_id[id])
+
+        for row in self.rows[visible:shown]:
+            self.unbind_task_row(row)
+            row.checkbox.pack_forget()
+        for row in self.rows[shown:visible]:
+            row.checkbox.pack(anchor="w", pady=5)
+        self.rows_shown = visible
+
+        if total > VISIBLE_TASKS:
+            self.task_scrollbar.pack(side="right", fill="y")
+            self.task_scrollbar.set(first / total, (first + visible) / total)
+        else:
+            self.task_scrollbar.pack_forget()
+
+        if total > 0:
+            self.task_list.pack(side="top", fill="x", pady=5)
+        else:
+            self.task_list.pack_forget()
+
+    def create_task_checkbutton(self, task: Task) -> TaskRow:
+        # Creates a new row for the pool of recycled checkboxes
         is_complete = IntVar()
-        checked = 1 if task.is_complete else 0
-        is_complete.set(checked)
         checkbox = ctk.CTkCheckBox(
-            self.task_list,
-            text=task.title,
+            self.task_rows,
             variable=is_complete,
-            command=lambda: self.toggle_task_complete(task, is_complete),
             onvalue=1,
             offvalue=0,
             corner_radius=2,
@@ -118,33 +498,70 @@ class TaskList(ctk.CTkFrame):
             border_color=("#2CC985", "#2FA572"),
         )
         checkbox._text_label.configure(wraplength=180)
+        self.bind_mouse_wheel(checkbox)
+
+        row = TaskRow(checkbox=checkbox, is_complete=is_complete)
+        self.rows.append(row)
+        self.bind_task_row(row, task)
+        return row
 
-        task.checkbox = checkbox
-        self.task_list.pack(side="top", pady=5)
-        checkbox.pack(anchor="w", pady=5)
+    def bind_task_row(self, row: TaskRow, task: Task) -> None:
+        if row.task is task:
+            return
+        self.unbind_task_row(row)
+        row.task = task
+        task.checkbox = row.checkbox
+
+        row.is_complete.set(1 if task.is_complete else 0)
+        row.checkbox.configure(
+            text=task.title,
+            text_color=COMPLETE_COLOR if task.is_complete else INCOMPLETE_COLOR,
+            command=lambda: self.toggle_task_complete(task, row.is_complete),
+        )
+
+    def unbind_task_row(self, row: TaskRow) -> None:
+        if row.task and row.task.checkbox is row.checkbox:
+            row.task.checkbox = None
+        row.task = None
+
+    def bind_mouse_wheel(self, widget: ctk.CTkBaseClass) -> None:
+        widget.bind("<MouseWheel>", self.on_mouse_wheel)  # Windows and macOS
+        widget.bind("<Button-4>", self.on_mouse_wheel)  # Linux scroll up
+        widget.bind("<Button-5>", self.on_mouse_wheel)  # Linux scroll down
+
+    def on_mouse_wheel(self, event) -> None:
+        step = -1 if event.num == 4 or event.delta > 0 else 1
+        self.scroll_tasks("scroll", step, "units")
+
+    def scroll_tasks(self, action: str, value: str | float, unit: str = "units") -> None:
+        if action == "moveto":
+            self.first_visible = round(float(value) * len(self.visible_order()))
+        elif unit == "pages":
+            self.first_visible += int(value) * VISIBLE_TASKS
+        else:
+            self.first_visible += int(value)
+        self.render_tasks()
 
     def toggle_task_complete(self, task: Task, checked: IntVar) -> None:
-        off_color = ("gray10", "#DCE4EE")
-        on_color = "gray60"
         if task.checkbox:
             (
-                task.checkbox.configure(text_color=on_color)
+                task.checkbox.configure(text_color=COMPLETE_COLOR)
                 if checked.get()
-                else task.checkbox.configure(text_color=off_color)
+                else task.checkbox.configure(text_color=INCOMPLETE_COLOR)
             )
             task.is_complete = bool(checked.get())
+            if self.store is not None:
+                self.store.set_complete(task.id, task.is_complete)
         else:
-            self.tasks_by_id.pop(task.id)
+            self.remove_task(task.id)
+        self.commit_tasks()
 
     def clear_completed_tasks(self) -> None:
         uuids = []
         for _, task in self.tasks_by_id.items():
-            if task.checkbox and task.is_complete:
+            if task.is_complete:
                 uuids.append(task.id)
-                task.checkbox.destroy()
-        for id in uuids:
-            self.tasks_by_id.pop(id)
+        self.remove_tasks(uuids)
+        self.commit_tasks()
+        self.render_tasks()
         self.show_hide_clear_task_button()
-
-        if len(self.tasks_by_id) == 0:
-            self.task_list.pack_forget()
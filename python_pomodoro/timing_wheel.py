@@ -0,0 +1,166 @@
+import math
+import time
+from typing import Callable, Hashable, Optional
+
+from .engine import Clock, PomodoroEngine
+
+"""
+Hierarchical timing wheel for large numbers of session deadlines, such as a server
+hosting the timers of a whole team.
+Deadlines are rounded up to whole ticks of `resolution` clock seconds and kept in
+`levels` wheels of `slots` buckets each: the first wheel holds the deadlines due within
+`slots` ticks, each further wheel buckets `slots` times more ticks and is cascaded
+into the wheels below as time reaches it. Scheduling and cancelling a deadline are
+O(1) dict operations, nothing runs between deadlines, and a deadline fires at most
+one tick late and never early. Deadlines further away than the wheels reach are
+parked in the last bucket of the top wheel and placed again when it is cascaded.
+SessionTimers runs PomodoroEngine sessions on a wheel, waking each only when its
+session ends instead of once per tick.
+"""
+
+Callback = Callable[[], object]
+
+
+class TimingWheel:
+    def __init__(
+        self, resolution: float = 1.0, slots: int = 64, levels: int = 4, clock: Clock = time.monotonic
+    ) -> None:
+        if slots < 2 or slots & (slots - 1):
+            raise ValueError("slots must be a power of two")
+        if levels < 2:
+            # far deadlines are parked in the top wheel, which must cascade rather than fire
+            raise ValueError("levels must be at least 2")
+        self.resolution = resolution
+        self.slots = slots
+        self.levels = levels
+        self.clock = clock
+        self.origin = clock()
+        self.now_tick = 0  # the last tick processed
+        self._bits = slots.bit_length() - 1
+        self._mask = slots - 1
+        self.wheels: list[list[dict[Hashable, tuple[int, Callback]]]] = [
+            [{} for _ in range(slots)] for _ in range(levels)
+        ]
+        self.expired: dict[Hashable, tuple[int, Callback]] = {}  # scheduled for a tick already processed
+        self.index: dict[Hashable, dict[Hashable, tuple[int, Callback]]] = {}  # key -> bucket holding it
+        # instrumentation
+        self.fired = 0
+        self.cascaded = 0
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self.index
+
+    def schedule(self, key: Hashable, at: float, callback: Callback) -> None:
+        # replaces any deadline already scheduled under the same key
+        self.cancel(key)
+        due = math.ceil((at - self.origin) / self.resolution - 1e-9)
+        self._insert(key, (due, callback))
+
+    def cancel(self, key: Hashable) -> bool:
+        bucket = self.index.pop(key, None)
+        if bucket is None:
+            return False
+        del bucket[key]
+        return True
+
+    def _insert(self, key: Hashable, entry: tuple[int, Callback]) -> None:
+        due = entry[0]
+        delta = due - self.now_tick
+        if delta <= 0:
+            bucket = self.expired
+        else:
+            for level in range(self.levels):
+                if delta < self.slots ** (level + 1):
+                    bucket = self.wheels[level][(due >> (self._bits * level)) & self._mask]
+                    break
+            else:
+                # beyond the top wheel, parked in the bucket cascaded last
+                top = self.levels - 1
+                bucket = self.wheels[top][((self.now_tick >> (self._bits * top)) - 1) & self._mask]
+        bucket[key] = entry
+        self.index[key] = bucket
+
+    def advance(self, now: Optional[float] = None) -> int:
+        # fires every deadline up to the clock time `now`, returns the number fired
+        target = math.floor(((self.clock() if now is None else now) - self.origin) / self.resolution + 1e-9)
+        fired = self._fire(self.expired)
+        while self.now_tick < target:
+            if not self.index:
+                # nothing scheduled, skip the empty ticks
+                self.now_tick = target
+                break
+            self.now_tick += 1
+            tick = self.now_tick
+            level = 1
+            while level < self.levels and tick & ((1 << (self._bits * level)) - 1) == 0:
+                self._cascade(self.wheels[level][(tick >> (self._bits * level)) & self._mask])
+                level += 1
+            # deadlines on this very tick are cascaded into expired
+            fired += self._fire(self.expired) + self._fire(self.wheels[0][tick & self._mask])
+        self.fired += fired
+        return fired
+
+    def _cascade(self, bucket: dict[Hashable, tuple[int, Callback]]) -> None:
+        entries = list(bucket.items())
+        bucket.clear()
+        self.cascaded += len(entries)
+        for key, entry in entries:
+            self._insert(key, entry)
+
+    def _fire(self, bucket: dict[Hashable, tuple[int, Callback]]) -> int:
+        if not bucket:
+            return 0
+        entries = list(bucket.items())
+        bucket.clear()
+        for key, _ in entries:
+            del self.index[key]
+        for _, (_, callback) in entries:
+            callback()
+        return len(entries)
+
+    def next_expiry(self) -> Optional[float]:
+        # clock time of the next tick with work to do, a deadline or a cascade; None when empty
+        if not self.index:
+            return None
+        if self.expired:
+            return self.origin + self.now_tick * self.resolution
+        ticks = []
+        for level in range(self.levels):
+            shift = self._bits * level
+            for step in range(1, self.slots + 1):
+                index = (self.now_tick >> shift) + step
+                if self.wheels[level][index & self._mask]:
+                    # a bucket above the first wheel is cascaded when time reaches its first tick
+                    ticks.append(index << shift)
+                    break
+        return self.origin + min(ticks) * self.resolution
+
+
+class SessionTimers:
+    def __init__(self, wheel: TimingWheel) -> None:
+        self.wheel = wheel
+
+    def start(self, engine: PomodoroEngine, on_end: Optional[Callable[[PomodoroEngine], object]] = None) -> None:
+        engine.start()
+
+        def end() -> None:
+            engine.update(-1)
+            if on_end is not None:
+                on_end(engine)
+
+        # the session ends one tick after the timer reads 00:00
+        self.wheel.schedule(engine, self.wheel.clock() + engine.delay_until(-1), end)
+
+    def pause(self, engine: PomodoroEngine) -> None:
+        engine.pause()
+        self.wheel.cancel(engine)
+
+    def cancel(self, engine: PomodoroEngine) -> None:
+        engine.stop()
+        self.wheel.cancel(engine)
+
+    def is_running(self, engine: PomodoroEngine) -> bool:
+        return engine in self.wheel
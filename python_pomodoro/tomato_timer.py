@@ -1,120 +1,116 @@
-from dataclasses import dataclass
-from enum import Enum
-from tkinter import PhotoImage, StringVar, ttk
+import time
+from collections.abc import Iterator, Mapping
+from tkinter import Event, EventType, Misc, PhotoImage, StringVar, ttk
+from typing import Optional
 
 import customtkinter as ctk
-from CTkMessagebox import CTkMessagebox as messagebox
-from playsound3 import playsound
 
-from .helpers import get_image_from_resources
+from .audio import SHORT_ALERT, get_alert_player
+from .config import TimerSettings
+from .engine import DEFAULT_CYCLES, Clock, PomodoroEngine, SessionStatus  # noqa: F401
+from .helpers import get_photo_image
+from .notification import SessionBanner
+from .render import Renderer
+from .scheduler import TickScheduler, get_scheduler
 
 """
 Handles all the timer UI components and functionality such as start/pause and
 reset buttons or drop-down list to choose the current session.
 Displays the timer as Label components with a background image, and are updated as
-the timer runs in a while loop.
-Data for text colours and defaults are stored in the SessionStatus enum as Session
-dataclasses with methods to set the time or reset the defaults.
+the timer runs. Session, cycle and countdown state lives in a headless PomodoroEngine;
+this module is a thin view over it. Each tick recomputes the remaining time from an
+absolute monotonic deadline and is rescheduled to land on the next whole-second
+boundary, so slow callbacks or event-loop stalls never accumulate drift.
+Background images are decoded on first use and shared through the resource cache,
+so the paused variants are only loaded once the timer is first paused. Alert sounds
+are played by a shared background worker that is started once the window is idle.
+When a session ends a non-modal banner asks whether to start the next one, and its
+answer is passed back into start_next_session, so the event loop never blocks. While
+it is shown Start answers it with Yes and Pause does nothing.
+Labels, the window title, styles and the background image are set through a Renderer,
+so only values that changed reach Tk: once per tick from an idle callback, or straight
+away at the end of a user action.
+The timer text has one ttk style for each session status, active and paused, created
+up front from the Session colours; changing status swaps the style name on the labels
+instead of reconfiguring a shared style that every label using it must re-resolve.
+While the window is minimized, withdrawn or fully covered the countdown stops its
+per-second updates and sleeps until the session deadline; the display is recomputed
+from the deadline as soon as the window is shown again.
+A scheduler can be passed in, e.g. one on a VirtualLoop so tests run sessions instantly.
 """
 
-DEFAULT_CYCLES = 4
-TEST_MODE = False
-
-
-@dataclass
-class Time:
-    minutes: int
-    seconds: int
-
-
-@dataclass
-class Session:
-    title: str
-    time: Time
-    default_time: Time
-    image: str
-    image_paused: str
-    foreground: str
-    background: str
-    foreground_paused: str
-    background_paused: str
-
-    def set_time(self, minutes: int) -> None:
-        self.time = Time(minutes=minutes, seconds=0)
-
-    def set_time_to_default(self) -> None:
-        self.time = self.default_time
-
-
-class SessionStatus(Enum):
-    FOCUS = Session(
-        title="Focus Time",
-        time=Time(0, 0),
-        default_time=Time(25, 0),
-        image="tomato_red_bg.png",
-        image_paused="tomato_red_dark_bg.png",
-        foreground="#ffc9c9",
-        background="#f55453",
-        foreground_paused="#ec9291",
-        background_paused="#d24847",
-    )
-    SHORT_BREAK = Session(
-        title="Short Break",
-        time=Time(0, 0),
-        default_time=Time(5, 0),
-        image="tomato_yellow_bg.png",
-        image_paused="tomato_yellow_dark_bg.png",
-        foreground="#ffecc5",
-        background="#f5c944",
-        foreground_paused="#dcbf70",
-        background_paused="#c5a237",
-    )
-    LONG_BREAK = Session(
-        title="Long Break",
-        time=Time(0, 0),
-        default_time=Time(15, 0),
-        image="tomato_green_bg.png",
-        image_paused="tomato_green_dark_bg.png",
-        foreground="#c2f8c2",
-        background="#76c776",
-        foreground_paused="#87c387",
-        background_paused="#5fa05f",
-    )
+
+def timer_text_style(status: SessionStatus, paused: bool = False) -> str:
+    # derived from TimerText.TLabel, so it inherits the font
+    return f"{status.name}{'_PAUSED' if paused else ''}.TimerText.TLabel"
+
+
+class SessionImages(Mapping[SessionStatus, PhotoImage]):
+    # Background image for each session status, loaded lazily on first lookup
+    def __init__(self, master: Misc, paused: bool = False) -> None:
+        self.master = master
+        self.paused = paused
+
+    def __getitem__(self, status: SessionStatus) -> PhotoImage:
+        session = status.value
+        return get_photo_image(session.image_paused if self.paused else session.image, self.master)
+
+    def __iter__(self) -> Iterator[SessionStatus]:
+        return iter(SessionStatus)
+
+    def __len__(self) -> int:
+        return len(SessionStatus)
 
 
 class TomatoTimer(ctk.CTkFrame):
-    def __init__(self, parent: ctk.CTkFrame, main_window: ctk.CTk) -> None:
+    def __init__(
+        self,
+        parent: ctk.CTkFrame,
+        main_window: ctk.CTk,
+        settings: Optional[TimerSettings] = None,
+        scheduler: Optional[TickScheduler] = None,
+    ) -> None:
         ctk.CTkFrame.__init__(self, master=parent)
         self.main_window = main_window
 
-        # DEFAULT STATUS & TIMES
-        self.status = SessionStatus.FOCUS
-        self.is_paused = False
+        # STATUS & TIMES, saved settings or the defaults
+        settings = settings if settings is not None else TimerSettings()
+        self.engine = PomodoroEngine(cycles=settings.cycles, durations=settings.durations())
         self.minutes = StringVar()
         self.seconds = StringVar()
-        self.cycles = DEFAULT_CYCLES
-        self.current_cycle = 1
-        for s in list(SessionStatus):
-            s.value.set_time_to_default()
+        # the countdown is run by the scheduler shared by every timer in this window, unless one is passed in
+        self.scheduler = scheduler if scheduler is not None else get_scheduler(main_window, period=self.engine.tick)
+        self.engine.clock = self.scheduler.clock  # deadlines are kept on the scheduler's clock
+        self.render = Renderer(self)
+        self.alerts = get_alert_player()
+        self.ended_at: Optional[float] = None  # perf_counter time the last session ran out, for alert latency
+        self.after_idle(self.alerts.start)
+        # seconds before the next session starts by itself, None to wait
+        self.auto_continue: Optional[int] = settings.auto_continue or None
+        self.hidden = False  # window not visible, so no per-second updates
 
         # APPEARANCE & STYLES
 
         # TODO Should be using ctk.CTkImage, but the master attribute is missing. Fails tests as image is destroyed.
         # https://github.com/TomSchimansky/CustomTkinter/discussions/2543
-        self.bg_images: dict[SessionStatus, PhotoImage] = {
-            status: PhotoImage(file=get_image_from_resources(status.value.image), master=self)
-            for status in SessionStatus
-        }
-        self.bg_images_paused: dict[SessionStatus, PhotoImage] = {
-            status: PhotoImage(file=get_image_from_resources(status.value.image_paused), master=self)
-            for status in SessionStatus
-        }
+        self.bg_images = SessionImages(self)
+        self.bg_images_paused = SessionImages(self, paused=True)
         self.styles = ttk.Style(self)
         self.styles.configure(
             "TimerText.TLabel",
             font=("", 45, "bold"),
             justify="center",
         )
+        for status in SessionStatus:
+            session = status.value
+            self.styles.configure(
+                timer_text_style(status), background=session.background, foreground=session.foreground
+            )
+            self.styles.configure(
+                timer_text_style(status, paused=True),
+                background=session.background_paused,
+                foreground=session.foreground_paused,
+            )
         self.styles.configure("OptionMenu.TMenubutton", width=16)
 
         # TIMER GUI COMPONENTS
@@ -128,11 +124,11 @@ class TomatoTimer(ctk.CTkFrame):
         )
         self.timer_background.grid(row=0, column=0, columnspan=2, padx=10, pady=15)
 
-        timer_minutes = ttk.Label(self, textvariable=self.minutes, style="TimerText.TLabel")
-        timer_minutes.grid(row=0, column=0, sticky="e", padx=10)
+        self.timer_minutes = ttk.Label(self, textvariable=self.minutes, style=timer_text_style(self.status))
+        self.timer_minutes.grid(row=0, column=0, sticky="e", padx=10)
 
-        timer_seconds = ttk.Label(self, textvariable=self.seconds, style="TimerText.TLabel")
-        timer_seconds.grid(row=0, column=1, sticky="w", padx=10)
+        self.timer_seconds = ttk.Label(self, textvariable=self.seconds, style=timer_text_style(self.status))
+        self.timer_seconds.grid(row=0, column=1, sticky="w", padx=10)
 
         self.label_cycles = ctk.CTkLabel(self, text=f"Cycle: {self.current_cycle} of {self.cycles}")
         self.label_cycles.grid(row=0, column=0, columnspan=2, sticky="s", pady=10)
@@ -158,108 +154,211 @@ class TomatoTimer(ctk.CTkFrame):
         )
         self.option_menu_session_status.grid(row=2, column=0, columnspan=2)
 
+        self.banner = SessionBanner(self)
+
+        # WINDOW VISIBILITY
+        self.main_window.bind("<Unmap>", self.on_window_map, add="+")
+        self.main_window.bind("<Map>", self.on_window_map, add="+")
+        self.bind("<Visibility>", self.on_visibility, add="+")
+
         self.set_session_time()
         self.update_styles()
+        self.render.flush()
+
+    # Session state is read from and written to the engine
+    @property
+    def status(self) -> SessionStatus:
+        return self.engine.status
+
+    @status.setter
+    def status(self, status: SessionStatus) -> None:
+        self.engine.status = status
+
+    @property
+    def is_paused(self) -> bool:
+        return self.engine.is_paused
+
+    @is_paused.setter
+    def is_paused(self, is_paused: bool) -> None:
+        self.engine.is_paused = is_paused
+
+    @property
+    def cycles(self) -> int:
+        return self.engine.cycles
+
+    @cycles.setter
+    def cycles(self, cycles: int) -> None:
+        self.engine.cycles = cycles
+
+    @property
+    def current_cycle(self) -> int:
+        return self.engine.current_cycle
+
+    @current_cycle.setter
+    def current_cycle(self, current_cycle: int) -> None:
+        self.engine.current_cycle = current_cycle
+
+    @property
+    def current_time(self) -> int:
+        return self.engine.current_time
+
+    @current_time.setter
+    def current_time(self, current_time: int) -> None:
+        self.engine.current_time = current_time
+
+    @property
+    def clock(self) -> Clock:
+        return self.engine.clock
+
+    @clock.setter
+    def clock(self, clock: Clock) -> None:
+        self.engine.clock = clock
+        self.scheduler.clock = clock
 
     def show_start_button(self) -> None:
         self.button_start.grid(row=1, column=1, sticky="w", padx=5, pady=10)
 
+    def set_title(self, title: str) -> None:
+        self.render.set("title", title, self.main_window.title)
+
+    def set_time_labels(self, mins: int, secs: int) -> None:
+        # set time and pad with zeros
+        self.render.set("minutes", "{0:02}".format(mins), self.minutes.set)
+        self.render.set("seconds", "{0:02}".format(secs), self.seconds.set)
+
+    def set_cycles_label(self) -> None:
+        text = f"Cycle: {self.current_cycle} of {self.cycles}"
+        self.render.set("cycles", text, lambda text: self.label_cycles.configure(text=text))
+
     def set_cycles(self, cycles: int) -> None:
         self.cycles = cycles
-        self.label_cycles.configure(text=f"Cycle: {self.current_cycle} of {cycles}")
+        self.set_cycles_label()
+        self.render.flush()
 
     def get_cycles(self) -> int:
         return self.cycles
 
     def set_status(self, status: SessionStatus) -> None:
-        self.status = status
+        self.engine.set_status(status)
         self.list_selection.set(self.status.value.title)
 
+    def get_session_minutes(self, status: SessionStatus) -> int:
+        return self.engine.durations[status] // 60
+
+    def set_session_minutes(self, status: SessionStatus, minutes: int) -> None:
+        # this timer only, other timers keep their own session lengths
+        self.engine.set_duration(status, minutes * 60)
+
     def set_session_time(self) -> None:
-        # set session time and pad with zeros
-        mins = self.status.value.time.minutes
-        secs = self.status.value.time.seconds
-        self.minutes.set("{0:02}".format(mins))
-        self.seconds.set("{0:02}".format(secs))
-        self.current_time = int(self.minutes.get()) * 60 + int(self.seconds.get())
+        self.engine.load_session()
+        self.set_time_labels(*divmod(self.current_time, 60))
 
     def update_styles(self, reset: bool = False) -> None:
-        if self.is_paused and reset is False:
-            self.timer_background.configure(
-                image=self.bg_images_paused[self.status], text_color=self.status.value.foreground_paused
-            )
-            self.styles.configure("TimerImage.TLabel", foreground=self.status.value.foreground_paused)
-            self.styles.configure(
-                "TimerText.TLabel",
-                background=self.status.value.background_paused,
-                foreground=self.status.value.foreground_paused,
-            )
-        else:
-            self.timer_background.configure(image=self.bg_images[self.status], text_color=self.status.value.foreground)
-            self.styles.configure("TimerImage.TLabel", foreground=self.status.value.foreground)
-            self.styles.configure(
-                "TimerText.TLabel",
-                background=self.status.value.background,
-                foreground=self.status.value.foreground,
-            )
+        session = self.status.value
+        paused = self.is_paused and reset is False
+        foreground = session.foreground_paused if paused else session.foreground
+        # the image is looked up when applied, so a paused variant is only loaded if it is shown
+        self.render.set("background_image", (self.status, paused, foreground), self.apply_background_image)
+        self.render.set("timer_text_style", timer_text_style(self.status, paused), self.apply_timer_text_style)
+
+    def apply_background_image(self, value: tuple[SessionStatus, bool, str]) -> None:
+        status, paused, foreground = value
+        image = self.bg_images_paused[status] if paused else self.bg_images[status]
+        self.timer_background.configure(image=image, text_color=foreground)
+
+    def apply_timer_text_style(self, style: str) -> None:
+        self.timer_minutes.configure(style=style)
+        self.timer_seconds.configure(style=style)
 
     def start_timer(self) -> None:
-        self.is_paused = False  # restart timer
+        if self.banner.is_shown:
+            # the session has ended: starting answers the banner, moving on to the next session
+            self.banner.respond(True)
+            return
+        self._cancel_countdown()
+        self.engine.start()  # restart timer
         self.button_start.grid_forget()
         self.update_styles()
 
         self._countdown(self.current_time)
+        self.render.flush()
 
     def _countdown(self, count: int) -> None:
-        # self.main_window.update()
-        self.current_time = count
+        count = self.engine.update(count)
 
-        if self.current_time > -1 and self.is_paused is not True:
+        if count > -1 and self.is_paused is not True and self.hidden:
+            # nothing to draw, so a single wakeup when the session ends
+            self.schedule_countdown(-1)
+        elif count > -1 and self.is_paused is not True:
             # divmod(firstvalue = temp//60, secondvalue = temp%60)
             mins, secs = divmod(count, 60)
-            # set time and pad with zero
-            self.minutes.set("{0:02}".format(mins))
-            self.seconds.set("{0:02}".format(secs))
-            self.main_window.title(f"Pomodoro - {self.status.value.title} - {self.minutes.get()}:{self.seconds.get()}")
-            # Call the countdown function recursively until timer runs out
-            ms = 5 if TEST_MODE else 1000
-
-            self.main_window.after(ms, self._countdown, count - 1)
-        else:
-            self.is_paused = True
+            self.set_time_labels(mins, secs)
+            self.set_title(f"Pomodoro - {self.status.value.title} - {mins:02}:{secs:02}")
+            # Schedule the next tick on the whole-second boundary where it falls due
+            self.schedule_countdown(count - 1)
 
-        if self.current_time == -1:
+        if count == -1:
+            self.ended_at = time.perf_counter()
             self.start_next_session()
+        # one batch of Tk updates per tick
+        self.render.flush_idle()
+
+    def on_window_map(self, event: Event) -> None:
+        # bound on the main window, which also receives the events of its child widgets
+        if event.widget is self.main_window:
+            # the main window is unmapped when it is minimized or withdrawn
+            self.set_hidden(event.type == EventType.Unmap)
+
+    def on_visibility(self, event: Event) -> None:
+        self.set_hidden(getattr(event, "state", None) == "VisibilityFullyObscured")
+
+    def set_hidden(self, hidden: bool) -> None:
+        if hidden is self.hidden:
+            return
+        self.hidden = hidden
+        if self.scheduler.is_scheduled(self):
+            # the countdown is running: switch between per-second ticks and the single wakeup
+            self._cancel_countdown()
+            self._countdown(self.engine.ticks_left())
+            self.render.flush()
+
+    def schedule_countdown(self, count: int) -> None:
+        due = self.clock() + self.engine.delay_until(count)
+        self.scheduler.schedule(self, due, lambda: self._countdown(count))
+
+    def _cancel_countdown(self) -> None:
+        self.scheduler.cancel(self)
 
     def pause_timer(self) -> None:
-        self.is_paused = True
-        self.main_window.title(f"{self.status.value.title} - Paused")
+        if self.banner.is_shown:
+            return  # the session has ended, nothing is running
+        self._cancel_countdown()
+        self.engine.pause()
+        self.set_title(f"{self.status.value.title} - Paused")
         self.show_start_button()
         self.update_styles()
+        self.render.flush()
 
     def reset_timer(self) -> None:
-        self.is_paused = True
+        self._cancel_countdown()
+        self.banner.dismiss()
+        self.engine.stop()
         self.show_start_button()
         self.set_session_time()
         self.update_styles(reset=True)
-        self.main_window.title(f"Pomodoro - {self.status.value.title}")
-
-    def start_next_session(self) -> None:
-        if self.status in [SessionStatus.SHORT_BREAK, SessionStatus.LONG_BREAK]:
-            next_session = SessionStatus.FOCUS
-            start = self.alert_session_ended(next_session)
-            # Increment cycle
-            self.current_cycle = self.current_cycle + 1 if self.current_cycle < self.cycles else 1
-        elif self.current_cycle == self.cycles:
-            next_session = SessionStatus.LONG_BREAK
-            start = self.alert_session_ended(next_session)
-        else:
-            next_session = SessionStatus.SHORT_BREAK
-            start = self.alert_session_ended(next_session)
+        self.set_title(f"Pomodoro - {self.status.value.title}")
+        self.render.flush()
+
+    def start_next_session(self, start: Optional[bool] = None) -> None:
+        if start is None:
+            # the session has just ended: ask first, the answer calls back into this method
+            self.alert_session_ended(self.engine.next_status())
+            return
+        next_session = self.engine.advance()
 
         self.set_status(next_session)
-        self.label_cycles.configure(text=f"Cycle: {self.current_cycle} of {self.cycles}")
-        self.main_window.title(f"Pomodoro - {self.status.value.title}")
+        self.set_cycles_label()
+        self.set_title(f"Pomodoro - {self.status.value.title}")
         self.show_start_button()
         self.set_session_time()
         self.update_styles(reset=True)
@@ -267,35 +366,36 @@ class TomatoTimer(ctk.CTkFrame):
         if start:
             self.start_timer()
         else:
-            self.main_window.title(f"Pomodoro - Click Start to begin {self.status.value.title}")
+            self.set_title(f"Pomodoro - Click Start to begin {self.status.value.title}")
+            self.render.flush()
 
-    def alert_session_ended(self, next_session: SessionStatus) -> bool:
-        playsound("resources/sounds/short_alert.mp3", block=False)
+    def alert_session_ended(self, next_session: SessionStatus) -> None:
+        self.alerts.play(SHORT_ALERT, requested_at=self.ended_at)
+        self.ended_at = None
         cycle_msg = (
             f"You have completed cycle {self.current_cycle} of {self.cycles}.\n"
             if self.status == SessionStatus.SHORT_BREAK
             else ""
         )
-        msg = messagebox(
-            self.main_window,
-            title=f"{self.status.value.title} has ended",
+        title = f"{self.status.value.title} has ended"
+        self.set_title(f"Pomodoro - {title}")
+        self.render.flush()
+        self.banner.show(
+            title=title,
             message=f"{cycle_msg}Would you like to start the next {next_session.value.title.lower()}?",
-            icon="question",
-            option_1="Yes",
-            option_2="No",
-            justify="center",
+            on_response=self.start_next_session,
+            auto_continue=self.auto_continue,
         )
-        response = msg.get()
-        if response == "Yes":
-            return True
-        return False
 
-    def change_session_status(self, status_var: StringVar) -> None:
-        self.is_paused = True
+    def change_session_status(self, status_var: str) -> None:
+        self._cancel_countdown()
+        self.banner.dismiss()
+        self.engine.stop()
         for status in list(SessionStatus):
             if status_var == status.value.title:
                 self.set_status(status)
-        self.main_window.title(f"Pomodoro - Start {self.status.value.title}")
+        self.set_title(f"Pomodoro - Start {self.status.value.title}")
         self.show_start_button()
         self.set_session_time()
         self.update_styles(reset=True)
+        self.render.flush()
@@ -0,0 +1,258 @@
+import math
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable, Optional
+from uuid import UUID, uuid4
+
+from .config import SettingsStore, TimerSettings
+from .engine import Clock, PomodoroEngine
+from .history import SessionHistory
+from .task_store import TaskStore
+from .task_titles import validate_task_title
+
+if TYPE_CHECKING:
+    import curses
+
+"""
+Terminal front-end for SSH and tmux sessions: python -m python_pomodoro.tui
+Runs the same PomodoroEngine session and cycle rules as the window, with the saved
+settings, the saved task list and the session history, but never imports tkinter or
+customtkinter (curses is only imported once the terminal is set up).
+Each frame is built as plain lines of text and TerminalScreen writes only the run of
+cells that changed on each line, so a tick normally rewrites one or two characters.
+The main loop blocks on the keyboard until the next tick is due, so it does not poll.
+"""
+
+VISIBLE_TASKS = 8
+TASK_KEYS = [str(number) for number in range(1, VISIBLE_TASKS + 1)]  # toggle the listed tasks
+HELP = "[space] start/pause  [r] reset  [n] next  [a] add task  [1-8] toggle  [c] clear done  [q] quit"
+
+
+class TerminalScreen:
+    def __init__(self, write: Callable[[int, int, str], object]) -> None:
+        self.write = write  # writes text at a row and column
+        self.lines: list[str] = []
+        # instrumentation
+        self.frames = 0
+        self.cells_written = 0
+
+    def draw(self, lines: list[str]) -> None:
+        for row in range(max(len(lines), len(self.lines))):
+            new = lines[row] if row < len(lines) else ""
+            old = self.lines[row] if row < len(self.lines) else ""
+            width = max(len(new), len(old))
+            new, old = new.ljust(width), old.ljust(width)
+            if new == old:
+                continue
+            # only the cells between the first and the last change are written
+            first = next(i for i in range(width) if new[i] != old[i])
+            end = next(i for i in reversed(range(width)) if new[i] != old[i]) + 1
+            self.write(row, first, new[first:end])
+            self.cells_written += end - first
+        self.lines = list(lines)
+        self.frames += 1
+
+    def invalidate(self, height: int, width: int) -> None:
+        # after the terminal was cleared, e.g. resized
+        self.lines = [" " * width] * height
+
+
+@dataclass
+class TerminalTask:
+    id: UUID
+    title: str
+    is_complete: bool = False
+
+
+class TerminalTimer:
+    def __init__(
+        self,
+        settings: Optional[TimerSettings] = None,
+        store: Optional[TaskStore] = None,
+        clock: Clock = time.monotonic,
+        tick: float = 1.0,
+    ) -> None:
+        settings = settings if settings is not None else TimerSettings()
+        self.engine = PomodoroEngine(cycles=settings.cycles, durations=settings.durations(), clock=clock, tick=tick)
+        self.store = store
+        self.tasks: list[TerminalTask] = []
+        if store is not None:
+            self.tasks = [TerminalTask(id, title, is_complete) for id, title, is_complete in store.load()]
+        self.message = ""
+        self.entry: Optional[str] = None  # text typed for a new task, None when not adding one
+        self.bell = False
+        self.quit = False
+
+    @property
+    def running(self) -> bool:
+        return self.engine.deadline is not None
+
+    def start_pause(self) -> None:
+        if self.running:
+            self.engine.pause()
+        else:
+            self.engine.start()
+        self.message = ""
+
+    def reset(self) -> None:
+        self.engine.reset()
+        self.message = ""
+
+    def next_session(self) -> None:
+        # abandon the current session and move on, like skipping in the window
+        self.engine.stop()
+        self.engine.advance()
+        self.message = f"Press space to start {self.engine.status.value.title}"
+
+    def tick(self) -> None:
+        if not self.running:
+            return
+        if self.engine.update(self.engine.ticks_left()) < 0:
+            ended = self.engine.status
+            self.engine.advance()
+            self.message = f"{ended.value.title} has ended - press space to start {self.engine.status.value.title}"
+            self.bell = True
+
+    def timeout(self) -> Optional[float]:
+        # seconds until the display next changes, None when paused
+        if not self.running:
+            return None
+        return self.engine.delay_until(self.engine.current_time - 1)
+
+    def add_task(self, title: str) -> None:
+        error = validate_task_title(title)
+        if error is None and any(task.title.casefold() == title.casefold() for task in self.tasks):
+            error = "Duplicate task name."
+        if error is not None:
+            self.message = error
+            return
+        task = TerminalTask(uuid4(), title)
+        self.tasks.append(task)
+        if self.store is not None:
+            self.store.add(task.id, task.title)
+            self.store.commit()
+        self.message = ""
+
+    def toggle_task(self, index: int) -> None:
+        if 0 <= index < min(len(self.tasks), VISIBLE_TASKS):
+            task = self.tasks[index]
+            task.is_complete = not task.is_complete
+            if self.store is not None:
+                self.store.set_complete(task.id, task.is_complete)
+                self.store.commit()
+
+    def clear_completed_tasks(self) -> None:
+        completed = [task.id for task in self.tasks if task.is_complete]
+        self.tasks = [task for task in self.tasks if not task.is_complete]
+        if self.store is not None:
+            self.store.remove(completed)
+            self.store.commit()
+
+    def handle_key(self, key: str) -> None:
+        if self.entry is not None:
+            self.handle_entry_key(self.entry, key)
+        elif key == " ":
+            self.start_pause()
+        elif key == "r":
+            self.reset()
+        elif key == "n":
+            self.next_session()
+        elif key == "a":
+            self.entry = ""
+        elif key in TASK_KEYS:
+            self.toggle_task(TASK_KEYS.index(key))
+        elif key == "c":
+            self.clear_completed_tasks()
+        elif key == "q":
+            self.quit = True
+
+    def handle_entry_key(self, entry: str, key: str) -> None:
+        if key in ("\n", "\r"):
+            self.entry = None
+            self.add_task(entry)
+        elif key == "\x1b":  # Escape
+            self.entry = None
+        elif key in ("\b", "\x7f"):
+            self.entry = entry[:-1]
+        elif key.isprintable():
+            self.entry = entry + key
+
+    def lines(self, width: int) -> list[str]:
+        engine = self.engine
+        mins, secs = divmod(max(0, engine.current_time), 60)
+        lines = [
+            f" {engine.status.value.title:<24}cycle {engine.current_cycle}/{engine.cycles}",
+            "",
+            f"   {mins:02}:{secs:02}   {'running' if self.running else 'paused '}",
+            "",
+            f" Tasks ({len(self.tasks)})",
+        ]
+        for number, task in enumerate(self.tasks[:VISIBLE_TASKS], start=1):
+            lines.append(f" {number} [{'x' if task.is_complete else ' '}] {task.title}")
+        if len(self.tasks) > VISIBLE_TASKS:
+            lines.append(f"   ... {len(self.tasks) - VISIBLE_TASKS} more")
+        lines.append("")
+        lines.append(f" New task: {self.entry}_" if self.entry is not None else f" {self.message}")
+        lines.append(f" {HELP}")
+        return [line[:width] for line in lines]
+
+
+def run(stdscr: "curses.window", timer: TerminalTimer) -> None:
+    import curses
+
+    curses.curs_set(0)
+
+    def write(row: int, column: int, text: str) -> None:
+        try:
+            stdscr.addstr(row, column, text)
+        except curses.error:
+            pass  # outside a small terminal, or the bottom right corner
+
+    screen = TerminalScreen(write)
+    while not timer.quit:
+        timer.tick()
+        height, width = stdscr.getmaxyx()
+        screen.draw(timer.lines(width - 1)[:height])
+        stdscr.refresh()
+        if timer.bell:
+            curses.beep()
+            timer.bell = False
+
+        # wait for a key, or until the next tick is due
+        delay = timer.timeout()
+        stdscr.timeout(-1 if delay is None else max(1, math.ceil(delay * 1000)))
+        read_key(stdscr, timer, screen)
+
+
+def read_key(stdscr: "curses.window", timer: TerminalTimer, screen: TerminalScreen) -> None:
+    import curses
+
+    try:
+        key = stdscr.get_wch()
+    except curses.error:
+        return  # timed out
+    if key == curses.KEY_RESIZE:
+        stdscr.clear()
+        screen.invalidate(*stdscr.getmaxyx())
+    elif key == curses.KEY_BACKSPACE:
+        timer.handle_key("\b")
+    elif isinstance(key, str):
+        timer.handle_key(key)
+
+
+def main() -> None:
+    import curses
+
+    store = TaskStore()
+    timer = TerminalTimer(SettingsStore().load(), store)
+    timer.engine.on_session_end.append(SessionHistory().append)
+    try:
+        curses.wrapper(run, timer)
+    finally:
+        # a session still running when quitting is recorded as aborted
+        timer.engine.stop()
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,5 @@
+import contextlib
+import select
 from _tkinter import TclError
 from tkinter import ttk
 from typing import Any
@@ -6,23 +8,115 @@ from uuid import uuid4
 import customtkinter as ctk
 import pytest
 from python_pomodoro.app import App
+from python_pomodoro.engine import PomodoroEngine
+from python_pomodoro.scheduler import TickScheduler, VirtualLoop
 from python_pomodoro.settings import Settings
 from python_pomodoro.tasklist import Task, TaskList
 from python_pomodoro.tomato_timer import TomatoTimer
 
 
-@pytest.fixture
-def root_window():
-    """Fixture to create a root window for the tests."""
+@pytest.fixture(autouse=True)
+def data_dir(tmp_path, monkeypatch):
+    """Keep saved tasks and history written during tests out of the user's data directory."""
+    monkeypatch.setenv("XDG_DATA_HOME", str(tmp_path / "data"))
+    return tmp_path / "data" / "python_pomodoro"
+
+
+@pytest.fixture(scope="session")
+def tk_root():
+    """One root window for the whole test session, as building a Tk root is slow."""
     root = ctk.CTk()
-    yield root
+    bindings = {sequence: root.bind(sequence) for sequence in root.bind()}
+    yield root, bindings, root.title()
     root.destroy()
 
 
+@pytest.fixture
+def root_window(tk_root):
+    """Fixture to share the root window, cleared after each test."""
+    root, bindings, title = tk_root
+    yield root
+    for child in root.winfo_children():
+        child.destroy()
+    for after_id in root.tk.splitlist(root.tk.call("after", "info")):
+        root.after_cancel(after_id)
+    for sequence in root.bind():
+        # restores the window's own bindings, dropping those added by the test's widgets
+        root.tk.call("bind", root._w, sequence, bindings.get(sequence, ""))
+    root.title(title)
+    vars(root).pop("_pomodoro_scheduler", None)  # a fresh shared scheduler for each test
+
+
+class FakeClock:
+    """Clock that only moves when a test advances it."""
+
+    def __init__(self, now: float = 0.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture
+def fake_clock():
+    return FakeClock()
+
+
+class FakeTk:
+    """Stands in for the Tcl file handlers of the Tk event loop."""
+
+    def __init__(self) -> None:
+        self.handlers: dict = {}
+
+    def createfilehandler(self, file, mask, callback) -> None:
+        self.handlers[file] = callback
+
+    def deletefilehandler(self, file) -> None:
+        del self.handlers[file]
+
+    def pump(self, timeout: float = 1.0) -> None:
+        # one pass of the event loop: run the handlers of the ready files
+        ready, _, _ = select.select(list(self.handlers), [], [], timeout)
+        for file in ready:
+            self.handlers[file](file, 2)
+
+
+class FakeRoot:
+    def __init__(self) -> None:
+        self.tk = FakeTk()
+
+    def update_idletasks(self) -> None:
+        pass
+
+
+@pytest.fixture
+def fake_root():
+    """Stands in for a Tk root window, for code that only watches files from its event loop."""
+    return FakeRoot()
+
+
+@pytest.fixture
+def virtual_loop():
+    """Event loop whose clock only moves when a test runs it."""
+    return VirtualLoop()
+
+
+@pytest.fixture
+def engine(fake_clock):
+    """Fixture to initialize a headless PomodoroEngine with default session times."""
+    return PomodoroEngine(clock=fake_clock)
+
+
 @pytest.fixture
 def app():
     """Fixture to initialize the main app object."""
-    return App()
+    app = App()
+    yield app
+    with contextlib.suppress(TclError):
+        app.close()
 
 
 @pytest.fixture
@@ -31,6 +125,13 @@ def tomato_timer(root_window):
     return TomatoTimer(parent=root_window, main_window=root_window)
 
 
+@pytest.fixture
+def virtual_timer(root_window, virtual_loop):
+    """Fixture to initialize a TomatoTimer counting down on the virtual loop, so sessions end instantly."""
+    scheduler = TickScheduler(virtual_loop, clock=virtual_loop.clock)
+    return TomatoTimer(parent=root_window, main_window=root_window, scheduler=scheduler)
+
+
 @pytest.fixture
 def settings(root_window):
     """Fixture to initialize the Settings object."""
@@ -48,7 +149,7 @@ def tasks(root_window):
     # Create a test tasks
     task1_id = uuid4()
     title = "Some task"
-    task.tasks_by_id[task1_id] = Task(id=task1_id, title=title, checkbox=ctk.CTkCheckBox(task, text=title))
+    task.add_task(Task(id=task1_id, title=title, checkbox=ctk.CTkCheckBox(task, text=title)))
 
     return task
 
@@ -21,3 +21,9 @@ def test_show_settings(app, test_functions):
     assert test_functions.test_object_is_hidden(app.settings)
     app.show_settings()
     assert bool(app.settings.pack_info) is True
+
+
+def test_settings_built_on_demand(app):
+    assert app._settings is None
+    app.show_settings()
+    assert app._settings is app.settings
@@ -0,0 +1,78 @@
+import time
+
+import pytest
+from python_pomodoro.audio import ALARM, ALERT_SOUNDS, SHORT_ALERT, AlertPlayer, get_alert_player
+
+
+class FakePlayer:
+    def __init__(self) -> None:
+        self.loads = 0
+        self.played: list[str] = []
+
+    def load(self):
+        self.loads += 1
+        return self.played.append
+
+
+@pytest.fixture
+def fake_player():
+    return FakePlayer()
+
+
+@pytest.fixture
+def alerts(fake_player):
+    player = AlertPlayer(load=fake_player.load)
+    yield player
+    player.close(timeout=1)
+
+
+def test_preloads_once_before_first_alert(alerts, fake_player):
+    alerts.start()
+    assert alerts.ready.wait(timeout=1)
+    assert fake_player.loads == 1
+    assert set(alerts.paths) == set(ALERT_SOUNDS)
+    assert alerts.paths[SHORT_ALERT].endswith(SHORT_ALERT)
+
+
+def test_alerts_played_in_order_by_one_worker(alerts, fake_player):
+    alerts.play(SHORT_ALERT)
+    alerts.play(ALARM)
+    alerts.play(SHORT_ALERT)
+    alerts.close(timeout=1)
+
+    assert fake_player.loads == 1
+    assert fake_player.played == [alerts.paths[SHORT_ALERT], alerts.paths[ALARM], alerts.paths[SHORT_ALERT]]
+
+
+def test_alerts_played_after_close(alerts, fake_player):
+    alerts.play(SHORT_ALERT)
+    alerts.close(timeout=1)
+    alerts.play(ALARM)
+    alerts.close(timeout=1)
+
+    assert fake_player.played == [alerts.paths[SHORT_ALERT], alerts.paths[ALARM]]
+
+
+def test_latency_measured_from_request(alerts):
+    requested_at = time.perf_counter() - 0.5
+    alerts.play(SHORT_ALERT, requested_at=requested_at)
+    alerts.close(timeout=1)
+
+    assert len(alerts.latencies) == 1
+    assert alerts.latencies[0] >= 0.5
+
+
+def test_missing_backend_keeps_worker_running():
+    def no_backend():
+        raise RuntimeError("No supported audio backends on this system!")
+
+    alerts = AlertPlayer(load=no_backend)
+    alerts.play(SHORT_ALERT)
+    alerts.close(timeout=1)
+
+    assert len(alerts.errors) == 1
+    assert len(alerts.latencies) == 0
+
+
+def test_alert_player_shared():
+    assert get_alert_player() is get_alert_player()
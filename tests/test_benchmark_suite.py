@@ -0,0 +1,52 @@
+import pytest
+from benchmarks.suite import BENCHMARKS, change, compare, load_baseline, save_baseline
+
+
+@pytest.mark.parametrize(
+    "metric, baseline, current, expected",
+    [
+        ("tick_us", 10.0, 15.0, 0.5),  # slower
+        ("save_ms_1000", 10.0, 5.0, -0.5),  # faster
+        ("transitions_per_second", 100.0, 50.0, 0.5),  # fewer
+        ("numpy_imported", 0.0, 1.0, float("inf")),  # no longer deferred
+        ("numpy_imported", 0.0, 0.0, 0.0),
+        ("cells_per_tick", 2.0, 4.0, None),  # not a timing
+    ],
+)
+def test_change_is_positive_when_worse(metric, baseline, current, expected):
+    assert change(metric, baseline, current) == expected
+
+
+def test_compare_flags_regressions_beyond_threshold():
+    baseline = {"timer": {"tick_us": 10.0, "transition_ms": 2.0}, "engine": {"transitions_per_second": 1000.0}}
+    results = {
+        "timer": {"tick_us": 11.0, "transition_ms": 3.0, "new_ms": 1.0},
+        "engine": {"transitions_per_second": 500.0},
+        "settings": {"open_ms": 5.0},
+    }
+    assert compare(baseline, results, threshold=0.25) == ["timer.transition_ms", "engine.transitions_per_second"]
+    assert compare(baseline, results, threshold=1.0) == []
+
+
+def test_compare_flags_missing_results():
+    # a benchmark that started failing has no results, one skipped without a display is not expected to
+    baseline = {"timer": {"tick_us": 10.0}, "settings": {"open_ms": 5.0}, "engine": {"transitions_per_second": 1.0}}
+    results = {"engine": {}}
+    assert compare(baseline, results, skipped=["settings"]) == ["timer.tick_us", "engine.transitions_per_second"]
+
+
+def test_baseline_round_trip(tmp_path):
+    results = {"timer": {"tick_us": 10.0}}
+    save_baseline(results, tmp_path / "baseline.json")
+    baseline = load_baseline(tmp_path / "baseline.json")
+    assert baseline["results"] == results
+    assert {"created", "python", "platform"} <= set(baseline)
+
+
+def test_baseline_renamed_benchmarks(tmp_path):
+    save_baseline({"stats_import": {"import_ms": 10.0}}, tmp_path / "baseline.json")
+    assert load_baseline(tmp_path / "baseline.json")["results"] == {"task_import": {"import_ms": 10.0}}
+
+
+def test_benchmark_names_are_unique():
+    assert len({benchmark.name for benchmark in BENCHMARKS}) == len(BENCHMARKS)
@@ -0,0 +1,78 @@
+import json
+from time import perf_counter
+from unittest.mock import patch
+
+import pytest
+from python_pomodoro.config import SETTINGS_FILE, SettingsStore, TimerSettings
+from python_pomodoro.engine import DEFAULT_CYCLES, SessionStatus
+
+LOAD_BUDGET_SECONDS = 0.005
+
+
+@pytest.fixture
+def store(tmp_path):
+    return SettingsStore(tmp_path / SETTINGS_FILE)
+
+
+def test_default_path_in_data_dir(data_dir):
+    assert SettingsStore().path == data_dir / SETTINGS_FILE
+
+
+def test_missing_file_loads_defaults(store):
+    settings = store.load()
+    assert settings == TimerSettings()
+    assert settings.focus == SessionStatus.FOCUS.value.default_time.minutes
+    assert settings.cycles == DEFAULT_CYCLES
+
+
+def test_save_and_load(store):
+    store.save(TimerSettings(focus=50, short_break=10, long_break=30, cycles=2, auto_continue=15))
+    assert store.load() == TimerSettings(focus=50, short_break=10, long_break=30, cycles=2, auto_continue=15)
+
+
+def test_save_replaces_file_atomically(store, tmp_path):
+    store.save(TimerSettings(focus=30))
+
+    # a failure while writing leaves the previous file in place and no temporary file behind
+    with patch("python_pomodoro.config.json.dump", side_effect=OSError("disk full")), pytest.raises(OSError):
+        store.save(TimerSettings(focus=45))
+
+    assert store.load().focus == 30
+    assert [path.name for path in tmp_path.iterdir()] == [SETTINGS_FILE]
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        "",
+        "{not json",
+        "[25, 5, 15, 4]",
+        '{"focus": "50"}',
+        "\x00\xff\xfe",
+    ],
+)
+def test_corrupt_file_loads_defaults(store, content):
+    with open(store.path, "w", encoding="latin-1") as file:
+        file.write(content)
+    assert store.load() == TimerSettings()
+
+
+def test_invalid_values_fall_back_to_defaults(store):
+    with open(store.path, "w") as file:
+        values = {"focus": 0, "short_break": 7, "long_break": True, "cycles": 11, "auto_continue": -5, "unknown": 1}
+        json.dump(values, file)
+
+    assert store.load() == TimerSettings(short_break=7)
+
+
+def test_load_is_fast(store):
+    store.save(TimerSettings(focus=40))
+    start = perf_counter()
+    for _ in range(100):
+        store.load()
+    assert (perf_counter() - start) / 100 < LOAD_BUDGET_SECONDS
+
+
+def test_durations():
+    durations = TimerSettings(focus=40, short_break=8, long_break=20).durations()
+    assert durations == {SessionStatus.FOCUS: 2400, SessionStatus.SHORT_BREAK: 480, SessionStatus.LONG_BREAK: 1200}
@@ -0,0 +1,134 @@
+import json
+import select
+import socket
+import threading
+
+import pytest
+from python_pomodoro.control import AppControl, ControlServer, send_command
+
+
+@pytest.fixture
+def server(tmp_path, fake_root):
+    handled = []
+
+    def handle(request):
+        if request["op"] == "fail":
+            raise ValueError("failed")
+        if request["op"] == "crash":
+            raise TypeError("crashed")
+        handled.append(request)
+        return {"handled": len(handled)}
+
+    server = ControlServer(fake_root, handle, str(tmp_path / "control.sock"))
+    assert server.start() is True
+    yield server
+    server.close()
+
+
+def request(server, client, *requests) -> list:
+    client.sendall(b"".join(json.dumps(request).encode() + b"\n" for request in requests))
+    received = b""
+    while received.count(b"\n") < len(requests):
+        server.root.tk.pump()
+        if select.select([client], [], [], 0)[0]:
+            received += client.recv(65536)
+    return [json.loads(line) for line in received.splitlines()]
+
+
+def test_commands_answered_in_order(server):
+    with socket.socket(socket.AF_UNIX) as client:
+        client.connect(server.path)
+        responses = request(
+            server, client, {"op": "start", "id": 1}, {"op": "fail", "id": 2}, [], {"op": "crash", "id": 4}
+        )
+
+    assert responses == [
+        {"ok": True, "handled": 1, "id": 1},
+        {"ok": False, "error": "failed", "id": 2},
+        {"ok": False, "error": "request must be a JSON object"},
+        {"ok": False, "error": "TypeError: crashed", "id": 4},
+    ]
+    assert server.commands == 4
+
+
+def test_partial_line_buffered(server):
+    with socket.socket(socket.AF_UNIX) as client:
+        client.connect(server.path)
+        client.sendall(b'{"op": "st')
+        server.root.tk.pump()  # accept
+        server.root.tk.pump()  # half a request, nothing to answer
+        assert select.select([client], [], [], 0.05)[0] == []
+        assert request(server, client, {"op": "art"})  # completes the first line
+        assert server.handle_times
+
+
+def test_closed_connection_dropped(server):
+    client = socket.socket(socket.AF_UNIX)
+    client.connect(server.path)
+    server.root.tk.pump()
+    assert len(server.buffers) == 1
+    client.close()
+    server.root.tk.pump()
+    assert server.buffers == {}
+
+
+def test_second_instance_does_not_take_over(server):
+    other = ControlServer(server.root, lambda request: {}, server.path)
+    assert other.start() is False
+
+
+def test_stale_socket_replaced(tmp_path, fake_root):
+    path = str(tmp_path / "control.sock")
+    stale = socket.socket(socket.AF_UNIX)
+    stale.bind(path)
+    stale.close()  # the file is left behind
+
+    server = ControlServer(fake_root, lambda request: {}, path)
+    assert server.start() is True
+    server.close()
+
+
+def test_send_command_times_out(tmp_path):
+    # an app that accepts the connection but never answers
+    path = str(tmp_path / "control.sock")
+    with socket.socket(socket.AF_UNIX) as listener:
+        listener.bind(path)
+        listener.listen()
+        with pytest.raises(TimeoutError):
+            send_command({"op": "state"}, path, timeout=0.05)
+
+
+def test_app_control(app, tmp_path):
+    control = AppControl(app)
+    state = control.handle({"op": "start"})
+    assert state["running"] is True
+
+    assert control.handle({"op": "session", "status": "SHORT_BREAK"})["status"] == "SHORT_BREAK"
+    assert control.handle({"op": "add_task", "title": "Write report"})["tasks"] == 1
+    with pytest.raises(ValueError, match="Duplicate task name."):
+        control.handle({"op": "add_task", "title": "write report"})
+    with pytest.raises(ValueError, match="unknown op"):
+        control.handle({"op": "fly"})
+    assert control.handle({"op": "instrumentation"})["instrumentation"] is None
+
+
+def test_send_command_round_trip(app, tmp_path):
+    path = str(tmp_path / "control.sock")
+    server = ControlServer(app, AppControl(app).handle, path)
+    assert server.start() is True
+    responses = []
+    client = threading.Thread(target=lambda: responses.append(send_command({"op": "start"}, path)))
+
+    def wait_for_client():
+        if client.is_alive():
+            app.after(5, wait_for_client)
+        else:
+            app.quit()
+
+    client.start()
+    app.after(5, wait_for_client)
+    app.mainloop()
+    server.close()
+
+    assert responses[0]["ok"] is True
+    assert responses[0]["running"] is True
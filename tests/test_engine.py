@@ -0,0 +1,175 @@
+import subprocess
+import sys
+from dataclasses import FrozenInstanceError
+
+import pytest
+from python_pomodoro.config import TimerSettings
+from python_pomodoro.engine import (
+    DEFAULT_CYCLES,
+    Outcome,
+    PomodoroEngine,
+    SessionRecord,
+    SessionStatus,
+    Time,
+)
+
+
+def test_engine_initialization(engine):
+    assert engine.status == SessionStatus.FOCUS
+    assert engine.cycles == DEFAULT_CYCLES
+    assert engine.current_cycle == 1
+    assert engine.current_time == 25 * 60
+    assert engine.deadline is None
+
+
+def test_default_durations_match_settings(engine):
+    # the enum only holds the defaults, which TimerSettings starts from too
+    assert engine.durations == TimerSettings().durations()
+    with pytest.raises(FrozenInstanceError):
+        SessionStatus.FOCUS.value.default_time = Time(1, 0)
+
+
+def test_engine_does_not_import_tk():
+    code = "import sys, python_pomodoro.engine; sys.exit('tkinter' in sys.modules or 'customtkinter' in sys.modules)"
+    assert subprocess.run([sys.executable, "-c", code]).returncode == 0
+
+
+def test_start_sets_deadline(engine, fake_clock):
+    fake_clock.advance(100)
+    engine.start()
+
+    assert engine.is_paused is False
+    assert engine.deadline == 100 + 25 * 60
+
+
+def test_update_recomputes_from_deadline(engine, fake_clock):
+    engine.start()
+
+    fake_clock.advance(1)
+    assert engine.update(engine.current_time - 1) == 25 * 60 - 1
+
+    # a callback running 10.5 seconds late skips ahead instead of drifting
+    fake_clock.advance(10.5)
+    assert engine.update(engine.current_time - 1) == 25 * 60 - 11
+    assert engine.delay_until(engine.current_time - 1) == pytest.approx(0.5)
+
+
+def test_update_ends_session(engine, fake_clock):
+    engine.start()
+    fake_clock.advance(25 * 60 + 1)
+
+    assert engine.update(0) == -1
+    assert engine.is_paused is True
+    assert engine.deadline is None
+
+
+def test_pause_and_resume(engine, fake_clock):
+    engine.start()
+    fake_clock.advance(60.4)
+    engine.pause()
+
+    assert engine.is_paused is True
+    assert engine.current_time == 24 * 60
+
+    # time spent paused does not count
+    fake_clock.advance(500)
+    engine.start()
+    assert engine.ticks_left() == 24 * 60
+
+
+def test_reset(engine, fake_clock):
+    engine.start()
+    fake_clock.advance(90)
+    engine.reset()
+
+    assert engine.is_paused is True
+    assert engine.current_time == 25 * 60
+
+
+@pytest.mark.parametrize(
+    "status, cycle, expected_status, expected_cycle",
+    [
+        (SessionStatus.FOCUS, 1, SessionStatus.SHORT_BREAK, 1),
+        (SessionStatus.FOCUS, 4, SessionStatus.LONG_BREAK, 4),
+        (SessionStatus.SHORT_BREAK, 1, SessionStatus.FOCUS, 2),
+        (SessionStatus.LONG_BREAK, 4, SessionStatus.FOCUS, 1),
+    ],
+)
+def test_advance(engine, status, cycle, expected_status, expected_cycle):
+    engine.set_status(status)
+    engine.current_cycle = cycle
+
+    assert engine.next_status() == expected_status
+    assert engine.advance() == expected_status
+    assert engine.status == expected_status
+    assert engine.current_cycle == expected_cycle
+    assert engine.current_time == expected_status.value.default_time.minutes * 60
+
+
+def test_full_rotation(engine, fake_clock):
+    statuses = []
+    for _ in range(2 * DEFAULT_CYCLES):
+        engine.start()
+        fake_clock.advance(engine.current_time + 1)
+        assert engine.update(engine.current_time) == -1
+        statuses.append(engine.advance())
+
+    short, long, focus = SessionStatus.SHORT_BREAK, SessionStatus.LONG_BREAK, SessionStatus.FOCUS
+    assert statuses == [short, focus, short, focus, short, focus, long, focus]
+    assert engine.current_cycle == 1
+
+
+def test_custom_tick_length(fake_clock):
+    engine = PomodoroEngine(clock=fake_clock, tick=0.005)
+    engine.start()
+    fake_clock.advance(0.0125)
+
+    assert engine.ticks_left() == engine.current_time - 2
+
+
+@pytest.fixture
+def records(engine):
+    records = []
+    engine.wall_clock = lambda: 1_700_000_000.5
+    engine.on_session_end.append(records.append)
+    return records
+
+
+def test_completed_session_is_recorded(engine, fake_clock, records):
+    engine.start()
+    fake_clock.advance(25 * 60 + 1)
+    engine.update(-1)
+
+    assert records == [SessionRecord(1_700_000_000, 1500, 1500, Outcome.COMPLETED, SessionStatus.FOCUS, 1)]
+
+
+def test_aborted_session_is_recorded(engine, fake_clock, records):
+    engine.start()
+    fake_clock.advance(60)
+    engine.pause()
+
+    assert records == []  # pausing does not end the session
+
+    fake_clock.advance(600)
+    engine.start()
+    fake_clock.advance(30)
+    engine.stop()
+
+    assert records == [SessionRecord(1_700_000_000, 1500, 90, Outcome.ABORTED, SessionStatus.FOCUS, 1)]
+
+
+def test_changing_status_aborts_session(engine, fake_clock, records):
+    engine.start()
+    fake_clock.advance(10)
+    engine.set_status(SessionStatus.LONG_BREAK)
+
+    assert [record.outcome for record in records] == [Outcome.ABORTED]
+    assert records[0].status == SessionStatus.FOCUS
+
+
+def test_unstarted_session_is_not_recorded(engine, records):
+    engine.stop()
+    engine.advance()
+    engine.reset()
+
+    assert records == []
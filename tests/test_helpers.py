@@ -0,0 +1,44 @@
+import base64
+
+from python_pomodoro.engine import SessionStatus
+from python_pomodoro.helpers import (
+    RESOURCES,
+    get_data_dir,
+    get_image_data,
+    get_image_from_resources,
+    get_photo_image,
+    get_resource_path,
+    get_sound_from_resources,
+)
+
+
+def test_resources_found_relative_to_package(monkeypatch, tmp_path):
+    # does not depend on the current working directory
+    monkeypatch.chdir(tmp_path)
+    for status in SessionStatus:
+        assert get_resource_path("images", status.value.image).is_file()
+        assert get_resource_path("images", status.value.image_paused).is_file()
+    assert get_resource_path("sounds", "short_alert.mp3").is_file()
+
+
+def test_resource_paths_are_cached():
+    assert get_resource_path("images", "tomato_red_bg.png") is get_resource_path("images", "tomato_red_bg.png")
+    assert get_image_from_resources("tomato_red_bg.png") == str(get_resource_path("images", "tomato_red_bg.png"))
+    assert get_sound_from_resources("alarm.mp3").endswith("alarm.mp3")
+
+
+def test_image_data_is_cached():
+    data = get_image_data("tomato_red_bg.png")
+    assert get_image_data("tomato_red_bg.png") is data
+    assert base64.b64decode(data) == RESOURCES.joinpath("images", "tomato_red_bg.png").read_bytes()
+
+
+def test_photo_image_shared_per_root(root_window):
+    image = get_photo_image("tomato_red_bg.png", root_window)
+    assert get_photo_image("tomato_red_bg.png", root_window) is image
+    assert image.width() > 0
+
+
+def test_data_dir_created(data_dir):
+    assert get_data_dir() == data_dir
+    assert data_dir.is_dir()
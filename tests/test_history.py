@@ -0,0 +1,68 @@
+import pytest
+from python_pomodoro.engine import Outcome, SessionRecord, SessionStatus
+from python_pomodoro.history import HISTORY_FILE, HISTORY_HEADER, RECORD, SessionHistory
+
+RECORDS = [
+    SessionRecord(1_700_000_000, 1500, 1500, Outcome.COMPLETED, SessionStatus.FOCUS, 1),
+    SessionRecord(1_700_001_600, 300, 120, Outcome.ABORTED, SessionStatus.SHORT_BREAK, 1),
+    SessionRecord(1_700_003_000, 900, 900, Outcome.COMPLETED, SessionStatus.LONG_BREAK, 4),
+]
+
+
+@pytest.fixture
+def history(tmp_path):
+    return SessionHistory(tmp_path / HISTORY_FILE)
+
+
+def test_empty_history(history):
+    assert len(history) == 0
+    assert history.records() == []
+
+
+def test_default_path_in_data_dir(data_dir):
+    assert SessionHistory().path == data_dir / HISTORY_FILE
+
+
+def test_append_and_read(history):
+    for record in RECORDS:
+        history.append(record)
+
+    assert len(history) == 3
+    assert history.records() == RECORDS
+    # a few bytes per record
+    assert RECORD.size == 10
+    assert history.path.stat().st_size == len(HISTORY_HEADER) + 3 * RECORD.size
+
+
+def test_buffer_scans_records_in_place(history):
+    for record in RECORDS:
+        history.append(record)
+
+    with history.buffer() as view:
+        focus_seconds = sum(actual for _, _, actual, flags, _ in RECORD.iter_unpack(view) if flags & 0x0F == 0)
+    assert focus_seconds == 1500
+
+
+def test_partial_record_is_dropped(history):
+    history.append(RECORDS[0])
+    with open(history.path, "ab") as file:
+        file.write(b"\x01\x02\x03")  # crashed half way through a write
+
+    assert len(history) == 1
+    history.append(RECORDS[1])
+    assert history.records() == RECORDS[:2]
+
+
+def test_partial_header_is_rewritten(history):
+    history.path.write_bytes(HISTORY_HEADER[:3])  # crashed while writing the header
+
+    assert len(history) == 0
+    history.append(RECORDS[0])
+    assert history.records() == RECORDS[:1]
+
+
+def test_not_a_history_file(history):
+    history.path.write_bytes(b"something else entirely")
+
+    with pytest.raises(ValueError):
+        history.records()
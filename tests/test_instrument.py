@@ -0,0 +1,116 @@
+import json
+import os
+import signal
+import time
+
+import pytest
+from python_pomodoro.instrument import BUCKETS, Histogram, Instruments, instrumentation_enabled
+
+
+class Widget:
+    def tick(self, seconds: float = 0.0) -> str:
+        time.sleep(seconds)
+        return "ticked"
+
+
+@pytest.fixture
+def instruments():
+    instruments = Instruments()
+    yield instruments
+    instruments.unwrap_all()
+    instruments.restore_signal()
+
+
+@pytest.mark.parametrize("value, enabled", [(None, False), ("", False), ("0", False), ("1", True)])
+def test_instrumentation_enabled(monkeypatch, value, enabled):
+    if value is None:
+        monkeypatch.delenv("POMODORO_INSTRUMENT", raising=False)
+    else:
+        monkeypatch.setenv("POMODORO_INSTRUMENT", value)
+    assert instrumentation_enabled() is enabled
+
+
+def test_histogram_buckets_and_percentiles():
+    histogram = Histogram()
+    for _ in range(99):
+        histogram.record(0.000_003)  # 3 us, under 4 us
+    histogram.record(0.5)
+
+    assert histogram.counts[2] == 99
+    assert histogram.counts[19] == 1  # 500,000 us, under 2**19
+    assert histogram.count == 100
+    assert histogram.percentile(50) == pytest.approx(0.000_004)
+    assert histogram.percentile(99) == pytest.approx(0.000_004)
+    assert histogram.percentile(100) == 0.5  # capped at the slowest call
+
+    summary = histogram.to_dict()
+    assert summary["count"] == 100
+    assert summary["max_ms"] == pytest.approx(500)
+    assert summary["buckets_us"] == {"4": 99, str(2**19): 1}
+
+
+def test_histogram_keeps_slow_calls_in_last_bucket():
+    histogram = Histogram()
+    histogram.record(3600.0)
+    assert histogram.counts[BUCKETS] == 1
+    assert histogram.percentile(99) == 3600.0
+    assert histogram.to_dict()["buckets_us"] == {"inf": 1}
+    assert Histogram().percentile(50) == 0.0
+
+
+def test_wrap_times_calls_and_unwrap_restores(instruments):
+    original = Widget.tick
+    instruments.wrap_all({Widget: ("tick",)})
+    instruments.wrap(Widget, "tick")  # wrapping twice keeps a single timer
+    assert Widget.tick is not original
+    assert Widget.tick.__name__ == "tick"
+
+    assert Widget().tick(0.002) == "ticked"
+    Widget().tick()
+    histogram = instruments.histograms["Widget.tick"]
+    assert histogram.count == 2
+    assert histogram.max >= 0.002
+
+    instruments.unwrap_all()
+    assert Widget.tick is original
+
+
+def test_wrap_records_calls_that_raise(instruments):
+    instruments.wrap(Widget, "tick")
+    with pytest.raises(ValueError):
+        Widget().tick(-1)
+    assert instruments.histograms["Widget.tick"].count == 1
+
+
+def test_dump_writes_json(instruments, tmp_path, data_dir):
+    instruments.wrap(Widget, "tick")
+    Widget().tick()
+
+    instruments.dump(tmp_path / "out.json")
+    assert json.loads((tmp_path / "out.json").read_text())["Widget.tick"]["count"] == 1
+
+    data_dir.mkdir(parents=True)
+    instruments.dump()
+    assert json.loads((data_dir / "instrumentation.json").read_text()) == instruments.to_dict()
+
+
+@pytest.mark.skipif(not hasattr(signal, "SIGUSR1"), reason="needs SIGUSR1")
+def test_dump_on_signal(instruments, data_dir, fake_root):
+    data_dir.mkdir(parents=True)
+    root = fake_root
+    previous = signal.getsignal(signal.SIGUSR1)
+    try:
+        assert instruments.dump_on_signal(root) is True
+        os.kill(os.getpid(), signal.SIGUSR1)
+        assert (data_dir / "instrumentation.json").exists()
+        # the signal woke the file handler watched by the Tk event loop
+        [(read_fd, callback)] = root.tk.handlers.items()
+        callback(read_fd, 2)
+    finally:
+        instruments.restore_signal()
+
+    assert signal.getsignal(signal.SIGUSR1) is previous
+    assert signal.set_wakeup_fd(-1) == -1
+    assert root.tk.handlers == {}
+    with pytest.raises(OSError):
+        os.fstat(read_fd)
@@ -0,0 +1,72 @@
+from python_pomodoro.render import Renderer
+
+
+class FakeScheduler:
+    def __init__(self) -> None:
+        self.idle: list = []
+
+    def after_idle(self, func):
+        self.idle.append(func)
+        return f"after#{len(self.idle)}"
+
+    def run_idle(self) -> None:
+        idle, self.idle = self.idle, []
+        for func in idle:
+            func()
+
+
+def test_only_changed_values_applied():
+    applied = []
+    render = Renderer(FakeScheduler())
+
+    render.set("title", "Focus", applied.append)
+    render.flush()
+    render.set("title", "Focus", applied.append)
+    render.flush()
+    render.set("title", "Break", applied.append)
+    render.flush()
+
+    assert applied == ["Focus", "Break"]
+    assert render.tk_calls == 2
+    assert render.saved_calls == 1
+
+
+def test_changes_coalesced_into_one_idle_flush():
+    scheduler = FakeScheduler()
+    applied = []
+    render = Renderer(scheduler)
+
+    for seconds in ("03", "02", "01"):
+        render.set("seconds", seconds, applied.append)
+        render.flush_idle()
+    assert applied == []
+    assert len(scheduler.idle) == 1
+
+    scheduler.run_idle()
+    assert applied == ["01"]
+    assert render.flushes == 1
+    assert list(render.calls_per_flush) == [1]
+
+
+def test_change_reverted_before_flush_is_dropped():
+    applied = []
+    render = Renderer(FakeScheduler())
+    render.set("image", "active", applied.append)
+    render.flush()
+
+    render.set("image", "paused", applied.append)
+    render.set("image", "active", applied.append)
+    render.flush()
+
+    assert applied == ["active"]
+    assert render.flushes == 1
+
+
+def test_empty_flush_not_counted():
+    scheduler = FakeScheduler()
+    render = Renderer(scheduler)
+    render.flush_idle()
+    render.flush()
+
+    assert scheduler.idle == []
+    assert render.flushes == 0
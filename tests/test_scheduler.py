@@ -0,0 +1,78 @@
+import pytest
+from python_pomodoro.scheduler import TickScheduler, VirtualLoop, get_scheduler
+
+
+def ticking(scheduler: TickScheduler, key: str, ticks: int, log: list) -> None:
+    # a timer that asks to be called back once per second, `ticks` times
+    def tick(n: int) -> None:
+        log.append((key, scheduler.clock()))
+        if n > 1:
+            scheduler.schedule(key, scheduler.clock() + 1.0, lambda: tick(n - 1))
+
+    scheduler.schedule(key, scheduler.clock() + 1.0, lambda: tick(ticks))
+
+
+def test_timers_share_one_wakeup_per_tick(virtual_loop):
+    loop = virtual_loop
+    scheduler = TickScheduler(loop, period=1.0, clock=loop.clock)
+    log: list = []
+
+    for n in range(100):
+        loop.now = n * 0.001  # timers started at slightly different moments
+        ticking(scheduler, f"timer{n}", 10, log)
+    loop.run()
+
+    assert len(log) == 1000
+    # the grid follows the first timer, the others wake with it one tick late
+    assert scheduler.wakeups == 11
+    assert scheduler.callbacks == 1000
+    assert all(at == int(at) for _, at in log)
+
+
+def test_lone_timer_woken_when_due(virtual_loop):
+    loop = virtual_loop
+    scheduler = TickScheduler(loop, period=1.0, clock=loop.clock)
+    ran = []
+
+    loop.now = 0.25
+    scheduler.schedule("timer", 3.7, lambda: ran.append(loop.now))
+    loop.run()
+
+    assert ran == [pytest.approx(3.7)]
+    assert loop.calls == 1
+
+
+def test_cancel(virtual_loop):
+    loop = virtual_loop
+    scheduler = TickScheduler(loop, period=1.0, clock=loop.clock)
+    ran = []
+
+    scheduler.schedule("first", 1.0, lambda: ran.append("first"))
+    scheduler.schedule("second", 2.0, lambda: ran.append("second"))
+    scheduler.cancel("first")
+    assert not scheduler.is_scheduled("first")
+    loop.run()
+
+    assert ran == ["second"]
+    scheduler.cancel("second")  # nothing scheduled, nothing to cancel
+    assert loop.cancelled == {"after#1"}
+
+
+def test_scheduler_kept_on_root(virtual_loop):
+    assert get_scheduler(virtual_loop) is get_scheduler(virtual_loop)
+    assert get_scheduler(VirtualLoop()) is not get_scheduler(virtual_loop)
+
+
+def test_virtual_loop_runs_callbacks_as_its_clock_advances():
+    loop = VirtualLoop()
+    ran = []
+    loop.after(1500, lambda: ran.append(loop.now))
+    loop.after_cancel(loop.after(500, lambda: ran.append("cancelled")))
+
+    loop.advance(1.0)
+    assert ran == []
+    assert loop.now == 1.0
+
+    loop.advance(1.0)
+    assert ran == [1.5]
+    assert loop.now == 2.0
@@ -0,0 +1,160 @@
+import asyncio
+import json
+import subprocess
+import sys
+import time
+
+import pytest
+from python_pomodoro.service import Client, PomodoroService
+
+
+class FakeWriter:
+    def __init__(self) -> None:
+        self.messages: list = []
+
+    def write(self, data: bytes) -> None:
+        self.messages.append(json.loads(data))
+
+    def is_closing(self) -> bool:
+        return False
+
+
+@pytest.fixture
+def service(fake_clock):
+    return PomodoroService(clock=fake_clock)
+
+
+@pytest.fixture
+def client():
+    return Client(FakeWriter())
+
+
+def run_for(service, clock, seconds: int) -> None:
+    for _ in range(seconds):
+        clock.advance(1.0)
+        service.timers.wheel.advance()
+
+
+def test_session_rotation_pushed_to_subscribers(service, client, fake_clock):
+    service.handle({"op": "create", "session": "alice", "settings": {"focus": 5}, "auto_continue": True}, client)
+    service.handle({"op": "subscribe", "session": "alice"}, client)
+    state = service.handle({"op": "start", "session": "alice"}, client)
+    assert state["status"] == "FOCUS"
+    assert state["running"] is True
+
+    run_for(service, fake_clock, 5 * 60 + 1)
+
+    event = client.writer.messages[-1]
+    assert event["event"] == "transition"
+    assert (event["ended"], event["status"], event["started"]) == ("FOCUS", "SHORT_BREAK", True)
+    assert event["due"] == 5 * 60 + 1
+    assert service.handle({"op": "state", "session": "alice"}, client)["running"] is True
+
+
+def test_session_waits_without_auto_continue(service, client, fake_clock):
+    watcher = Client(FakeWriter())
+    service.handle({"op": "create", "session": "bob", "settings": {"cycles": 1}}, client)
+    service.handle({"op": "subscribe", "session": "*"}, watcher)
+    service.handle({"op": "skip", "session": "bob"}, client)
+    service.handle({"op": "start", "session": "bob"}, client)
+
+    run_for(service, fake_clock, 20 * 60)
+
+    assert [event["status"] for event in watcher.writer.messages] == ["FOCUS"]
+    state = service.handle({"op": "state", "session": "bob"}, client)
+    assert (state["status"], state["running"]) == ("FOCUS", False)
+
+
+def test_pause_and_reset(service, client, fake_clock):
+    service.handle({"op": "create", "session": "carol"}, client)
+    service.handle({"op": "start", "session": "carol"}, client)
+    fake_clock.advance(60)
+    state = service.handle({"op": "pause", "session": "carol"}, client)
+    assert (state["time_left"], state["running"]) == (24 * 60, False)
+    assert len(service.timers.wheel) == 0
+
+    state = service.handle({"op": "reset", "session": "carol"}, client)
+    assert state["time_left"] == 25 * 60
+
+
+@pytest.mark.parametrize(
+    "request_, error",
+    [
+        ([], "request must be a JSON object"),
+        ({"op": "fly"}, "unknown op: 'fly'"),
+        ({"op": "start", "session": "nobody"}, "unknown session: 'nobody'"),
+        ({"op": "create", "session": "*"}, "session must be a non-empty name"),
+        ({"op": "unsubscribe", "session": ["alice"]}, r"unknown session: \['alice'\]"),
+    ],
+)
+def test_bad_requests(service, client, request_, error):
+    with pytest.raises(ValueError, match=error):
+        service.handle(request_, client)
+
+
+def test_close_session(service, client):
+    service.handle({"op": "create", "session": "dave"}, client)
+    service.handle({"op": "subscribe", "session": "dave"}, client)
+    service.handle({"op": "start", "session": "dave"}, client)
+
+    assert service.handle({"op": "close", "session": "dave"}, client) == {"closed": "dave"}
+    assert service.handle({"op": "list"}, client) == {"sessions": []}
+    assert client.subscriptions == set()
+    assert len(service.timers.wheel) == 0
+
+
+def test_notifications_over_socket(tmp_path):
+    path = str(tmp_path / "service.sock")
+
+    async def scenario() -> list:
+        service = PomodoroService(tick=0.0005)
+        started = asyncio.Event()
+        server = asyncio.create_task(service.serve(path, started=started.set))
+        await started.wait()
+        reader, writer = await asyncio.open_unix_connection(path)
+        for n, op in enumerate(["create", "subscribe", "start"]):
+            request = {"id": n, "op": op, "session": "eve", "settings": {"focus": 5}}
+            writer.write(json.dumps(request).encode() + b"\n")
+        messages = [json.loads(await reader.readline()) for _ in range(4)]
+        writer.close()
+        server.cancel()
+        return messages
+
+    messages = asyncio.run(scenario())
+
+    assert [message.get("id") for message in messages[:3]] == [0, 1, 2]
+    assert all(message["ok"] for message in messages[:3])
+    assert messages[3]["event"] == "transition"
+    assert time.monotonic() >= messages[3]["due"]
+
+
+def test_unexpected_errors_answered_over_socket(tmp_path):
+    path = str(tmp_path / "service.sock")
+
+    def crash(request, client):
+        raise TypeError("crashed")
+
+    async def scenario() -> list:
+        service = PomodoroService()
+        service.commands["crash"] = crash
+        started = asyncio.Event()
+        server = asyncio.create_task(service.serve(path, started=started.set))
+        await started.wait()
+        reader, writer = await asyncio.open_unix_connection(path)
+        for n, op in enumerate(["crash", "list"]):
+            writer.write(json.dumps({"id": n, "op": op}).encode() + b"\n")
+        messages = [json.loads(await reader.readline()) for _ in range(2)]
+        writer.close()
+        server.cancel()
+        return messages
+
+    assert asyncio.run(scenario()) == [
+        {"ok": False, "error": "TypeError: crashed", "id": 0},
+        {"ok": True, "sessions": [], "id": 1},
+    ]
+
+
+def test_service_does_not_import_tk():
+    script = "import sys, python_pomodoro.service; print('tkinter' in sys.modules)"
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "False"
@@ -1,6 +1,9 @@
+from tkinter import ttk
+
 import pytest
-from python_pomodoro.settings import SettingSlider
-from python_pomodoro.tomato_timer import DEFAULT_CYCLES, SessionStatus
+from python_pomodoro.config import SETTINGS_FILE, SettingsStore, TimerSettings
+from python_pomodoro.settings import Settings, SettingSlider
+from python_pomodoro.tomato_timer import DEFAULT_CYCLES, SessionStatus, TomatoTimer
 
 
 def test_settings_initialization(settings):
@@ -38,7 +41,7 @@ def test_update_settings_sessions(settings, slider, value, expected):
 
     settings.update_settings()
 
-    assert slider_value == expected.value.time.minutes
+    assert slider_value == settings.timer.get_session_minutes(expected)
 
 
 def test_update_settings_cycles(settings):
@@ -69,7 +72,7 @@ def test_close_settings(settings, test_functions):
 
     # Assert that sliders have reverted to previous values
     for slider, session in zip(timer_sliders, list(SessionStatus)):
-        assert settings.__getattribute__(slider).get_slider_value() == session.value.time.minutes
+        assert settings.__getattribute__(slider).get_slider_value() == settings.timer.get_session_minutes(session)
     assert settings.setting_cycles.get_slider_value() == settings.timer.get_cycles()
 
     # Assert that the setting button is shown
@@ -104,3 +107,46 @@ def test_update_label(settings):
 
     # Assert label updated:
     assert slider.slider_name_label._text == "Focus time:  17"
+
+
+def test_update_settings_saved(settings, tmp_path):
+    settings.store = SettingsStore(tmp_path / SETTINGS_FILE)
+    settings.setting_focus_time.set_slider_value(45)
+    settings.setting_cycles.set_slider_value(3)
+
+    settings.update_settings()
+
+    saved = settings.store.load()
+    assert saved.focus == 45
+    assert saved.cycles == 3
+    assert saved.short_break == settings.timer.get_session_minutes(SessionStatus.SHORT_BREAK)
+
+
+def test_timer_starts_with_saved_settings(root_window):
+    timer = TomatoTimer(
+        parent=root_window, main_window=root_window, settings=TimerSettings(focus=50, cycles=2, auto_continue=20)
+    )
+    settings_button = ttk.Button(root_window)
+    settings = Settings(parent=root_window, main_window=root_window, timer=timer, controller=settings_button)
+
+    assert timer.minutes.get() == "50"
+    assert timer.cycles == 2
+    assert timer.auto_continue == 20
+    # sliders open at the current settings
+    assert settings.setting_focus_time.get_slider_value() == 50
+    assert settings.setting_cycles.get_slider_value() == 2
+    assert settings.setting_auto_continue.get_slider_value() == 20
+
+
+def test_update_settings_auto_continue(settings, tmp_path):
+    settings.store = SettingsStore(tmp_path / SETTINGS_FILE)
+    settings.setting_auto_continue.set_slider_value(10)
+    settings.update_settings()
+
+    assert settings.timer.auto_continue == 10
+    assert settings.store.load().auto_continue == 10
+
+    # 0 waits for the banner to be answered
+    settings.setting_auto_continue.set_slider_value(0)
+    settings.update_settings()
+    assert settings.timer.auto_continue is None
@@ -0,0 +1,26 @@
+import pytest
+from benchmarks.bench_startup import (
+    DEFERRED_MODULES,
+    FIRST_IDLE_BUDGET_MS,
+    IMPORT_BUDGET_MS,
+    bench_first_idle,
+    import_times,
+)
+
+
+@pytest.fixture(scope="module")
+def app_import_times():
+    return import_times()
+
+
+@pytest.mark.parametrize("module", DEFERRED_MODULES)
+def test_import_defers_module(app_import_times, module):
+    assert module not in app_import_times
+
+
+def test_import_time_budget(app_import_times):
+    assert app_import_times["python_pomodoro.app"] < IMPORT_BUDGET_MS
+
+
+def test_first_idle_budget():
+    assert bench_first_idle()["first_idle_ms"] < FIRST_IDLE_BUDGET_MS
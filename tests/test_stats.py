@@ -0,0 +1,95 @@
+import numpy as np
+import pytest
+from python_pomodoro.engine import Outcome, SessionRecord, SessionStatus
+from python_pomodoro.history import HISTORY_FILE, SessionHistory
+from python_pomodoro.stats import SessionStats
+
+DAY = 86400
+MONDAY = 19_723  # 2024-01-01
+FOCUS, SHORT_BREAK = SessionStatus.FOCUS, SessionStatus.SHORT_BREAK
+COMPLETED, ABORTED = Outcome.COMPLETED, Outcome.ABORTED
+
+
+def focus(day, actual=1500, outcome=COMPLETED, cycle=1, hour=9):
+    return SessionRecord(day * DAY + hour * 3600, 1500, actual, outcome, FOCUS, cycle)
+
+
+@pytest.fixture
+def stats():
+    stats = SessionStats(utc_offset=0)
+    for record in [
+        focus(MONDAY, cycle=1),
+        focus(MONDAY, cycle=2, hour=10),
+        SessionRecord(MONDAY * DAY + 3600, 300, 300, COMPLETED, SHORT_BREAK, 1),
+        focus(MONDAY + 1, actual=420, outcome=ABORTED, cycle=1),
+        focus(MONDAY + 2, cycle=1),
+        focus(MONDAY + 3, cycle=2),
+        focus(MONDAY + 7, actual=60, outcome=ABORTED, cycle=3),
+        focus(MONDAY + 8, cycle=1),
+    ]:
+        stats.append(record)
+    return stats
+
+
+def test_focus_minutes_per_day(stats):
+    days, minutes = stats.focus_minutes_per_day()
+
+    assert days.tolist() == [MONDAY, MONDAY + 1, MONDAY + 2, MONDAY + 3, MONDAY + 7, MONDAY + 8]
+    assert minutes.tolist() == [50, 7, 25, 25, 1, 25]
+
+
+def test_focus_minutes_per_week(stats):
+    weeks, minutes = stats.focus_minutes_per_week()
+
+    assert weeks.tolist() == [MONDAY, MONDAY + 7]
+    assert minutes.tolist() == [107, 26]
+
+
+def test_local_days(stats):
+    stats.utc_offset = -10 * 3600  # 9am UTC is still the previous day
+
+    days, _ = stats.focus_minutes_per_day()
+    assert days[0] == MONDAY - 1
+
+
+def test_completion_rate_by_cycle(stats):
+    rates = stats.completion_rate_by_cycle()
+
+    assert np.isnan(rates[0])
+    assert rates[1:].tolist() == [0.75, 1.0, 0.0]
+
+
+def test_streaks(stats):
+    # completed focus on days 0, 2, 3 and 8
+    assert stats.streaks(today=MONDAY + 8) == (1, 2)
+    assert stats.streaks(today=MONDAY + 9) == (1, 2)
+    assert stats.streaks(today=MONDAY + 10) == (0, 2)
+
+
+def test_interruption_histogram(stats):
+    edges, counts = stats.interruption_histogram(bin_minutes=5)
+
+    assert edges.tolist() == [0, 5, 10, 15, 20, 25]
+    assert counts.tolist() == [1, 1, 0, 0, 0]
+
+
+def test_empty_stats():
+    stats = SessionStats(utc_offset=0)
+
+    assert len(stats.focus_minutes_per_day()[0]) == 0
+    assert len(stats.focus_minutes_per_week()[0]) == 0
+    assert stats.streaks(today=MONDAY) == (0, 0)
+    assert stats.interruption_histogram()[1].sum() == 0
+
+
+def test_from_history_and_incremental_append(tmp_path):
+    history = SessionHistory(tmp_path / HISTORY_FILE)
+    for day in range(3000):
+        history.append(focus(MONDAY + day))
+
+    stats = SessionStats.from_history(history, utc_offset=0)
+    assert len(stats) == 3000
+
+    stats.append(focus(MONDAY + 3000, cycle=4))
+    assert len(stats) == 3001
+    assert stats.streaks(today=MONDAY + 3000) == (3001, 3001)
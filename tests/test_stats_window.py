@@ -0,0 +1,24 @@
+from python_pomodoro.engine import Outcome, SessionRecord, SessionStatus
+from python_pomodoro.stats import SessionStats
+from python_pomodoro.stats_window import interruptions_text, last_days_chart, summary_text
+
+DAY = 86400
+MONDAY = 19_723  # 2024-01-01
+
+
+def test_stats_text():
+    stats = SessionStats(utc_offset=0)
+    stats.append(SessionRecord(MONDAY * DAY, 1500, 1500, Outcome.COMPLETED, SessionStatus.FOCUS, 1))
+    stats.append(SessionRecord((MONDAY + 1) * DAY, 1500, 600, Outcome.ABORTED, SessionStatus.FOCUS, 2))
+
+    summary = summary_text(stats, today=MONDAY + 1)
+    assert "Focus today: 10 min" in summary
+    assert "Focus this week: 35 min" in summary
+    assert "Streak: 1 days (longest 1)" in summary
+    assert "1: 100%  2: 0%" in summary
+
+    chart = last_days_chart(stats, today=MONDAY + 1).splitlines()
+    assert len(chart) == 7
+    assert chart[-2].startswith("Mon 01 Jan") and chart[-2].endswith("25 min")
+
+    assert interruptions_text(stats) == "10-15 min: 1"
@@ -0,0 +1,39 @@
+import json
+
+import pytest
+from python_pomodoro.task_import import read_task_titles
+
+
+@pytest.mark.parametrize(
+    "file_name, content",
+    [
+        ("tasks.txt", "First task\n\n  Second task  \nThird task\n"),
+        ("tasks.csv", "id,Title\n1,First task\n2,Second task\n3,Third task\n"),
+        ("tasks.csv", "First task\nSecond task\n\nThird task\n"),
+        ("tasks.json", json.dumps(["First task", {"title": "Second task"}, "Third task"])),
+        ("tasks.jsonl", '"First task"\n{"title": "Second task"}\n\n"Third task"\n'),
+    ],
+)
+def test_read_task_titles(tmp_path, file_name, content):
+    path = tmp_path / file_name
+    path.write_text(content, encoding="utf-8")
+
+    assert list(read_task_titles(path)) == ["First task", "Second task", "Third task"]
+
+
+def test_read_task_titles_is_lazy(tmp_path):
+    path = tmp_path / "tasks.txt"
+    path.write_text("".join(f"Task {i}\n" for i in range(1000)), encoding="utf-8")
+
+    titles = read_task_titles(path)
+    assert next(titles) == "Task 0"
+    titles.close()
+
+
+@pytest.mark.parametrize("content", [[{"title": 12}], {"First task": 1}, "First task", 12])
+def test_read_task_titles_invalid_json(tmp_path, content):
+    path = tmp_path / "tasks.json"
+    path.write_text(json.dumps(content), encoding="utf-8")
+
+    with pytest.raises(ValueError):
+        list(read_task_titles(path))
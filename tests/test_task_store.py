@@ -0,0 +1,63 @@
+from time import perf_counter
+from uuid import uuid4
+
+import pytest
+from python_pomodoro.task_store import TASKS_DB_FILE, TaskStore
+
+STARTUP_BUDGET_SECONDS = 1.0  # loading 50k stored tasks
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = TaskStore(tmp_path / TASKS_DB_FILE)
+    yield store
+    store.close()
+
+
+def test_store_uses_wal(store):
+    assert store.connection.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+
+def test_default_path_in_data_dir(data_dir):
+    store = TaskStore()
+    assert store.path == data_dir / TASKS_DB_FILE
+    store.close()
+
+
+def test_add_toggle_remove_and_reload(store, tmp_path):
+    ids = [uuid4() for _ in range(3)]
+    for i, id in enumerate(ids):
+        store.add(id, f"Task {i}")
+    store.set_complete(ids[1], True)
+    store.remove([ids[0]])
+    store.commit()
+
+    reopened = TaskStore(tmp_path / TASKS_DB_FILE)
+    assert list(reopened.load()) == [(ids[1], "Task 1", True), (ids[2], "Task 2", False)]
+    reopened.close()
+
+
+def test_uncommitted_changes_are_not_saved(store, tmp_path):
+    store.add(uuid4(), "Committed task")
+    store.commit()
+    store.add(uuid4(), "Uncommitted task")
+
+    # a second connection only sees committed writes, like a restart after a crash
+    reopened = TaskStore(tmp_path / TASKS_DB_FILE)
+    assert [title for _, title, _ in reopened.load()] == ["Committed task"]
+    reopened.close()
+
+
+def test_load_50k_tasks_within_budget(store, tmp_path):
+    for i in range(50_000):
+        store.add(uuid4(), f"Task {i}")
+    store.commit()
+
+    start = perf_counter()
+    reopened = TaskStore(tmp_path / TASKS_DB_FILE)
+    tasks = list(reopened.load())
+    seconds = perf_counter() - start
+    reopened.close()
+
+    assert len(tasks) == 50_000
+    assert seconds < STARTUP_BUDGET_SECONDS
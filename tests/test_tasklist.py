@@ -4,7 +4,15 @@ from uuid import uuid4
 
 import customtkinter as ctk
 import pytest
-from python_pomodoro.tasklist import Task
+from python_pomodoro.task_store import TaskStore
+from python_pomodoro.tasklist import (
+    VISIBLE_TASKS,
+    Task,
+    TaskList,
+    TaskSearchIndex,
+    TaskTitleIndex,
+    validate_task_title,
+)
 
 
 def test_settings_initialization(tasks):
@@ -140,7 +148,8 @@ def test_show_hide_clear_task_button(tasks, test_functions):
     # Assert that the save and entry input is shown
     assert bool(tasks.button_clear_task.pack_info()) is True
 
-    tasks.tasks_by_id.clear()
+    for id in list(tasks.tasks_by_id):
+        tasks.remove_task(id)
 
     tasks.show_hide_clear_task_button()
     # Assert that the clear task button is hidden
@@ -172,9 +181,8 @@ def test_toggle_task_complete(tasks):
     # Add a new task to the dict tasks_by_id
     id = uuid4()
     title = "Some task title"
-    tasks.tasks_by_id[id] = task = Task(
-        id=id, title=title, is_complete=False, checkbox=ctk.CTkCheckBox(tasks, text=title)
-    )
+    task = Task(id=id, title=title, is_complete=False, checkbox=ctk.CTkCheckBox(tasks, text=title))
+    tasks.add_task(task)
 
     assert len(tasks.tasks_by_id) == 2
 
@@ -223,7 +231,8 @@ def test_clear_completed_no_tasks_completed(tasks, test_functions):
 
 
 def test_clear_tasks_when_empty(tasks, test_functions):
-    tasks.tasks_by_id.clear()  # Simulate an empty task list
+    for id in list(tasks.tasks_by_id):  # Simulate an empty task list
+        tasks.remove_task(id)
 
     tasks.show_hide_clear_task_button()
     assert test_functions.test_object_is_hidden(tasks.button_clear_task)  # Clear button should be hidden
@@ -239,8 +248,8 @@ def test_clear_completed_with_mixed_statuses(tasks):
     incomplete_task = Task(
         id=uuid4(), title="Incomplete Task", is_complete=False, checkbox=Checkbutton(tasks, text="Incomplete Task")
     )
-    tasks.tasks_by_id[complete_task.id] = complete_task
-    tasks.tasks_by_id[incomplete_task.id] = incomplete_task
+    tasks.add_task(complete_task)
+    tasks.add_task(incomplete_task)
 
     tasks.clear_completed_tasks()
 
@@ -248,3 +257,274 @@ def test_clear_completed_with_mixed_statuses(tasks):
     assert len(tasks.tasks_by_id) == 2
     assert incomplete_task.id in tasks.tasks_by_id
     assert complete_task.id not in tasks.tasks_by_id
+
+
+def add_tasks(tasks, count, is_complete=lambda i: False):
+    for i in range(count):
+        tasks.add_task(Task(id=uuid4(), title=f"Task {i}", is_complete=is_complete(i)))
+
+
+def test_render_tasks_only_creates_visible_rows(tasks):
+    add_tasks(tasks, 500)
+
+    tasks.render_tasks()
+
+    assert len(tasks.rows) == VISIBLE_TASKS
+    assert sum(task.checkbox is not None for task in tasks.tasks_by_id.values()) == VISIBLE_TASKS
+    assert bool(tasks.task_scrollbar.pack_info()) is True
+
+
+def test_scroll_tasks_recycles_rows(tasks):
+    add_tasks(tasks, 100)
+    tasks.render_tasks()
+    checkboxes = [row.checkbox for row in tasks.rows]
+
+    tasks.scroll_tasks("scroll", 10, "units")
+
+    # The same widgets now show tasks further down the list
+    assert [row.checkbox for row in tasks.rows] == checkboxes
+    assert tasks.first_visible == 10
+    assert tasks.rows[0].checkbox._text == "Task 9"  # the fixture task is first
+    assert tasks.tasks_by_id[tasks.task_order[0]].checkbox is None
+
+    tasks.scroll_tasks("moveto", 1.0)
+    assert tasks.first_visible == len(tasks.tasks_by_id) - VISIBLE_TASKS
+
+    tasks.scroll_tasks("scroll", -1, "pages")
+    assert tasks.first_visible == len(tasks.tasks_by_id) - 2 * VISIBLE_TASKS
+
+
+def test_save_new_task_scrolls_to_new_task(tasks):
+    add_tasks(tasks, 50)
+    tasks.render_tasks()
+
+    tasks.entry_task_input.insert(0, "Newest task")
+    task_id = tasks.save_new_task()
+
+    assert tasks.rows[-1].task is tasks.tasks_by_id[task_id]
+    assert len(tasks.rows) == VISIBLE_TASKS
+
+
+def test_clear_completed_tasks_out_of_view(tasks):
+    add_tasks(tasks, 50, is_complete=lambda i: i % 2 == 0)
+    tasks.render_tasks()
+
+    tasks.clear_completed_tasks()
+
+    assert len(tasks.tasks_by_id) == 26
+    assert not any(task.is_complete for task in tasks.tasks_by_id.values())
+    assert tasks.task_order == list(tasks.tasks_by_id)
+    assert all(row.task.id in tasks.tasks_by_id for row in tasks.rows)
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("Some new task", None),
+        ("! !", None),
+        ("@abc", None),
+        ("", "Please enter a task..."),
+        ("A" * 100, "Task too long (max 100 chars.)"),
+        ("!!!!", "Please enter a valid task name."),
+        (" \t \n ", "Please enter a valid task name."),
+    ],
+)
+def test_validate_task_title(text, expected):
+    assert validate_task_title(text) == expected
+
+
+def test_task_title_index():
+    index = TaskTitleIndex()
+    task = Task(id=uuid4(), title="Straße")
+    index.add(task)
+
+    assert "STRASSE" in index
+    assert "strasse " not in index
+
+    # removing a different task with the same title keeps the entry
+    index.remove(Task(id=uuid4(), title="strasse"))
+    assert "Straße" in index
+
+    index.remove(task)
+    assert len(index) == 0
+
+    index.rebuild({task.id: task})
+    assert "straße" in index
+
+
+def test_task_search_index():
+    index = TaskSearchIndex()
+    titles = ["Write report", "Review report", "Email Bob", "Reports due", "Straße cleanup"]
+    tasks = [Task(id=uuid4(), title=title) for title in titles]
+    for task in tasks:
+        index.add(task)
+    ids = {task.title: task.id for task in tasks}
+
+    # titles starting with the text first, each in the order added
+    assert index.search("REPORT") == [ids["Reports due"], ids["Write report"], ids["Review report"]]
+    assert index.search("re") == [ids["Review report"], ids["Reports due"], ids["Write report"]]
+    assert index.search("e") == [ids["Email Bob"], ids["Write report"], ids["Review report"], ids["Reports due"],
+                                 ids["Straße cleanup"]]  # fmt: skip
+    assert index.search("strasse") == [ids["Straße cleanup"]]
+    assert index.search("report due") == []
+    assert index.search("xyz") == []
+    assert index.search("") == [task.id for task in tasks]
+
+    index.remove(tasks[0])
+    assert index.search("report") == [ids["Reports due"], ids["Review report"]]
+    # texts of up to 3 characters are looked up directly, the removed task is left out of those too
+    assert index.search("wr") == []
+    assert index.search("r") == [ids["Review report"], ids["Reports due"], ids["Straße cleanup"]]
+    assert len(index) == 4
+
+
+def test_task_search_index_compacts_removed_tasks():
+    index = TaskSearchIndex()
+    tasks = [Task(id=uuid4(), title=f"Task {i}") for i in range(1000)]
+    for task in tasks:
+        index.add(task)
+    for task in tasks[:900]:
+        index.remove(task)
+
+    assert len(index.ids) < 300
+    assert index.search("task 99") == [tasks[990 + i].id for i in range(10)]
+    assert index.search("task 9") == [task.id for task in tasks[900:]]
+
+
+def test_filter_tasks_rebinds_existing_rows(tasks):
+    add_tasks(tasks, 100)
+    tasks.render_tasks()
+    checkboxes = [row.checkbox for row in tasks.rows]
+
+    tasks.filter_tasks("task 1")
+    # Task 1, then Task 10 to Task 19, of which the rows show the first VISIBLE_TASKS
+    assert len(tasks.filtered_order) == 11
+    assert [row.checkbox for row in tasks.rows] == checkboxes
+    assert [row.task.title for row in tasks.rows[: tasks.rows_shown]] == ["Task 1"] + [
+        f"Task {i}" for i in range(10, 10 + VISIBLE_TASKS - 1)
+    ]
+
+    tasks.filter_tasks("task 42")
+    assert tasks.rows_shown == 1
+    assert tasks.rows[0].task.title == "Task 42"
+    assert [row.checkbox for row in tasks.rows] == checkboxes
+
+    tasks.clear_filter()
+    assert tasks.filtered_order is None
+    assert tasks.rows_shown == VISIBLE_TASKS
+
+
+def test_filter_follows_added_and_cleared_tasks(tasks):
+    add_tasks(tasks, 20, is_complete=lambda i: i % 2 == 0)
+    tasks.filter_tasks("task 1")
+    assert len(tasks.visible_order()) == 11
+
+    tasks.entry_task_input.insert(0, "Task 100")
+    task_id = tasks.save_new_task()
+    assert tasks.visible_order()[-1] == task_id
+
+    tasks.clear_completed_tasks()
+    assert [tasks.tasks_by_id[id].title for id in tasks.visible_order()] == [
+        "Task 1", "Task 11", "Task 13", "Task 15", "Task 17", "Task 19", "Task 100"
+    ]  # fmt: skip
+
+
+def test_filter_box_filters_as_you_type(tasks):
+    add_tasks(tasks, 30)
+    tasks.render_tasks()
+
+    assert tasks.entry_filter._entry.bind("<KeyRelease>")
+    tasks.entry_filter.insert(0, "task 2")
+    tasks.on_filter_key()
+    assert tasks.filter_text == "task 2"
+    assert tasks.rows[0].task.title == "Task 2"
+
+
+def test_loaded_tasks_indexed_in_chunks(root_window, tmp_path):
+    store = TaskStore(tmp_path / "tasks.db")
+    for i in range(2000):
+        store.add(uuid4(), f"Task {i}")
+    store.commit()
+    tasks = TaskList(parent=root_window, main_window=root_window)
+    tasks.store = store
+    tasks.load_tasks()
+    tasks.entry_task_input.insert(0, "Task 2000")
+    added = tasks.save_new_task()
+    tasks.remove_task(tasks.task_order[1999])
+
+    # the titles are scanned until the index is built
+    assert tasks.unindexed
+    tasks.filter_tasks("task 20")
+    scanned = tasks.visible_order()
+    expected = ["Task 20"] + [f"Task {i}" for i in range(200, 210)] + ["Task 2000"]
+    assert [tasks.tasks_by_id[id].title for id in scanned] == expected
+
+    while tasks.unindexed:
+        root_window.update()
+    assert len(tasks.search_index) == 2000
+    assert tasks.search_index.search("task 20") == scanned
+    assert tasks.search_index.search("task 1999") == []
+    assert tasks.search_index.search("task 2000") == [added]
+
+
+def test_remove_task_updates_order_and_indexes(tasks):
+    assert tasks.is_duplicate_title("SOME TASK") is True
+    assert tasks.is_duplicate_title("Some other task") is False
+
+    add_tasks(tasks, 3)
+    removed = tasks.remove_task(tasks.task_order[1])
+    assert removed.title == "Task 0"
+    assert [tasks.tasks_by_id[id].title for id in tasks.task_order] == ["Some task", "Task 1", "Task 2"]
+    assert tasks.is_duplicate_title("task 0") is False
+    assert tasks.search_index.search("task") == tasks.task_order
+
+
+def test_import_tasks(tasks, tmp_path):
+    path = tmp_path / "tasks.txt"
+    lines = [f"Imported task {i}" for i in range(2000)] + ["Some task", "!!!", "Imported task 1"]
+    path.write_text("\n".join(lines), encoding="utf-8")
+
+    reports = []
+    tasks.import_tasks(path, on_done=reports.append)
+    while not reports:
+        tasks.main_window.update()
+
+    report = reports[0]
+    assert report.error is None
+    assert report.imported == 2000
+    assert report.skipped == 3  # duplicate of the fixture task, invalid name and repeated line
+    assert len(tasks.tasks_by_id) == 2001
+    assert len(tasks.rows) == VISIBLE_TASKS
+    assert tasks.label_task_input._text == "Imported 2000 tasks (3 skipped)."
+
+
+def test_import_tasks_missing_file(tasks, tmp_path):
+    reports = []
+    tasks.import_tasks(tmp_path / "missing.txt", on_done=reports.append)
+    while not reports:
+        tasks.main_window.update()
+
+    assert reports[0].error is not None
+    assert tasks.label_task_input._text == "Could not import tasks from file."
+    assert len(tasks.tasks_by_id) == 1
+
+
+def test_tasks_are_saved_and_reloaded(root_window, tmp_path):
+    store = TaskStore(tmp_path / "tasks.db")
+    tasks = TaskList(parent=root_window, main_window=root_window, store=store)
+    for text in ("First task", "Second task", "Third task"):
+        tasks.entry_task_input.insert(0, text)
+        tasks.save_new_task()
+
+    first, second, third = tasks.tasks_by_id.values()
+    is_complete = IntVar(value=1)
+    tasks.toggle_task_complete(first, is_complete)
+    tasks.toggle_task_complete(second, is_complete)
+    tasks.clear_completed_tasks()
+    tasks.toggle_task_complete(third, is_complete)
+
+    reloaded = TaskList(parent=root_window, main_window=root_window, store=TaskStore(tmp_path / "tasks.db"))
+    root_window.update()
+
+    assert [(task.title, task.is_complete) for task in reloaded.tasks_by_id.values()] == [("Third task", True)]
+    assert reloaded.is_duplicate_title("third task")
@@ -0,0 +1,106 @@
+import pytest
+from python_pomodoro.engine import Outcome, PomodoroEngine, SessionStatus
+from python_pomodoro.timing_wheel import SessionTimers, TimingWheel
+
+
+@pytest.fixture
+def wheel(fake_clock):
+    return TimingWheel(resolution=1.0, slots=4, levels=3, clock=fake_clock)
+
+
+def run_until(wheel, clock, end: float) -> None:
+    # advance one tick at a time, as a server loop would
+    while clock.now < end:
+        clock.advance(1.0)
+        wheel.advance()
+
+
+def test_fires_on_deadline_not_before(wheel, fake_clock):
+    fired = []
+    wheel.schedule("a", 2.5, lambda: fired.append(fake_clock.now))
+
+    run_until(wheel, fake_clock, 10)
+
+    assert fired == [3.0]
+    assert len(wheel) == 0
+
+
+@pytest.mark.parametrize("at", [5, 16, 17, 63, 64, 200])
+def test_cascades_far_deadlines(wheel, fake_clock, at):
+    # 4 slots and 3 levels reach 64 ticks, later deadlines are parked and placed again
+    fired = []
+    fake_clock.now = 1.0
+    wheel.advance()
+    wheel.schedule("a", at, lambda: fired.append(fake_clock.now))
+
+    run_until(wheel, fake_clock, 300)
+
+    assert fired == [at]
+
+
+@pytest.mark.parametrize("slots, levels", [(3, 2), (1, 2), (4, 1)])
+def test_invalid_wheel(fake_clock, slots, levels):
+    with pytest.raises(ValueError):
+        TimingWheel(slots=slots, levels=levels, clock=fake_clock)
+
+
+def test_cancel_and_replace(wheel, fake_clock):
+    fired = []
+    wheel.schedule("a", 3, lambda: fired.append("a"))
+    wheel.schedule("b", 3, lambda: fired.append("b"))
+    wheel.schedule("b", 5, lambda: fired.append("b later"))
+    assert wheel.cancel("a") is True
+    assert wheel.cancel("a") is False
+
+    run_until(wheel, fake_clock, 10)
+
+    assert fired == ["b later"]
+
+
+def test_past_deadline_fires_on_next_advance(wheel, fake_clock):
+    fired = []
+    fake_clock.now = 5.0
+    wheel.advance()
+    wheel.schedule("a", 2.0, lambda: fired.append(fake_clock.now))
+    wheel.advance()
+
+    assert fired == [5.0]
+
+
+def test_next_expiry(wheel, fake_clock):
+    assert wheel.next_expiry() is None
+    wheel.schedule("a", 2.0, lambda: None)
+    assert wheel.next_expiry() == 2.0
+    wheel.cancel("a")
+    wheel.schedule("b", 30.0, lambda: None)
+    # the level holding the deadline is cascaded first
+    assert wheel.next_expiry() == 16.0
+
+
+def test_session_ends_when_deadline_fires(wheel, fake_clock):
+    records = []
+    ended = []
+    engine = PomodoroEngine(clock=fake_clock, durations={status: 60 for status in SessionStatus})
+    engine.on_session_end.append(records.append)
+    timers = SessionTimers(wheel)
+
+    timers.start(engine, on_end=ended.append)
+    assert timers.is_running(engine)
+    run_until(wheel, fake_clock, 100)
+
+    assert ended == [engine]
+    assert records[0].outcome == Outcome.COMPLETED
+    assert engine.current_time == -1
+
+
+def test_paused_session_never_fires(wheel, fake_clock):
+    engine = PomodoroEngine(clock=fake_clock, durations={status: 60 for status in SessionStatus})
+    timers = SessionTimers(wheel)
+
+    timers.start(engine)
+    fake_clock.advance(20)
+    timers.pause(engine)
+    run_until(wheel, fake_clock, 100)
+
+    assert not timers.is_running(engine)
+    assert engine.current_time == 40
@@ -1,10 +1,12 @@
+import random
+import time
 from unittest.mock import patch
 
 import customtkinter as ctk
 import pytest
-from python_pomodoro.tomato_timer import SessionStatus
-
-TEST_MODE = True
+from python_pomodoro.audio import SHORT_ALERT
+from python_pomodoro.scheduler import TickScheduler, VirtualLoop
+from python_pomodoro.tomato_timer import SessionStatus, TomatoTimer, timer_text_style
 
 
 def test_tomato_timer_initialization(tomato_timer):
@@ -77,8 +79,7 @@ def test_timer_ends_countdown(tomato_timer):
         patch.object(tomato_timer, "start_next_session") as mock_start_next_session
     ):
         # Set timer to -1 seconds
-        tomato_timer.status.value.set_time(0)
-        tomato_timer.status.value.time.seconds = -1
+        tomato_timer.engine.set_duration(tomato_timer.status, -1)
         tomato_timer.set_session_time()
 
         ct = tomato_timer.current_time
@@ -89,6 +90,51 @@ def test_timer_ends_countdown(tomato_timer):
         assert tomato_timer.is_paused is True
 
 
+class StallingEventLoop(VirtualLoop):
+    """Virtual event loop where callbacks run late by random jitter and stalls."""
+
+    def __init__(self, jitter: float, stall: float, stall_every: int) -> None:
+        super().__init__()
+        self.jitter = jitter
+        self.stall = stall
+        self.stall_every = stall_every
+        self.random = random.Random(1234)
+
+    def wakeup_time(self, due: float, n: int) -> float:
+        now = due + self.random.uniform(0, self.jitter)
+        if n % self.stall_every == 0:
+            now += self.stall  # e.g. a modal dialog or GC pause
+        return now
+
+
+@pytest.mark.parametrize("jitter, stall, stall_every", [(0.0, 0.0, 1), (0.3, 0.9, 7), (0.05, 3.5, 50)])
+def test_countdown_does_not_drift_under_stalls(root_window, jitter, stall, stall_every):
+    loop = StallingEventLoop(jitter, stall, stall_every)
+    timer = TomatoTimer(root_window, root_window, scheduler=TickScheduler(loop, clock=loop.clock))
+    ended_at = []
+    with patch.object(timer, "start_next_session", side_effect=lambda: ended_at.append(loop.now)):
+        timer.set_session_minutes(timer.status, 5)
+        timer.set_session_time()
+        timer.start_timer()
+        loop.run()
+
+    # The session ends one tick after the display reads 00:00
+    assert len(ended_at) == 1
+    assert abs(ended_at[0] - (5 * 60 + 1)) < 1.0
+
+
+def test_pause_keeps_remaining_time_from_deadline(virtual_timer, virtual_loop):
+    virtual_timer.set_session_minutes(virtual_timer.status, 1)
+    virtual_timer.set_session_time()
+    virtual_timer.start_timer()
+
+    virtual_loop.now = 20.5  # the event loop was blocked for 20.5 seconds
+    virtual_timer.pause_timer()
+
+    assert virtual_timer.current_time == 40
+    assert not virtual_timer.scheduler.is_scheduled(virtual_timer)
+
+
 def test_pause_timer(tomato_timer):
     with patch.object(tomato_timer, "update_styles") as mock_update_styles:
         tomato_timer.is_paused = False  # restart timer
@@ -182,7 +228,7 @@ def test_update_styles(tomato_timer):
 )
 def test_start_next_session_click_yes(tomato_timer, status, cycle, expected_status, expected_cycle):
     with (
-        patch.object(tomato_timer, "alert_session_ended", return_value=True) as mock_alert_session_ended,
+        patch.object(tomato_timer, "alert_session_ended") as mock_alert_session_ended,
         patch.object(tomato_timer, "start_timer") as mock_start_timer,
     ):
         tomato_timer.set_status(status)
@@ -190,6 +236,11 @@ def test_start_next_session_click_yes(tomato_timer, status, cycle, expected_stat
 
         tomato_timer.start_next_session()
         mock_alert_session_ended.assert_called_once_with(expected_status)
+        # nothing changes until the banner is answered
+        assert tomato_timer.status == status
+        mock_start_timer.assert_not_called()
+
+        tomato_timer.start_next_session(True)
         mock_start_timer.assert_called_once()
 
         assert tomato_timer.status == expected_status
@@ -206,17 +257,16 @@ def test_start_next_session_click_yes(tomato_timer, status, cycle, expected_stat
     ],
 )
 def test_start_next_session_click_no(tomato_timer, status, cycle, expected_status, expected_cycle):
-    with (
-        patch.object(tomato_timer, "alert_session_ended", return_value=False) as mock_alert_session_ended,
-        patch.object(tomato_timer, "start_timer") as mock_start_timer,
-    ):
+    with patch.object(tomato_timer, "start_timer") as mock_start_timer:
         tomato_timer.set_status(status)
         tomato_timer.current_cycle = cycle
 
         tomato_timer.start_next_session()
-        mock_alert_session_ended.assert_called_once_with(expected_status)
-        mock_start_timer.assert_not_called
+        assert tomato_timer.banner.is_shown
+        tomato_timer.banner.respond(False)
+        mock_start_timer.assert_not_called()
 
+        assert tomato_timer.banner.is_shown is False
         assert tomato_timer.status == expected_status
         assert tomato_timer.current_cycle == expected_cycle
 
@@ -242,37 +292,104 @@ def test_start_next_session_click_no(tomato_timer, status, cycle, expected_statu
 )
 def test_alert_session_ended(tomato_timer, status, cycle, next_session, cycle_msg, title, msg_session):
     with (
-        patch("python_pomodoro.tomato_timer.playsound") as mock_playsound,
-        patch("python_pomodoro.tomato_timer.messagebox") as mock_messagebox,
+        patch.object(tomato_timer.alerts, "play") as mock_play,
+        patch.object(tomato_timer.banner, "show") as mock_show,
     ):
         tomato_timer.set_status(status)
         tomato_timer.current_cycle = cycle
 
         message = f"{cycle_msg}Would you like to start the next {msg_session}?"
 
-        mock_messagebox.return_value.get.return_value = "Yes"
-        response = tomato_timer.alert_session_ended(next_session)
+        # returns straight away, the answer is delivered later by callback
+        assert tomato_timer.alert_session_ended(next_session) is None
 
-        mock_playsound.assert_called_once()
+        mock_play.assert_called_once_with(SHORT_ALERT, requested_at=None)
 
-        mock_messagebox.assert_called_once_with(
-            tomato_timer.main_window,
+        mock_show.assert_called_once_with(
             title=title,
             message=message,
-            icon="question",
-            option_1="Yes",
-            option_2="No",
-            justify="center",
+            on_response=tomato_timer.start_next_session,
+            auto_continue=None,
         )
+        assert title in tomato_timer.main_window.title()
+
+
+def test_banner_auto_continue(tomato_timer):
+    with (
+        patch.object(tomato_timer.alerts, "play"),
+        patch.object(tomato_timer, "start_timer") as mock_start_timer,
+    ):
+        tomato_timer.auto_continue = 2
+        tomato_timer.start_next_session()
+        assert tomato_timer.banner.button_yes.cget("text") == "Yes (2)"
+
+        tomato_timer.banner._auto_continue_tick()
+        assert tomato_timer.banner.button_yes.cget("text") == "Yes (1)"
+        mock_start_timer.assert_not_called()
+
+        tomato_timer.banner._auto_continue_tick()
+        mock_start_timer.assert_called_once()
+        assert tomato_timer.banner.is_shown is False
+        assert tomato_timer.status == SessionStatus.SHORT_BREAK
+
 
-        mock_messagebox.return_value.get.assert_called_once()
+def test_reset_dismisses_banner(tomato_timer):
+    with patch.object(tomato_timer.alerts, "play"):
+        tomato_timer.start_next_session()
+        tomato_timer.reset_timer()
 
-        assert response is True
+        assert tomato_timer.banner.is_shown is False
+        assert tomato_timer.status == SessionStatus.FOCUS
+
+
+def test_pause_and_start_after_session_ends(virtual_timer, virtual_loop):
+    # the session is not ended (and recorded) a second time, Start moves on to the next one
+    records = []
+    virtual_timer.engine.on_session_end.append(records.append)
+    with patch.object(virtual_timer.alerts, "play") as mock_play:
+        virtual_timer.start_timer()
+        virtual_loop.run()
+        assert virtual_timer.banner.is_shown
+
+        virtual_timer.pause_timer()
+        assert virtual_timer.banner.is_shown
+        virtual_timer.start_timer()
+        virtual_loop.advance(1)
+
+    assert virtual_timer.banner.is_shown is False
+    assert virtual_timer.status == SessionStatus.SHORT_BREAK
+    assert virtual_timer.engine.deadline is not None
+    assert [record.status for record in records] == [SessionStatus.FOCUS]
+    mock_play.assert_called_once()
+
+
+def test_session_end_does_not_stall_event_loop(tomato_timer):
+    # Heartbeat callbacks keep running through the end of a session and the banner
+    gaps = []
+    last = [None]  # set by the first heartbeat, so the initial draw of the timer is not counted
+
+    def heartbeat():
+        now = time.perf_counter()
+        if last[0] is not None:
+            gaps.append(now - last[0])
+        last[0] = now
+        tomato_timer.after(5, heartbeat)
+
+    with patch.object(tomato_timer.alerts, "play"):
+        tomato_timer.engine.tick = 0.01
+        tomato_timer.engine.set_duration(tomato_timer.status, 5)
+        tomato_timer.set_session_time()
+        tomato_timer.update()
+        tomato_timer.after(5, heartbeat)
+        tomato_timer.start_timer()
 
-        mock_messagebox.return_value.get.return_value = "No"
-        response = tomato_timer.alert_session_ended(next_session)
+        end = time.perf_counter() + 0.5
+        while time.perf_counter() < end:
+            tomato_timer.update()
 
-        assert response is False
+    assert tomato_timer.banner.is_shown
+    assert len(gaps) > 20
+    assert max(gaps) < 0.016
 
 
 @pytest.mark.parametrize(
@@ -313,3 +430,132 @@ def test_change_session_dropdown_clicked(tomato_timer):
 
         tomato_timer.option_menu_session_status.children["!dropdownmenu"].invoke(0)
         mock_selection.assert_called_once()
+
+
+def test_tick_only_pushes_changed_values(tomato_timer):
+    with patch.object(tomato_timer.main_window, "after"), patch.object(tomato_timer.main_window, "after_cancel"):
+        tomato_timer.set_session_minutes(tomato_timer.status, 2)
+        tomato_timer.set_session_time()
+        tomato_timer.start_timer()
+        tomato_timer.update_idletasks()
+        calls = tomato_timer.render.tk_calls
+
+        # 02:00 -> 01:59 changes minutes, seconds and title
+        tomato_timer.engine.deadline -= 1
+        tomato_timer._countdown(119)
+        tomato_timer.update_idletasks()
+        assert tomato_timer.render.tk_calls - calls == 3
+
+        # 01:59 -> 01:58 changes seconds and title only
+        tomato_timer.engine.deadline -= 1
+        tomato_timer._countdown(118)
+        tomato_timer.update_idletasks()
+        assert tomato_timer.render.tk_calls - calls == 5
+        assert tomato_timer.render.calls_per_flush[-1] == 2
+        assert tomato_timer.minutes.get() == "01"
+        assert tomato_timer.seconds.get() == "58"
+
+
+def test_update_styles_unchanged_makes_no_tk_calls(tomato_timer):
+    calls = tomato_timer.render.tk_calls
+    tomato_timer.update_styles(reset=True)
+    tomato_timer.render.flush()
+    assert tomato_timer.render.tk_calls == calls
+
+
+def test_timer_text_styles_precompiled(tomato_timer):
+    for status in SessionStatus:
+        assert tomato_timer.styles.lookup(timer_text_style(status), "background") == status.value.background
+        assert (
+            tomato_timer.styles.lookup(timer_text_style(status, paused=True), "foreground")
+            == status.value.foreground_paused
+        )
+
+
+def test_status_change_swaps_style_name(tomato_timer):
+    assert str(tomato_timer.timer_minutes.cget("style")) == timer_text_style(SessionStatus.FOCUS)
+
+    tomato_timer.change_session_status("Short Break")
+    assert str(tomato_timer.timer_minutes.cget("style")) == timer_text_style(SessionStatus.SHORT_BREAK)
+
+    tomato_timer.pause_timer()
+    assert str(tomato_timer.timer_seconds.cget("style")) == timer_text_style(SessionStatus.SHORT_BREAK, paused=True)
+
+
+def test_hidden_hour_schedules_single_wakeup(virtual_timer, virtual_loop):
+    ended_at = []
+    with patch.object(virtual_timer, "start_next_session", side_effect=lambda: ended_at.append(virtual_loop.now)):
+        virtual_timer.set_session_minutes(virtual_timer.status, 60)
+        virtual_timer.set_session_time()
+        virtual_timer.start_timer()
+        virtual_timer.set_hidden(True)
+        virtual_loop.run()
+
+    # one callback for the first tick and one at the deadline, instead of one per second
+    assert virtual_loop.calls == 2
+    assert ended_at == [60 * 60 + 1]
+
+
+def test_restore_recomputes_display(virtual_timer, virtual_loop):
+    virtual_timer.set_session_minutes(virtual_timer.status, 60)
+    virtual_timer.set_session_time()
+    virtual_timer.start_timer()
+    virtual_timer.set_hidden(True)
+
+    virtual_loop.now = 10 * 60 + 0.5
+    virtual_timer.set_hidden(False)
+
+    assert virtual_timer.minutes.get() == "50"
+    assert virtual_timer.seconds.get() == "00"
+    # back to ticking every second
+    pending = [due for due, _, after_id, *_ in virtual_loop.queue if after_id not in virtual_loop.cancelled]
+    assert pending == [pytest.approx(10 * 60 + 1)]
+
+
+def test_window_unmap_hides_timer(tomato_timer):
+    with patch.object(tomato_timer, "set_hidden") as mock_set_hidden:
+        tomato_timer.main_window.event_generate("<Unmap>")
+        mock_set_hidden.assert_called_once_with(True)
+
+
+def test_timers_share_scheduler_with_own_session_times(tomato_timer):
+    loop = VirtualLoop()
+    other = TomatoTimer(parent=tomato_timer.main_window, main_window=tomato_timer.main_window)
+    ended_at = {}
+    with (
+        patch.object(tomato_timer.main_window, "after", side_effect=loop.after),
+        patch.object(tomato_timer.main_window, "after_cancel", side_effect=loop.after_cancel),
+    ):
+        for timer, minutes in ((tomato_timer, 2), (other, 3)):
+            timer.clock = loop.clock
+            timer.set_session_minutes(SessionStatus.FOCUS, minutes)
+            timer.set_session_time()
+            timer.start_next_session = lambda timer=timer: ended_at.setdefault(timer, loop.now)
+            timer.start_timer()
+        loop.run()
+
+    assert other.scheduler is tomato_timer.scheduler
+    assert ended_at == {tomato_timer: 2 * 60 + 1, other: 3 * 60 + 1}
+    # one wakeup per tick for both timers
+    assert tomato_timer.scheduler.wakeups == 3 * 60 + 1
+    assert tomato_timer.get_session_minutes(SessionStatus.FOCUS) == 2
+
+
+def test_full_pomodoro_runs_on_virtual_clock(virtual_timer, virtual_loop):
+    # every session of the four cycles, each answered Yes, counted down without waiting
+    sessions = []
+    with patch.object(virtual_timer.alerts, "play"):
+        virtual_timer.start_timer()
+        for _ in range(2 * virtual_timer.cycles):
+            virtual_loop.run()
+            assert virtual_timer.banner.is_shown
+            sessions.append((virtual_timer.status, virtual_timer.current_cycle))
+            virtual_timer.banner.respond(True)
+
+    expected = [SessionStatus.FOCUS, SessionStatus.SHORT_BREAK] * 3 + [SessionStatus.FOCUS, SessionStatus.LONG_BREAK]
+    assert sessions == list(zip(expected, [1, 1, 2, 2, 3, 3, 4, 4]))
+    # each session ends one tick after its display reads 00:00
+    assert virtual_loop.now == pytest.approx(sum(virtual_timer.get_session_minutes(s) * 60 + 1 for s in expected))
+    assert virtual_timer.status == SessionStatus.FOCUS
+    assert virtual_timer.current_cycle == 1
+    assert virtual_timer.scheduler.is_scheduled(virtual_timer)
@@ -0,0 +1,126 @@
+from uuid import uuid4
+
+import pytest
+from benchmarks.bench_tui import (
+    FIRST_FRAME_BUDGET_MS,
+    GUI_MODULES,
+    IMPORT_BUDGET_MS,
+    bench_first_frame,
+    bench_import,
+)
+from python_pomodoro.config import TimerSettings
+from python_pomodoro.engine import SessionStatus
+from python_pomodoro.task_store import TaskStore
+from python_pomodoro.tui import TerminalScreen, TerminalTask, TerminalTimer
+
+
+@pytest.fixture
+def timer(fake_clock):
+    return TerminalTimer(TimerSettings(focus=5, short_break=1), clock=fake_clock)
+
+
+@pytest.fixture
+def screen():
+    writes = []
+    screen = TerminalScreen(lambda row, column, text: writes.append((row, column, text)))
+    screen.writes = writes
+    return screen
+
+
+def test_screen_writes_only_changed_cells(screen):
+    screen.draw(["   05:00   running", "Tasks"])
+    screen.writes.clear()
+
+    screen.draw(["   04:59   running", "Tasks"])
+    screen.draw(["   04:58   running"])
+
+    assert screen.writes == [(0, 4, "4:59"), (0, 7, "8"), (1, 0, "     ")]
+
+
+def test_tick_rewrites_only_the_seconds(timer, screen, fake_clock):
+    timer.handle_key(" ")
+    fake_clock.advance(1.0)
+    timer.tick()
+    screen.draw(timer.lines(80))
+    cells = screen.cells_written
+
+    fake_clock.advance(1.0)
+    timer.tick()
+    screen.draw(timer.lines(80))
+
+    assert timer.lines(80)[2].startswith("   04:58")
+    assert screen.cells_written - cells == 1
+
+
+def test_session_rotation(timer, fake_clock):
+    timer.handle_key(" ")
+    assert timer.timeout() == pytest.approx(1.0)
+
+    fake_clock.advance(5 * 60 + 1)
+    timer.tick()
+
+    assert timer.engine.status == SessionStatus.SHORT_BREAK
+    assert timer.running is False
+    assert timer.bell is True
+    assert timer.message == "Focus Time has ended - press space to start Short Break"
+    assert timer.timeout() is None
+
+
+def test_pause_and_reset(timer, fake_clock):
+    timer.handle_key(" ")
+    fake_clock.advance(30.5)
+    timer.handle_key(" ")
+    assert timer.engine.current_time == 4 * 60 + 30
+    assert "paused" in timer.lines(80)[2]
+
+    timer.handle_key("r")
+    assert timer.engine.current_time == 5 * 60
+
+
+def test_tasks_saved_to_store(fake_clock, tmp_path):
+    store = TaskStore(tmp_path / "tasks.db")
+    timer = TerminalTimer(store=store, clock=fake_clock)
+    for key in ["a", *"Write report", "\n", "a", *"write REPORT", "\n"]:
+        timer.handle_key(key)
+    assert timer.message == "Duplicate task name."
+
+    timer.handle_key("1")
+    assert [(title, done) for _, title, done in store.load()] == [("Write report", True)]
+    timer.handle_key("c")
+    assert list(store.load()) == []
+    store.close()
+
+
+def test_only_listed_task_numbers_toggle(timer):
+    timer.tasks = [TerminalTask(uuid4(), f"Task {number}") for number in range(10)]
+    for key in ["0", "9", "²", "٣"]:
+        timer.handle_key(key)
+    assert not any(task.is_complete for task in timer.tasks)
+
+    timer.handle_key("8")
+    assert [task.is_complete for task in timer.tasks] == [False] * 7 + [True, False, False]
+
+
+def test_entry_editing(timer):
+    for key in ["a", "x", "y", "\x7f", "\x1b"]:
+        timer.handle_key(key)
+    assert timer.entry is None
+    assert timer.tasks == []
+
+
+@pytest.fixture(scope="module")
+def tui_import():
+    return bench_import()
+
+
+@pytest.mark.parametrize("module", GUI_MODULES)
+def test_tui_never_imports_gui(tui_import, module):
+    assert tui_import[f"{module}_imported"] == 0.0
+
+
+def test_tui_import_budget(tui_import):
+    assert tui_import["import_ms"] < IMPORT_BUDGET_MS
+
+
+def test_tui_first_frame_budget():
+    assert bench_first_frame()["first_frame_ms"] < FIRST_FRAME_BUDGET_MS